@@ -1,11 +1,14 @@
 from fastapi import FastAPI
+from backend.core.executor import executor_lifespan
 from backend.routes.api import router as organ_router
 
 fastapi_app = FastAPI(
     title="InfoEngine Organ API",
     description="FastAPI backend for organ analysis",
-    version="1.0.0"
+    version="1.0.0",
+    # Stop the organ process pool with the app
+    lifespan=executor_lifespan,
 )
 
 # Mount all organ routes under /organs
-fastapi_app.include_router(organ_router, prefix="/organs")
\ No newline at end of file
+fastapi_app.include_router(organ_router, prefix="/organs")
@@ -1,8 +1,12 @@
 from flask import Flask
 from backend.flask_routes.power_spectrum import power_spectrum_bp
+from backend.organs.physics.eigen import eigen_bp
+from backend.organs.computation.nand import nand_bp
 
 flask_app = Flask(__name__)
 flask_app.register_blueprint(power_spectrum_bp)
+flask_app.register_blueprint(eigen_bp)
+flask_app.register_blueprint(nand_bp)
 
 @flask_app.route("/")
 def home():
@@ -0,0 +1,301 @@
+# backend/benchmarks/loadtest.py
+"""
+End-to-end HTTP load generator for the hybrid app.
+
+Drives `backend.hybrid:app` in-process through httpx's ASGI transport,
+or a running server with --url, using a weighted mix of organ requests
+at one or more concurrency levels. Reports throughput, p50/p95/p99
+latency and error rate overall and per scenario.
+
+    python -m backend.benchmarks.loadtest --mix power_spectrum=4,laplace=1,legacy_power_spectrum=2 \\
+        --size 4096 --concurrency 1 8 32 --duration 10
+
+    python -m backend.benchmarks.loadtest --url http://127.0.0.1:8000 --encoding binary
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+import numpy as np
+
+from backend.benchmarks.organ_bench import cors_rules, damped_signal, noise_signal, privilege_graph
+
+
+# ---------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------
+
+Body = Tuple[bytes, Dict[str, str]]
+
+
+def _json_body(payload) -> Body:
+    return json.dumps(payload).encode(), {"content-type": "application/json"}
+
+
+def _signal_body(signal: np.ndarray, encoding: str, **fields) -> Body:
+    if encoding == "binary":
+        # Payload fields travel as X-Signal-* headers (see routes/signal_io.py)
+        headers = {"content-type": "application/octet-stream", "x-signal-dtype": "float32"}
+        for key, value in fields.items():
+            headers[f"x-signal-{key.replace('_', '-')}"] = str(value)
+        return signal.astype("<f4").tobytes(), headers
+    return _json_body({"signal": signal.tolist(), **fields})
+
+
+@dataclass
+class Scenario:
+    name: str
+    path: str
+    build: Callable[[int, np.random.Generator, str], Body]
+    method: str = "POST"
+
+
+SCENARIOS = {
+    "power_spectrum": Scenario(
+        "power_spectrum", "/api/organs/power_spectrum/analyze",
+        lambda n, rng, enc: _signal_body(noise_signal(n, rng), enc),
+    ),
+    "consciousness": Scenario(
+        "consciousness", "/api/organs/consciousness/analyze",
+        lambda n, rng, enc: _signal_body(noise_signal(n, rng), enc),
+    ),
+    "free_energy": Scenario(
+        "free_energy", "/api/organs/free_energy/analyze",
+        lambda n, rng, enc: _signal_body(noise_signal(n, rng), enc),
+    ),
+    "koopman": Scenario(
+        "koopman", "/api/organs/koopman/analyze",
+        lambda n, rng, enc: _signal_body(noise_signal(n, rng), enc),
+    ),
+    "hash": Scenario(
+        "hash", "/api/organs/hash/analyze",
+        lambda n, rng, enc: _signal_body(noise_signal(n, rng), enc),
+    ),
+    "laplace": Scenario(
+        "laplace", "/api/organs/laplace/analyze",
+        lambda n, rng, enc: _signal_body(damped_signal(n, rng), enc, sample_rate=100.0, method="burg"),
+    ),
+    "batch": Scenario(
+        "batch", "/api/organs/batch",
+        lambda n, rng, enc: _json_body({
+            "signal": noise_signal(n, rng).tolist(),
+            "organs": [{"name": o} for o in ("power_spectrum", "consciousness", "free_energy", "koopman")],
+        }),
+    ),
+    "bloodhound_red": Scenario(
+        "bloodhound_red", "/api/organs/cyber/bloodhound/red",
+        lambda n, rng, enc: _json_body(privilege_graph(max(n // 64, 8), rng)),
+    ),
+    "cors": Scenario(
+        "cors", "/api/organs/cyber/cors",
+        lambda n, rng, enc: _json_body(cors_rules(max(n // 64, 8), rng)),
+    ),
+    # Legacy route: native ASGI by default, Flask/WSGI with INFOENGINE_LEGACY_NATIVE=0
+    "legacy_power_spectrum": Scenario(
+        "legacy_power_spectrum", "/power-spectrum",
+        lambda n, rng, enc: _json_body({"potentials": noise_signal(n, rng).tolist(), "dt": 0.001}),
+    ),
+    # Plain Flask route through the WSGI bridge
+    "flask_root": Scenario(
+        "flask_root", "/", lambda n, rng, enc: (b"", {}), method="GET",
+    ),
+}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario '{name}'. Choose from: {', '.join(SCENARIOS)}")
+        mix[name] = float(weight) if weight else 1.0
+    return mix
+
+
+# ---------------------------------------------------------
+# Load generation
+# ---------------------------------------------------------
+
+@dataclass
+class Sample:
+    scenario: str
+    seconds: float
+    status: int
+    response_bytes: int
+
+
+@dataclass
+class Prepared:
+    scenario: Scenario
+    url: str
+    bodies: List[Body] = field(default_factory=list)
+
+
+def prepare(mix, size: int, encoding: str, variants: int = 4, seed: int = 1234) -> List[Prepared]:
+    """
+    Build request bodies up front so encoding cost isn't measured.
+    """
+    prepared = []
+    for name in mix:
+        scenario = SCENARIOS[name]
+        bodies = [
+            scenario.build(size, np.random.default_rng(seed + v), encoding)
+            for v in range(variants)
+        ]
+        prepared.append(Prepared(scenario, scenario.path, bodies))
+    return prepared
+
+
+async def _worker(client, prepared, weights, deadline, remaining, samples, rng):
+    while time.perf_counter() < deadline:
+        if remaining is not None:
+            if remaining[0] <= 0:
+                return
+            remaining[0] -= 1
+
+        item = rng.choices(prepared, weights=weights)[0]
+        content, headers = rng.choice(item.bodies)
+
+        start = time.perf_counter()
+        try:
+            response = await client.request(item.scenario.method, item.url, content=content or None, headers=headers)
+            status, size = response.status_code, len(response.content)
+        except httpx.HTTPError:
+            status, size = 0, 0
+        samples.append(Sample(item.scenario.name, time.perf_counter() - start, status, size))
+
+
+async def run_level(client, prepared, weights, concurrency, duration, requests, seed) -> Tuple[List[Sample], float]:
+    samples: List[Sample] = []
+    remaining = [requests] if requests else None
+    deadline = time.perf_counter() + (duration if duration else float("inf"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _worker(client, prepared, weights, deadline, remaining, samples, random.Random(seed + i))
+        for i in range(concurrency)
+    ))
+    return samples, time.perf_counter() - start
+
+
+# ---------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------
+
+def summarize(samples: List[Sample], elapsed: float) -> Dict:
+    if not samples:
+        return {"requests": 0}
+    latency = np.array([s.seconds for s in samples])
+    errors = sum(1 for s in samples if s.status == 0 or s.status >= 400)
+    return {
+        "requests": len(samples),
+        "throughput_rps": len(samples) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": float(np.percentile(latency, 50) * 1e3),
+        "p95_ms": float(np.percentile(latency, 95) * 1e3),
+        "p99_ms": float(np.percentile(latency, 99) * 1e3),
+        "max_ms": float(latency.max() * 1e3),
+        "error_rate": errors / len(samples),
+        "mean_response_bytes": float(np.mean([s.response_bytes for s in samples])),
+    }
+
+
+def report(samples: List[Sample], elapsed: float) -> Dict:
+    by_scenario = {}
+    for name in sorted({s.scenario for s in samples}):
+        by_scenario[name] = summarize([s for s in samples if s.scenario == name], elapsed)
+    return {"overall": summarize(samples, elapsed), "scenarios": by_scenario}
+
+
+def _print_level(concurrency: int, result: Dict):
+    print(f"\nconcurrency={concurrency}")
+    print(f"  {'scenario':24s} {'req':>7s} {'rps':>9s} {'p50ms':>9s} {'p95ms':>9s} {'p99ms':>9s} {'err%':>6s}")
+    rows = [("ALL", result["overall"])] + list(result["scenarios"].items())
+    for name, row in rows:
+        if not row.get("requests"):
+            continue
+        print(
+            f"  {name:24s} {row['requests']:7d} {row['throughput_rps']:9.1f} "
+            f"{row['p50_ms']:9.2f} {row['p95_ms']:9.2f} {row['p99_ms']:9.2f} "
+            f"{100 * row['error_rate']:6.2f}"
+        )
+
+
+# ---------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------
+
+def _client(url: str, timeout: float) -> httpx.AsyncClient:
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=timeout)
+
+    from backend.hybrid import app
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=timeout
+    )
+
+
+async def run(args) -> Dict:
+    mix = parse_mix(args.mix)
+    prepared = prepare(mix, args.size, args.encoding, seed=args.seed)
+    weights = [mix[p.scenario.name] for p in prepared]
+
+    results = {"config": vars(args), "levels": {}}
+    async with _client(args.url, args.timeout) as client:
+        if args.warmup:
+            await run_level(client, prepared, weights, 1, None, args.warmup, args.seed)
+
+        for concurrency in args.concurrency:
+            samples, elapsed = await run_level(
+                client, prepared, weights, concurrency, args.duration, args.requests, args.seed
+            )
+            level = report(samples, elapsed)
+            results["levels"][str(concurrency)] = level
+            _print_level(concurrency, level)
+
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="InfoEngine HTTP load generator")
+    parser.add_argument("--url", default="", help="target server; omit to drive backend.hybrid:app in-process")
+    parser.add_argument("--mix", default="power_spectrum=4,consciousness=2,laplace=1,legacy_power_spectrum=2,bloodhound_red=1",
+                        help="weighted scenarios, e.g. power_spectrum=4,laplace=1")
+    parser.add_argument("--size", type=int, default=4096, help="signal length (graphs use size/64 nodes)")
+    parser.add_argument("--encoding", choices=("json", "binary"), default="json",
+                        help="signal body encoding for organ routes")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per concurrency level")
+    parser.add_argument("--requests", type=int, default=0, help="stop each level after this many requests")
+    parser.add_argument("--warmup", type=int, default=20, help="requests sent before measuring")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--out", help="write results JSON here")
+    args = parser.parse_args(argv)
+
+    # Each level needs a stopping condition: a positive duration or a request cap
+    if args.requests < 0 or args.duration < 0:
+        parser.error("--duration and --requests must not be negative")
+    if not args.requests and args.duration == 0:
+        parser.error("--duration 0 needs --requests N, otherwise the run never ends")
+
+    if args.requests:
+        args.duration = 0.0
+
+    results = asyncio.run(run(args))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,356 @@
+# backend/benchmarks/organ_bench.py
+"""
+Organ micro-benchmarks with empirical complexity fits.
+
+Runs every organ over a geometric sweep of input sizes with fixed seeds,
+records best-of-N wall time and peak traced memory per size, and fits
+the scaling exponent k in  t ~ n^k  by least squares in log-log space.
+
+    python -m backend.benchmarks.organ_bench --out bench/baseline.json
+    python -m backend.benchmarks.organ_bench --compare bench/baseline.json --threshold 0.25
+
+With --compare, the run exits with status 1 when any case is slower
+than the baseline by more than `threshold` (median ratio over shared
+sizes) or its exponent grew by more than --exponent-threshold.
+A case that raises is recorded as failed and the suite carries on;
+any failure also makes the run exit with status 1.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from backend.organs.physics.symplectic_organ import SymplecticOrgan
+from backend.organs.registry import OrganUnavailableError, registry
+
+
+SEED = 1234
+
+
+# ---------------------------------------------------------
+# Input generators (deterministic per size)
+# ---------------------------------------------------------
+
+def noise_signal(n: int, rng: np.random.Generator) -> np.ndarray:
+    return rng.standard_normal(n)
+
+
+def damped_signal(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Two damped modes plus noise: a realistic input for pole estimation."""
+    t = np.arange(n) / 100.0
+    x = np.exp(-0.3 * t) * np.cos(2 * np.pi * 3.0 * t)
+    x += 0.5 * np.exp(-0.1 * t) * np.sin(2 * np.pi * 7.0 * t)
+    return x + 0.01 * rng.standard_normal(n)
+
+
+def privilege_graph(n: int, rng: np.random.Generator) -> dict:
+    """Random directed graph with ~3 edges per node and a few high-value nodes."""
+    names = [f"n{i}" for i in range(n)]
+    src = rng.integers(0, n, size=3 * n)
+    dst = rng.integers(0, n, size=3 * n)
+    return {
+        "nodes": [{"name": name, "privilege": float(p)} for name, p in zip(names, rng.uniform(0, 5, n))],
+        "edges": [
+            {"source": names[a], "target": names[b], "weight": float(w)}
+            for a, b, w in zip(src, dst, rng.uniform(0.5, 2.0, 3 * n))
+            if a != b
+        ],
+        "high_value_nodes": names[: max(1, n // 50)],
+    }
+
+
+def cors_rules(n: int, rng: np.random.Generator) -> dict:
+    return {
+        "rules": [
+            {
+                "api_origin": f"https://api{i % 17}.example",
+                "allowed_origin": f"https://app{i}.example",
+                "allows_credentials": bool(rng.integers(0, 2)),
+                "wildcard": bool(rng.integers(0, 2)),
+            }
+            for i in range(n)
+        ]
+    }
+
+
+def xss_sinks(n: int, rng: np.random.Generator) -> dict:
+    return {
+        "sinks": [
+            {
+                "attacker_origin": f"https://evil{i % 11}.example",
+                "victim_origin": f"https://app{i}.example",
+                "severity": float(s),
+            }
+            for i, s in enumerate(rng.uniform(0.1, 3.0, n))
+        ]
+    }
+
+
+def origin_graph(n: int, rng: np.random.Generator) -> dict:
+    """Origins with the CORS rules and XSS sinks linking them."""
+    return {
+        "origins": [f"https://app{i}.example" for i in range(n)],
+        "cors_rules": cors_rules(n, rng)["rules"],
+        "xss_sinks": xss_sinks(n, rng)["sinks"],
+    }
+
+
+# ---------------------------------------------------------
+# Cases
+# ---------------------------------------------------------
+
+def geometric(start: int, stop: int, factor: int = 2) -> List[int]:
+    sizes = []
+    n = start
+    while n <= stop:
+        sizes.append(n)
+        n *= factor
+    return sizes
+
+
+@dataclass
+class BenchCase:
+    name: str
+    sizes: List[int]
+    make_input: Callable[[int, np.random.Generator], object]
+    run: Callable[[object], object]
+    notes: str = ""
+
+
+def _organ(name: str, **params) -> Callable[[object], object]:
+    return lambda data: registry.run(name, data, **params)
+
+
+def _symplectic(steps: int, integrator: str = "leapfrog") -> Callable[[object], object]:
+    organ = SymplecticOrgan(dt=0.01, steps=steps, integrator=integrator)
+    return lambda _: organ.analyze(x0=1.0, p0=0.0)
+
+
+def default_cases() -> List[BenchCase]:
+    cases = [
+        BenchCase("power_spectrum", geometric(1 << 10, 1 << 20, 4), noise_signal, _organ("power_spectrum")),
+        BenchCase("free_energy", geometric(1 << 10, 1 << 20, 4), noise_signal, _organ("free_energy")),
+        BenchCase("consciousness", geometric(1 << 10, 1 << 20, 4), noise_signal, _organ("consciousness")),
+        BenchCase("zeta_gamma", geometric(1 << 10, 1 << 20, 4), noise_signal, _organ("zeta_gamma")),
+        BenchCase("koopman", geometric(1 << 10, 1 << 18, 4), noise_signal, _organ("koopman")),
+        BenchCase("self_reference", geometric(1 << 8, 1 << 16, 4), noise_signal, _organ("self_reference")),
+        BenchCase("hash", geometric(1 << 8, 1 << 16, 4), noise_signal, _organ("hash")),
+        BenchCase("causal_set", geometric(8, 128), noise_signal, _organ("causal_set"),
+                  notes="pairwise relation + triple-loop transitive reduction"),
+        BenchCase("bloodhound_red", geometric(16, 512), privilege_graph, _organ("bloodhound_red")),
+        BenchCase("bloodhound_blue", geometric(16, 256), privilege_graph, _organ("bloodhound_blue")),
+        BenchCase("cyber_origin", geometric(16, 4096, 4), origin_graph, _organ("cyber_origin")),
+        BenchCase("cors", geometric(16, 4096, 4), cors_rules, _organ("cors")),
+        BenchCase("xss", geometric(16, 4096, 4), xss_sinks, _organ("xss")),
+    ]
+
+    laplace_sizes = {
+        "prony": geometric(64, 1 << 16, 4),
+        "burg": geometric(64, 1 << 16, 4),
+        "continuous_time": geometric(64, 1 << 16, 4),
+        "matrix_pencil": geometric(64, 1 << 16, 4),
+    }
+    for method, sizes in laplace_sizes.items():
+        cases.append(BenchCase(
+            f"laplace[{method}]", sizes, damped_signal,
+            _organ("laplace", sample_rate=100.0, method=method, order=10),
+        ))
+
+    cases.append(BenchCase(
+        "laplace_track", geometric(1 << 12, 1 << 22, 4), damped_signal,
+        _organ("laplace_track", sample_rate=100.0, method="burg", order=10, window=1024, hop=256),
+        notes="cost should follow signal length / hop",
+    ))
+
+    # Symplectic integration scales with the number of steps
+    for integrator in ("leapfrog", "yoshida4", "yoshida6"):
+        cases.append(BenchCase(
+            "symplectic" if integrator == "leapfrog" else f"symplectic[{integrator}]",
+            geometric(1 << 8, 1 << 16, 4), lambda n, rng: n,
+            lambda steps, integrator=integrator: _symplectic(steps, integrator)(None),
+            notes="size = integration steps",
+        ))
+
+    # Ensemble integration: 1000 steps, size = members
+    ensemble = SymplecticOrgan(dt=0.01, steps=1000)
+    cases.append(BenchCase(
+        "symplectic_ensemble", geometric(1, 1 << 14, 4), lambda n, rng: rng.standard_normal(n),
+        lambda x0: ensemble.analyze_ensemble(x0=x0, p0=0.0), notes="size = ensemble members",
+    ))
+    return cases
+
+
+# ---------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------
+
+def _time_once(run, data) -> float:
+    start = time.perf_counter()
+    run(data)
+    return time.perf_counter() - start
+
+
+def _peak_memory(run, data) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def fit_exponent(sizes, seconds, floor: float = 5e-5) -> float:
+    """
+    Slope of log(t) vs log(n), ignoring timings below `floor` where
+    fixed overhead dominates.
+    """
+    pts = [(n, t) for n, t in zip(sizes, seconds) if t >= floor]
+    if len(pts) < 2:
+        return float("nan")
+    n, t = np.log(np.array(pts, dtype=float)).T
+    slope, _ = np.polyfit(n, t, 1)
+    return float(slope)
+
+
+def run_case(case: BenchCase, repeats: int = 3, max_seconds: float = 5.0, memory: bool = True) -> Dict:
+    record = {"sizes": [], "seconds": [], "peak_bytes": [], "notes": case.notes}
+
+    for n in case.sizes:
+        rng = np.random.default_rng(SEED + n)
+        data = case.make_input(n, rng)
+
+        _time_once(case.run, data)  # warm-up (imports, caches)
+        best = min(_time_once(case.run, data) for _ in range(repeats))
+
+        record["sizes"].append(n)
+        record["seconds"].append(best)
+        record["peak_bytes"].append(_peak_memory(case.run, data) if memory else None)
+
+        # Geometric sweeps: stop before the next size blows the budget
+        if best > max_seconds:
+            break
+
+    # NaN (too few usable timings) is stored as null to keep the JSON valid
+    exponent = fit_exponent(record["sizes"], record["seconds"])
+    record["exponent"] = exponent if np.isfinite(exponent) else None
+    return record
+
+
+def run_suite(cases, only=None, **kwargs) -> Dict:
+    results = {}
+    for case in cases:
+        if only and not any(pattern in case.name for pattern in only):
+            continue
+        print(f"{case.name:28s}", end="", flush=True)
+        try:
+            record = run_case(case, **kwargs)
+        except OrganUnavailableError as exc:
+            results[case.name] = {"skipped": str(exc)}
+            print(f" skipped ({exc})")
+            continue
+        except Exception as exc:
+            results[case.name] = {"failed": f"{type(exc).__name__}: {exc}"}
+            print(f" failed ({type(exc).__name__}: {exc})")
+            continue
+        results[case.name] = record
+        exponent = "n/a" if record["exponent"] is None else f"{record['exponent']:.2f}"
+        print(
+            f" n≤{record['sizes'][-1]:<9d} t={record['seconds'][-1]:.4g}s"
+            f"  k≈{exponent}"
+        )
+
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "seed": SEED,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "cases": results,
+    }
+
+
+# ---------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.25, exponent_threshold: float = 0.5) -> List[str]:
+    """
+    Return a list of regression messages (empty when clean).
+    """
+    regressions = []
+    for name, cur in current["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if "failed" in cur:
+            regressions.append(f"{name}: failed ({cur['failed']})")
+            continue
+        if base is None or "skipped" in base or "skipped" in cur or "failed" in base:
+            continue
+
+        base_times = dict(zip(base["sizes"], base["seconds"]))
+        ratios = [t / base_times[n] for n, t in zip(cur["sizes"], cur["seconds"]) if base_times.get(n)]
+        if ratios:
+            ratio = float(np.median(ratios))
+            if ratio > 1.0 + threshold:
+                regressions.append(f"{name}: {ratio:.2f}x slower than baseline")
+
+        cur_k, base_k = cur.get("exponent"), base.get("exponent")
+        if cur_k is not None and base_k is not None and np.isfinite(cur_k) and np.isfinite(base_k):
+            if cur_k - base_k > exponent_threshold:
+                regressions.append(f"{name}: complexity exponent {base_k:.2f} -> {cur_k:.2f}")
+
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="InfoEngine organ micro-benchmarks")
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown ratio over baseline (0.25 = 25%%)")
+    parser.add_argument("--exponent-threshold", type=float, default=0.5,
+                        help="allowed growth of the fitted complexity exponent")
+    parser.add_argument("--only", nargs="*", help="run cases whose name contains any of these")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=5.0,
+                        help="stop a sweep after a size takes longer than this")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak measurement")
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        default_cases(),
+        only=args.only,
+        repeats=args.repeats,
+        max_seconds=args.max_seconds,
+        memory=not args.no_memory,
+    )
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2, allow_nan=False)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.exponent_threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        return 1 if regressions else 0
+
+    return 1 if any("failed" in record for record in results["cases"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
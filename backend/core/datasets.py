@@ -0,0 +1,86 @@
+# backend/core/datasets.py
+
+import os
+
+import numpy as np
+
+
+# ---------------------------------------------------------
+# Stored signal datasets
+#
+# Large acquisitions live as files under INFOENGINE_DATA_DIR and are
+# read through memory maps, so organs can walk them chunk by chunk
+# without loading them:
+#   - name.npy                 any 1-D numeric .npy file
+#   - name.f32 / name.f64      raw little-endian float32 / float64
+# ---------------------------------------------------------
+
+RAW_SUFFIXES = {".f32": np.dtype("<f4"), ".f64": np.dtype("<f8")}
+CHUNK_SAMPLES = 1 << 20
+
+
+class DatasetNotFoundError(FileNotFoundError):
+    """Raised when a dataset name does not resolve to a file in the data directory."""
+
+
+def data_dir() -> str:
+    return os.environ.get("INFOENGINE_DATA_DIR", "")
+
+
+def dataset_path(name: str) -> str:
+    """
+    Resolve a dataset name inside the data directory, refusing anything
+    that escapes it.
+    """
+    root = data_dir()
+    if not root:
+        raise DatasetNotFoundError("No data directory configured (INFOENGINE_DATA_DIR)")
+
+    root = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(root, name))
+    if not path.startswith(root + os.sep) or not os.path.isfile(path):
+        raise DatasetNotFoundError(f"Dataset '{name}' not found")
+    return path
+
+
+def open_dataset(name: str) -> np.ndarray:
+    """
+    Memory-map a stored 1-D signal.
+    """
+    path = dataset_path(name)
+    suffix = os.path.splitext(path)[1].lower()
+
+    if suffix == ".npy":
+        data = np.load(path, mmap_mode="r")
+    elif suffix in RAW_SUFFIXES:
+        data = np.memmap(path, dtype=RAW_SUFFIXES[suffix], mode="r")
+    else:
+        raise DatasetNotFoundError(f"Dataset '{name}' has an unsupported format")
+
+    if data.ndim != 1 or data.dtype.kind not in "fiu":
+        raise ValueError(f"Dataset '{name}' must be a one-dimensional numeric signal")
+    return data
+
+
+def iter_chunks(data: np.ndarray, chunk_samples: int = CHUNK_SAMPLES):
+    """
+    Yield consecutive in-memory chunks of a (memory-mapped) signal.
+    """
+    for start in range(0, data.shape[0], chunk_samples):
+        yield np.asarray(data[start:start + chunk_samples])
+
+
+def welch_dataset(name: str, **params) -> dict:
+    """
+    Welch power spectrum of a stored dataset, read chunk by chunk.
+    Picklable entry point for the process pool.
+    """
+    from backend.organs.physics.power_spectrum_organ import WelchSpectrum
+
+    data = open_dataset(name)
+    welch = WelchSpectrum(**params)
+    for chunk in iter_chunks(data):
+        welch.update(chunk)
+    result = welch.result()
+    result["dataset"] = name
+    return result
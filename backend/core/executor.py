@@ -0,0 +1,152 @@
+# backend/core/executor.py
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+from starlette.concurrency import run_in_threadpool
+
+from backend.organs.registry import registry
+
+
+# ---------------------------------------------------------
+# Worker-side entry points (run inside pool processes)
+# ---------------------------------------------------------
+
+def _run_signal_organ(name, shm_name, shape, dtype, params):
+    """
+    Run a signal organ on a signal that lives in shared memory.
+    The result is pickled here so no view of the segment outlives it.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        signal = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        signal.flags.writeable = False
+        result = registry.run(name, signal, **params)
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        del signal, result
+        return payload
+    finally:
+        shm.close()
+
+
+def _run_organ(name, data, params):
+    return pickle.dumps(registry.run(name, data, **params), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _call(fn, args, kwargs):
+    return pickle.dumps(fn(*args, **kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+# ---------------------------------------------------------
+# Executor
+# ---------------------------------------------------------
+
+class OrganExecutor:
+    """
+    Organ Executor
+    Dispatches organ calls from async handlers:
+    - organs registered with cost="cpu" go to a process pool, with signals
+      passed through shared memory instead of pickled lists
+    - cheap organs run inline on the threadpool
+    Setting `max_workers=0` keeps everything on the threadpool.
+    """
+
+    def __init__(self, max_workers=None, start_method="spawn"):
+        self.max_workers = max_workers
+        self.start_method = start_method
+        self._pool = None
+
+    @classmethod
+    def from_env(cls):
+        workers = os.environ.get("INFOENGINE_PROCESS_WORKERS")
+        return cls(
+            max_workers=int(workers) if workers not in (None, "") else None,
+            start_method=os.environ.get("INFOENGINE_MP_START", "spawn"),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers != 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+            )
+        return self._pool
+
+    def offloads(self, name: str) -> bool:
+        return self.enabled and registry.spec(name).cost == "cpu"
+
+    # ---------------------------------------------------------
+    # Organ calls
+    # ---------------------------------------------------------
+    async def run(self, name: str, data, context=None, **params):
+        """
+        Run an organ through the registry, in a worker process when the
+        organ is CPU-bound and inline otherwise.
+        """
+        if not self.offloads(name):
+            return await run_in_threadpool(registry.run, name, data, context=context, **params)
+
+        if registry.spec(name).kind == "signal":
+            return await self._run_shared(name, np.asarray(data), params)
+
+        loop = asyncio.get_running_loop()
+        payload = await loop.run_in_executor(self._get_pool(), _run_organ, name, data, params)
+        return pickle.loads(payload)
+
+    async def _run_shared(self, name, signal: np.ndarray, params):
+        signal = np.ascontiguousarray(signal)
+        shm = shared_memory.SharedMemory(create=True, size=max(signal.nbytes, 1))
+        try:
+            np.ndarray(signal.shape, dtype=signal.dtype, buffer=shm.buf)[...] = signal
+            loop = asyncio.get_running_loop()
+            payload = await loop.run_in_executor(
+                self._get_pool(), _run_signal_organ,
+                name, shm.name, signal.shape, signal.dtype.str, params,
+            )
+        finally:
+            shm.close()
+            shm.unlink()
+        return pickle.loads(payload)
+
+    # ---------------------------------------------------------
+    # Arbitrary callables (e.g. PhysicsCore.evolve)
+    # ---------------------------------------------------------
+    async def call(self, fn, *args, cpu=True, **kwargs):
+        """
+        Run a picklable callable in the process pool (cpu=True) or on
+        the threadpool.
+        """
+        if not (cpu and self.enabled):
+            return await run_in_threadpool(fn, *args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        payload = await loop.run_in_executor(self._get_pool(), _call, fn, args, kwargs)
+        return pickle.loads(payload)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Process-wide executor used by the organ routes
+organ_executor = OrganExecutor.from_env()
+
+
+@asynccontextmanager
+async def executor_lifespan(app):
+    """ASGI lifespan that stops the organ process pool on shutdown."""
+    try:
+        yield
+    finally:
+        organ_executor.shutdown()
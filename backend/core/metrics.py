@@ -0,0 +1,199 @@
+# backend/core/metrics.py
+
+import os
+import time
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+
+# ---------------------------------------------------------
+# Metric definitions
+# ---------------------------------------------------------
+
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+SIZE_BUCKETS = tuple(4 ** k for k in range(1, 13))   # 4 .. ~16.7M
+
+REQUESTS = Counter(
+    "infoengine_requests_total",
+    "HTTP requests by route, method and status",
+    ["route", "method", "status"],
+)
+REQUEST_SECONDS = Histogram(
+    "infoengine_request_seconds",
+    "HTTP request latency by route",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+RESPONSE_BYTES = Histogram(
+    "infoengine_response_bytes",
+    "HTTP response body size by route",
+    ["route"],
+    buckets=SIZE_BUCKETS,
+)
+REQUEST_ERRORS = Counter(
+    "infoengine_request_errors_total",
+    "HTTP requests that failed with a 5xx or an unhandled exception",
+    ["route"],
+)
+
+ORGAN_CALLS = Counter(
+    "infoengine_organ_calls_total",
+    "Organ invocations",
+    ["organ"],
+)
+ORGAN_ERRORS = Counter(
+    "infoengine_organ_errors_total",
+    "Organ invocations that raised",
+    ["organ"],
+)
+ORGAN_SECONDS = Histogram(
+    "infoengine_organ_seconds",
+    "Organ compute time (including process-pool dispatch)",
+    ["organ"],
+    buckets=LATENCY_BUCKETS,
+)
+ORGAN_INPUT_SIZE = Histogram(
+    "infoengine_organ_input_size",
+    "Organ input size: signal samples, graph nodes or graph edges",
+    ["organ", "dimension"],
+    buckets=SIZE_BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "infoengine_cache_lookups_total",
+    "Result cache lookups by organ and outcome",
+    ["organ", "result"],
+)
+
+
+# ---------------------------------------------------------
+# Organ-level helpers
+# ---------------------------------------------------------
+
+def input_sizes(data) -> dict:
+    """
+    Size dimensions of an organ input: samples for signals,
+    nodes/edges for graph payloads.
+    """
+    if isinstance(data, dict):
+        return {
+            key: len(data[key])
+            for key in ("nodes", "edges", "rules", "sinks", "origins")
+            if isinstance(data.get(key), list)
+        }
+    size = getattr(data, "size", None)
+    if size is None:
+        try:
+            size = len(data)
+        except TypeError:
+            return {}
+    return {"samples": int(size)}
+
+
+@contextmanager
+def observe_organ(organ: str, data=None):
+    """
+    Count, time and size one organ call.
+    """
+    ORGAN_CALLS.labels(organ).inc()
+    for dimension, size in input_sizes(data).items():
+        ORGAN_INPUT_SIZE.labels(organ, dimension).observe(size)
+
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        ORGAN_ERRORS.labels(organ).inc()
+        raise
+    finally:
+        ORGAN_SECONDS.labels(organ).observe(time.perf_counter() - start)
+
+
+def record_cache(organ: str, status: str):
+    """
+    status: "HIT", "MISS" or "BYPASS" (as in the X-Cache header).
+    """
+    CACHE_LOOKUPS.labels(organ, status.lower()).inc()
+
+
+# ---------------------------------------------------------
+# ASGI middleware
+# ---------------------------------------------------------
+
+def _route_label(scope, status: int) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is not None:
+        return scope.get("root_path", "") + path
+    # Flask-mounted routes: the path is a fixed blueprint URL
+    if status == 404:
+        return "unmatched"
+    return scope.get("path", "unmatched")
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request count, latency, response size
+    and errors per route for every request that reaches the app,
+    including the Flask mount.
+    """
+
+    def __init__(self, app, skip_paths=("/metrics",)):
+        self.app = app
+        self.skip_paths = set(skip_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        body_bytes = 0
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status, body_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            route = _route_label(scope, status)
+            REQUESTS.labels(route, scope.get("method", ""), str(status)).inc()
+            REQUEST_SECONDS.labels(route).observe(time.perf_counter() - start)
+            RESPONSE_BYTES.labels(route).observe(body_bytes)
+            if status >= 500:
+                REQUEST_ERRORS.labels(route).inc()
+
+
+# ---------------------------------------------------------
+# Exposition
+# ---------------------------------------------------------
+
+def render_metrics():
+    """
+    Return (body, content_type). Aggregates across processes when
+    PROMETHEUS_MULTIPROC_DIR is set (multiple uvicorn workers).
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -1,55 +1,209 @@
 # backend/core/physics_core.py
 
-from backend.organs.physics.symplectic_organ import SymplecticOrgan
-from backend.organs.physics.action_organ import ActionOrgan
+import numpy as np
 
-# ---------------------------------------------------------
-# PoissonOrgan is not implemented yet — comment it out
-# ---------------------------------------------------------
-# from backend.organs.physics.poisson_organ import PoissonOrgan
+from backend.core.trajectory_store import trajectory_store
+from backend.organs.physics.symplectic_organ import EnergyStats, SymplecticOrgan
+from backend.organs.physics.action_organ import ActionAccumulator, ActionOrgan
+from backend.organs.physics.hamiltonians import HAMILTONIANS
+from backend.organs.poisson_organ import PoissonOrgan
 
 
 class PhysicsCore:
     """
     Unified Physics Core
-    - Runs symplectic Hamiltonian flow
-    - Computes action and phase accumulation
-    - (PoissonOrgan will be added later)
+    - Runs symplectic Hamiltonian flow (any registered Hamiltonian,
+      leapfrog or higher-order integrators)
+    - Computes action and phase accumulation, fused into the integration
+    - Long runs can stream into the trajectory store, checkpointing
+      every CHECKPOINT_STEPS steps and resuming from the last checkpoint
+    - Checks conserved quantities ({I, H} ≈ 0) along the trajectory
+      with batched Poisson brackets
     """
 
-    def __init__(self, dt=0.01, steps=1000, hbar=1.0):
-        self.symplectic = SymplecticOrgan(dt=dt, steps=steps)
-        self.action = ActionOrgan(hbar=hbar)
+    CHECKPOINT_STEPS = 1 << 18
 
-        # ---------------------------------------------------------
-        # PoissonOrgan disabled for now
-        # ---------------------------------------------------------
-        # self.poisson = PoissonOrgan()
+    def __init__(self, dt=0.01, steps=1000, hbar=1.0, integrator="leapfrog"):
+        self.symplectic = SymplecticOrgan(dt=dt, steps=steps, integrator=integrator)
+        self.action = ActionOrgan(hbar=hbar)
+        self.poisson = PoissonOrgan()
 
-    def evolve(self, x0, p0, H_name="harmonic", params=None):
+    def evolve(
+        self,
+        x0,
+        p0,
+        H_name="harmonic",
+        params=None,
+        integrator=None,
+        record_every=1,
+        summary_only=False,
+        store=False,
+        invariants=None,
+        invariant_tol=None,
+    ):
         """
-        Integrate Hamiltonian flow and compute action diagnostics.
+        Integrate Hamiltonian flow and compute action diagnostics in the
+        same pass. Results stay NumPy arrays until the response is
+        encoded; record_every=k keeps every k-th state and summary_only
+        keeps none, so output size is bounded for million-step runs.
+        store=True writes the trajectory to the trajectory store instead
+        and returns the run's metadata (query rows by its id).
+        invariants (observable names, or True for all) adds {I, H}
+        checks over the recorded states (the final state if summary_only).
         """
+        if store:
+            try:
+                meta = self.create_run(x0, p0, H_name, params, integrator, record_every=record_every)
+            except ValueError as exc:
+                return {"error": str(exc)}
+            return self.run_stored(meta["id"])
+
+        action = self.action.accumulator(H_name) if H_name in HAMILTONIANS else None
+
         symp = self.symplectic.analyze(
             x0=x0,
             p0=p0,
             H_name=H_name,
-            params=params
+            params=params,
+            integrator=integrator,
+            record_every=record_every,
+            summary_only=summary_only,
+            action=action,
         )
+        if "error" in symp:
+            return symp
 
-        act = self.action.compute_action_hamiltonian(
-            t=symp["time"],
-            x=symp["x"],
-            p=symp["p"],
-            H_name=H_name,
-            params=params
+        result = {
+            "symplectic": symp,
+            "action": action.result(symp.get("time")),
+        }
+        if invariants:
+            # Params shaped per member, as the integrator used them
+            _, _, _, _, shaped = self.symplectic.prepare(x0, p0, H_name, params, integrator)
+            trajectory = "x" in symp
+            q, p = (symp["x"], symp["p"]) if trajectory else (symp["final_x"], symp["final_p"])
+            result["poisson"] = self.poisson.check_invariants(
+                q, p, H_name, shaped,
+                observables=None if invariants is True else invariants,
+                tol=invariant_tol,
+                time_axis=trajectory,
+            )
+        return result
+
+    # ---------------------------------------------------------
+    # Checkpointed runs
+    # ---------------------------------------------------------
+    def create_run(
+        self,
+        x0,
+        p0,
+        H_name="harmonic",
+        params=None,
+        integrator=None,
+        steps=None,
+        dt=None,
+        record_every=1,
+        store=None,
+    ) -> dict:
+        """
+        Register a stored run (nothing is integrated yet). Raises
+        ValueError for an unusable configuration.
+        """
+        store = store or trajectory_store
+        steps = int(self.symplectic.steps if steps is None else steps)
+        if steps < 1 or int(record_every) < 1:
+            raise ValueError("steps and record_every must be at least 1")
+
+        organ = SymplecticOrgan(
+            dt=self.symplectic.dt if dt is None else dt,
+            steps=steps,
+            integrator=integrator or self.symplectic.integrator,
         )
+        hamiltonian, scheme, x, p, prepared = organ.prepare(x0, p0, H_name, params)
+        energy_shape = np.shape(hamiltonian.energy(x, p, prepared))
 
-        # ---------------------------------------------------------
-        # PoissonOrgan disabled — return only symplectic + action
-        # ---------------------------------------------------------
-        return {
-            "symplectic": symp,
-            "action": act,
-            # "poisson": self.poisson.analyze(...),
-        }
\ No newline at end of file
+        config = {
+            "x0": np.asarray(x0, dtype=float).tolist(),
+            "p0": np.asarray(p0, dtype=float).tolist(),
+            "H_name": H_name,
+            "params": {k: np.asarray(v, dtype=float).tolist() for k, v in (params or {}).items()},
+            "integrator": scheme.name,
+            "dt": float(organ.dt),
+            "steps": steps,
+            "record_every": int(record_every),
+        }
+        shapes = {"t": (), "x": x.shape, "p": p.shape, "energy": energy_shape, "action": energy_shape}
+        return store.create(config, shapes)
+
+    def run_stored(self, run_id, max_steps=None, store=None) -> dict:
+        """
+        Integrate a stored run from its last checkpoint to the end (or
+        for at most `max_steps` more steps). Rows are written segment by
+        segment and a checkpoint follows every segment, so an
+        interrupted run loses at most CHECKPOINT_STEPS steps.
+        Returns the run's metadata.
+        """
+        store = store or trajectory_store
+        meta = store.meta(run_id)
+        if meta["status"] == "complete":
+            return meta
+
+        organ = SymplecticOrgan(dt=meta["dt"], steps=meta["steps"], integrator=meta["integrator"])
+        hamiltonian, scheme, x, p, params = organ.prepare(
+            meta["x0"], meta["p0"], meta["H_name"], meta["params"] or None,
+        )
+        every = meta["record_every"]
+
+        checkpoint = store.load_checkpoint(run_id)
+        if checkpoint is None:
+            done = rows = 0
+            stats = EnergyStats()
+            action = ActionAccumulator(hbar=self.action.hbar, vector=hamiltonian.vector)
+        else:
+            done, rows = int(checkpoint["completed_steps"]), int(checkpoint["rows"])
+            x, p = checkpoint["x"].copy(), checkpoint["p"].copy()
+            stats = EnergyStats.from_state(checkpoint, prefix="stats_")
+            action = ActionAccumulator.from_state(
+                checkpoint, hbar=self.action.hbar, vector=hamiltonian.vector, prefix="action_",
+            )
+
+        # Segments (and partial runs) end on a recorded step so the stride stays aligned
+        segment = max(every, self.CHECKPOINT_STEPS // every * every)
+        limit = meta["steps"]
+        if max_steps is not None:
+            limit = min(limit, done + max(every, int(max_steps) // every * every))
+
+        store.update(run_id, status="running")
+        try:
+            while done < limit:
+                n = min(segment, limit - done)
+                t, xs, ps, energies = organ.segment(
+                    x, p, hamiltonian, params, scheme, n,
+                    record_every=every, stats=stats, action=action, include_initial=(done == 0), start=done,
+                )
+                rows = store.write_rows(run_id, rows, {
+                    "t": t,
+                    "x": xs,
+                    "p": ps,
+                    "energy": energies,
+                    "action": action.take_marks(),
+                })
+                # The last step of a segment is always recorded
+                x, p = xs[-1].copy(), ps[-1].copy()
+                done += n
+                store.save_checkpoint(run_id, rows, done, {
+                    "x": x,
+                    "p": p,
+                    **stats.state(prefix="stats_"),
+                    **action.state(prefix="action_"),
+                })
+        except Exception as exc:
+            store.update(run_id, status="failed", error=str(exc))
+            raise
+
+        summary = {**stats.summary(), **action.result()}
+        return store.update(
+            run_id,
+            status="complete" if done >= meta["steps"] else "paused",
+            summary={key: np.asarray(value).tolist() for key, value in summary.items()},
+        )
@@ -0,0 +1,142 @@
+# backend/core/profiling.py
+
+import cProfile
+import hmac
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request
+
+
+# ---------------------------------------------------------
+# On-demand per-request profiling
+#
+# A request opts in with `X-Profile: cpu|memory|all` (or ?profile=...)
+# and must carry `X-Profile-Token` matching INFOENGINE_PROFILE_TOKEN.
+# Without that variable set, profiling is disabled.
+#
+# The organ call then runs inline (no cache, no process pool) under
+# cProfile and/or tracemalloc, and the report is attached to the
+# result as "_profile". With INFOENGINE_PROFILE_DIR set, the cProfile
+# stats are also written there as <id>.prof.
+# ---------------------------------------------------------
+
+PROFILE_MODES = ("cpu", "memory", "all")
+
+
+@dataclass
+class ProfileOptions:
+    mode: str = "all"
+    top: int = 25
+
+
+current_profile: ContextVar = ContextVar("current_profile", default=None)
+
+# tracemalloc is process-wide; profile one call at a time
+_profile_lock = threading.Lock()
+
+
+async def profile_guard(request: Request):
+    """
+    Router dependency: validate the profiling opt-in and publish it for
+    the organ call through `current_profile`. Async so the context
+    variable is visible to the endpoint.
+    """
+    mode = request.headers.get("x-profile") or request.query_params.get("profile")
+    if not mode:
+        current_profile.set(None)
+        return
+
+    token = os.environ.get("INFOENGINE_PROFILE_TOKEN")
+    supplied = request.headers.get("x-profile-token", "")
+    if not token or not hmac.compare_digest(token.encode(), supplied.encode()):
+        raise HTTPException(status_code=403, detail="Profiling not authorized")
+
+    mode = mode.lower()
+    if mode not in PROFILE_MODES:
+        raise HTTPException(status_code=422, detail=f"profile must be one of {list(PROFILE_MODES)}")
+
+    top = request.query_params.get("profile_top", "25")
+    current_profile.set(ProfileOptions(mode=mode, top=int(top) if top.isdigit() else 25))
+
+
+def _top_frames(profiler: cProfile.Profile, top: int):
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, func), (cc, nc, tt, ct, _) in stats.stats.items():
+        rows.append({
+            "function": func,
+            "file": filename,
+            "line": line,
+            "ncalls": nc,
+            "primitive_calls": cc,
+            "tottime": tt,
+            "cumtime": ct,
+        })
+    rows.sort(key=lambda r: r["cumtime"], reverse=True)
+    return rows[:top]
+
+
+def _top_allocations(snapshot, top: int):
+    return [
+        {
+            "location": str(stat.traceback[0]) if stat.traceback else "",
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+
+def profile_call(options: ProfileOptions, fn, *args, **kwargs):
+    """
+    Run fn(*args, **kwargs) under the requested profilers.
+    Returns (result, report).
+    """
+    cpu = options.mode in ("cpu", "all")
+    memory = options.mode in ("memory", "all")
+    report = {"mode": options.mode}
+
+    with _profile_lock:
+        started_tracing = False
+        if memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+
+        profiler = cProfile.Profile() if cpu else None
+        start = time.perf_counter()
+        try:
+            if profiler is not None:
+                result = profiler.runcall(fn, *args, **kwargs)
+            else:
+                result = fn(*args, **kwargs)
+        finally:
+            report["wall_seconds"] = time.perf_counter() - start
+
+            if memory:
+                current, peak = tracemalloc.get_traced_memory()
+                report["peak_bytes"] = peak - baseline
+                report["retained_bytes"] = current - baseline
+                report["top_allocations"] = _top_allocations(tracemalloc.take_snapshot(), options.top)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    if profiler is not None:
+        report["top_frames"] = _top_frames(profiler, options.top)
+        artifact_dir = os.environ.get("INFOENGINE_PROFILE_DIR")
+        if artifact_dir:
+            os.makedirs(artifact_dir, exist_ok=True)
+            path = os.path.join(artifact_dir, f"{uuid.uuid4().hex}.prof")
+            profiler.dump_stats(path)
+            report["artifact"] = path
+
+    return result, report
@@ -0,0 +1,171 @@
+# backend/core/result_cache.py
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+def signal_digest(signal: np.ndarray) -> str:
+    """
+    SHA-256 over the raw signal bytes (as HashOrgan computes it),
+    salted with dtype and shape so equal bytes of different layouts
+    never collide.
+    """
+    x = np.ascontiguousarray(signal)
+    h = hashlib.sha256()
+    h.update(f"{x.dtype.str}{x.shape}".encode())
+    h.update(memoryview(x).cast("B"))
+    return h.hexdigest()
+
+
+def _estimate_size(obj) -> int:
+    """
+    Rough byte size of an organ result (dicts/lists of floats and arrays).
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            _estimate_size(k) + _estimate_size(v) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(_estimate_size(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+class ResultCache:
+    """
+    Result Cache
+    Content-addressed LRU cache for organ results.
+    - key: signal digest + organ name + canonical organ parameters
+    - eviction: least recently used, bounded by entry count and bytes
+    - entries expire after `ttl` seconds
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=256 * 1024 * 1024, ttl=600.0, enabled=True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.enabled = enabled
+
+        self._entries = OrderedDict()   # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_entries=int(os.environ.get("INFOENGINE_CACHE_MAX_ENTRIES", 1024)),
+            max_bytes=int(os.environ.get("INFOENGINE_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+            ttl=float(os.environ.get("INFOENGINE_CACHE_TTL", 600.0)),
+            enabled=os.environ.get("INFOENGINE_CACHE", "0").lower() in ("1", "true", "yes", "on"),
+        )
+
+    # ---------------------------------------------------------
+    # Keys
+    # ---------------------------------------------------------
+    @staticmethod
+    def make_key(organ: str, digest: str, params: dict = None) -> str:
+        canonical = json.dumps(params or {}, sort_keys=True, default=str)
+        return f"{organ}:{digest}:{canonical}"
+
+    # ---------------------------------------------------------
+    # Lookup / insert
+    # ---------------------------------------------------------
+    def get(self, key):
+        """
+        Return (True, value) on a hit and (False, None) on a miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[2]
+
+    def put(self, key, value):
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute, bypass=False):
+        """
+        Return (value, hit). `bypass` skips the lookup but still stores
+        the fresh result.
+        """
+        if not self.enabled:
+            return compute(), False
+
+        if not bypass:
+            hit, value = self.get(key)
+            if hit:
+                return value, True
+
+        value = compute()
+        self.store(key, value)
+        return value, False
+
+    def store(self, key, value):
+        """
+        Insert a freshly computed result unless it is an organ error.
+        """
+        if self.enabled and not (isinstance(value, dict) and "error" in value):
+            self.put(key, value)
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # ---------------------------------------------------------
+    # Stats
+    # ---------------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Process-wide cache used by the organ routes
+result_cache = ResultCache.from_env()
@@ -0,0 +1,130 @@
+# backend/core/sessions.py
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+
+class SessionNotFoundError(KeyError):
+    """Raised for unknown, deleted or evicted session ids."""
+
+
+class SessionLimitError(MemoryError):
+    """Raised when a session alone exceeds the store's memory budget."""
+
+
+class Session:
+    """
+    One stateful object (e.g. an OnlineDMD) plus the lock that
+    serializes updates to it.
+    """
+
+    def __init__(self, state, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.state = state
+        self.lock = threading.Lock()
+        self.created = time.time()
+        self.last_used = time.monotonic()
+
+    @property
+    def nbytes(self) -> int:
+        return int(getattr(self.state, "nbytes", 0))
+
+
+class SessionStore:
+    """
+    Session Store
+    Server-side state for streaming organs, kept per process.
+    - sessions idle for longer than `idle_ttl` seconds are evicted
+    - total state is capped at `max_bytes` (and `max_sessions`);
+      least recently used sessions go first
+    - states report their footprint through an `nbytes` attribute
+    """
+
+    def __init__(self, max_sessions=256, max_bytes=256 * 1024 * 1024, idle_ttl=900.0):
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.idle_ttl = idle_ttl
+
+        self._sessions = OrderedDict()   # id -> Session, least recently used first
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_sessions=int(os.environ.get("INFOENGINE_SESSION_MAX", 256)),
+            max_bytes=int(os.environ.get("INFOENGINE_SESSION_MAX_BYTES", 256 * 1024 * 1024)),
+            idle_ttl=float(os.environ.get("INFOENGINE_SESSION_TTL", 900.0)),
+        )
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    def create(self, state, kind: str = "") -> Session:
+        session = Session(state, kind)
+        if session.nbytes > self.max_bytes:
+            raise SessionLimitError(
+                f"Session needs {session.nbytes} bytes, over the {self.max_bytes} byte budget"
+            )
+
+        with self._lock:
+            self._sweep()
+            self._sessions[session.id] = session
+            while len(self._sessions) > self.max_sessions or self._used_bytes() > self.max_bytes:
+                self._sessions.popitem(last=False)
+                self.evictions += 1
+        return session
+
+    def get(self, session_id: str, kind: str = None) -> Session:
+        with self._lock:
+            self._sweep()
+            session = self._sessions.get(session_id)
+            if session is None or (kind is not None and session.kind != kind):
+                raise SessionNotFoundError(session_id)
+            session.last_used = time.monotonic()
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id: str):
+        with self._lock:
+            if self._sessions.pop(session_id, None) is None:
+                raise SessionNotFoundError(session_id)
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+
+    # ---------------------------------------------------------
+    # Internals (lock held)
+    # ---------------------------------------------------------
+    def _sweep(self):
+        cutoff = time.monotonic() - self.idle_ttl
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.last_used >= cutoff:
+                break
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def _used_bytes(self) -> int:
+        return sum(s.nbytes for s in self._sessions.values())
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._sweep()
+            return {
+                "sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "bytes": self._used_bytes(),
+                "max_bytes": self.max_bytes,
+                "idle_ttl": self.idle_ttl,
+                "evictions": self.evictions,
+            }
+
+
+# Module-level store shared by the API routes
+session_store = SessionStore.from_env()
@@ -0,0 +1,208 @@
+# backend/core/trajectory_store.py
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import uuid
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+
+# ---------------------------------------------------------
+# Checkpointed trajectory runs
+#
+# Long integrations write their recorded rows to disk as they go, so a
+# 10^8-step run never holds its trajectory in memory:
+#   <runs dir>/<id>/meta.json          configuration, progress, summary
+#   <runs dir>/<id>/checkpoint.npz     state needed to resume
+#   <runs dir>/<id>/<field>_<k>.npy    rows [k * chunk_rows, (k + 1) * chunk_rows)
+# Chunks are written and read back through memory maps.
+# ---------------------------------------------------------
+
+FIELDS = ("t", "x", "p", "energy", "action")
+CHUNK_ROWS = 1 << 16
+MAX_SLICE_ROWS = 1 << 20
+
+_RUN_ID = re.compile(r"[0-9a-f]{32}")
+
+
+class RunNotFoundError(FileNotFoundError):
+    """Raised for unknown or deleted run ids."""
+
+
+def runs_dir() -> str:
+    return os.environ.get("INFOENGINE_RUNS_DIR") or os.path.join(tempfile.gettempdir(), "infoengine-runs")
+
+
+def _write_atomic(path: str, write):
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "wb") as fh:
+        write(fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+class TrajectoryStore:
+    """
+    Trajectory Store
+    On-disk trajectories of long physics runs, addressed by run id.
+    - rows (t, x, p, energy, action per recorded step) are appended
+      into fixed-size .npy chunks through memory maps
+    - checkpoint.npz holds the integrator state, energy statistics and
+      action accumulator; it is replaced atomically and is the source
+      of truth for how many rows and steps are complete
+    - read() serves start/stop/step slices of one field across chunks
+    """
+
+    def __init__(self, root=None, chunk_rows=CHUNK_ROWS):
+        self.root = root or runs_dir()
+        self.chunk_rows = int(chunk_rows)
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            root=runs_dir(),
+            chunk_rows=int(os.environ.get("INFOENGINE_RUN_CHUNK_ROWS", CHUNK_ROWS)),
+        )
+
+    # ---------------------------------------------------------
+    # Runs
+    # ---------------------------------------------------------
+    def create(self, config: dict, shapes: dict) -> dict:
+        """
+        Register a run; `shapes` gives the per-row shape of every field.
+        """
+        run_id = uuid.uuid4().hex
+        os.makedirs(os.path.join(self.root, run_id))
+        meta = {
+            "id": run_id,
+            "status": "pending",
+            "created": time.time(),
+            "updated": time.time(),
+            "chunk_rows": self.chunk_rows,
+            "shapes": {field: list(shapes[field]) for field in FIELDS},
+            "rows": 0,
+            "completed_steps": 0,
+            **config,
+        }
+        self._write_meta(run_id, meta)
+        return meta
+
+    def meta(self, run_id: str) -> dict:
+        with open(os.path.join(self._dir(run_id), "meta.json")) as fh:
+            return json.load(fh)
+
+    def update(self, run_id: str, **fields) -> dict:
+        meta = self.meta(run_id)
+        meta.update(fields, updated=time.time())
+        self._write_meta(run_id, meta)
+        return meta
+
+    def list(self) -> list:
+        if not os.path.isdir(self.root):
+            return []
+        metas = []
+        for name in os.listdir(self.root):
+            if _RUN_ID.fullmatch(name):
+                try:
+                    metas.append(self.meta(name))
+                except (OSError, ValueError):
+                    continue
+        return sorted(metas, key=lambda m: m["created"])
+
+    def delete(self, run_id: str):
+        shutil.rmtree(self._dir(run_id))
+
+    def _dir(self, run_id: str) -> str:
+        path = os.path.join(self.root, run_id)
+        if not _RUN_ID.fullmatch(run_id or "") or not os.path.isdir(path):
+            raise RunNotFoundError(f"Run '{run_id}' not found")
+        return path
+
+    def _write_meta(self, run_id: str, meta: dict):
+        path = os.path.join(self.root, run_id, "meta.json")
+        _write_atomic(path, lambda fh: fh.write(json.dumps(meta).encode()))
+
+    # ---------------------------------------------------------
+    # Checkpoints
+    # ---------------------------------------------------------
+    def save_checkpoint(self, run_id: str, rows: int, steps: int, arrays: dict):
+        path = os.path.join(self._dir(run_id), "checkpoint.npz")
+        arrays = {**arrays, "rows": np.int64(rows), "completed_steps": np.int64(steps)}
+        _write_atomic(path, lambda fh: np.savez(fh, **arrays))
+        self.update(run_id, rows=int(rows), completed_steps=int(steps))
+
+    def load_checkpoint(self, run_id: str):
+        path = os.path.join(self._dir(run_id), "checkpoint.npz")
+        if not os.path.isfile(path):
+            return None
+        with np.load(path) as data:
+            return {key: data[key] for key in data.files}
+
+    # ---------------------------------------------------------
+    # Rows
+    # ---------------------------------------------------------
+    def _chunk(self, run_id: str, meta: dict, field: str, index: int, create=False):
+        path = os.path.join(self._dir(run_id), f"{field}_{index:05d}.npy")
+        if create and not os.path.isfile(path):
+            shape = (meta["chunk_rows"],) + tuple(meta["shapes"][field])
+            return open_memmap(path, mode="w+", dtype=np.float64, shape=shape)
+        return np.load(path, mmap_mode="r+" if create else "r")
+
+    def write_rows(self, run_id: str, start: int, rows: dict) -> int:
+        """
+        Write rows (one array per field, equal lengths) from row `start`;
+        rows past a checkpoint left by an interrupted run are overwritten.
+        Returns the row count after the write.
+        """
+        meta = self.meta(run_id)
+        chunk_rows = meta["chunk_rows"]
+        count = len(rows["t"])
+        for field in FIELDS:
+            data = np.asarray(rows[field], dtype=np.float64)
+            written = 0
+            while written < count:
+                row = start + written
+                index, offset = divmod(row, chunk_rows)
+                n = min(chunk_rows - offset, count - written)
+                chunk = self._chunk(run_id, meta, field, index, create=True)
+                chunk[offset:offset + n] = data[written:written + n]
+                chunk.flush()
+                del chunk
+                written += n
+        return start + count
+
+    def read(self, run_id: str, field: str, start=0, stop=None, step=1) -> np.ndarray:
+        """
+        Rows start:stop:step of one field, gathered across chunks.
+        """
+        if field not in FIELDS:
+            raise ValueError(f"field must be one of {list(FIELDS)}, got '{field}'")
+        if step < 1:
+            raise ValueError("step must be at least 1")
+
+        meta = self.meta(run_id)
+        chunk_rows = meta["chunk_rows"]
+        index = np.arange(*slice(start, stop, step).indices(meta["rows"]))
+        if index.size > MAX_SLICE_ROWS:
+            raise ValueError(f"Slice has {index.size} rows, over the {MAX_SLICE_ROWS} row limit; use a larger step")
+
+        out = np.empty((index.size,) + tuple(meta["shapes"][field]))
+        chunks = index // chunk_rows
+        bounds = np.flatnonzero(np.diff(chunks)) + 1
+        for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, index.size]):
+            if lo == hi:
+                continue
+            chunk = self._chunk(run_id, meta, field, int(chunks[lo]))
+            out[lo:hi] = chunk[index[lo:hi] - chunks[lo] * chunk_rows]
+            del chunk
+        return out
+
+
+# Module-level store shared by the API routes and the physics core
+trajectory_store = TrajectoryStore.from_env()
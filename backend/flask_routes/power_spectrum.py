@@ -1,6 +1,8 @@
 import numpy as np
 from flask import Blueprint, request, jsonify
 
+from backend.organs.physics.power_spectrum_organ import WelchSpectrum
+
 power_spectrum_bp = Blueprint("power_spectrum", __name__)
 
 @power_spectrum_bp.route("/power-spectrum", methods=["POST"])
@@ -14,6 +16,27 @@ def compute_power_spectrum():
     dt = float(data.get("dt", 1.0))  # time step
     fs = 1.0 / dt                    # sampling frequency
 
+    # Optional Welch averaging for long, noisy captures
+    if data.get("method") == "welch":
+        try:
+            welch = WelchSpectrum(
+                sample_rate=fs,
+                nperseg=int(data.get("nperseg", 256)),
+                noverlap=data.get("noverlap"),
+                window=data.get("window", "hann"),
+                detrend=data.get("detrend", "constant"),
+            )
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+        welch.update(potentials)
+        result = welch.result()
+        if "error" in result:
+            return jsonify(result), 400
+        return jsonify({
+            "frequencies": result["frequencies"].tolist(),
+            "power": result["power"].tolist()
+        })
+
     # Compute FFT
     fft_vals = np.fft.rfft(potentials)
     freqs = np.fft.rfftfreq(len(potentials), d=dt)
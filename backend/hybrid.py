@@ -1,14 +1,35 @@
-from fastapi import FastAPI
+import os
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.wsgi import WSGIMiddleware
 
 from backend.app import flask_app
 from backend.api import fastapi_app
+from backend.core.executor import executor_lifespan
+from backend.core.metrics import MetricsMiddleware, render_metrics
+from backend.routes.legacy import router as legacy_router
 
-# Main ASGI app
-app = FastAPI(title="InfoEngine Hybrid Backend")
+# Main ASGI app. Mounted apps don't receive lifespan events, so the
+# organ process pool is stopped from this app's lifespan.
+app = FastAPI(title="InfoEngine Hybrid Backend", lifespan=executor_lifespan)
 
-# Mount Flask at root
-app.mount("/", WSGIMiddleware(flask_app))
+# Per-route request metrics for everything below, Flask mount included
+app.add_middleware(MetricsMiddleware)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
 
-# Mount FastAPI under /api
-app.mount("/api", fastapi_app)
\ No newline at end of file
+
+# Legacy Flask routes (power-spectrum, eigen, nand) served natively.
+# Set INFOENGINE_LEGACY_NATIVE=0 to send them through the Flask bridge again.
+if os.environ.get("INFOENGINE_LEGACY_NATIVE", "1").lower() not in ("0", "false", "no", "off"):
+    app.include_router(legacy_router)
+
+# Mount FastAPI under /api (before the catch-all Flask mount)
+app.mount("/api", fastapi_app)
+
+# Mount Flask at root as the compatibility fallback
+app.mount("/", WSGIMiddleware(flask_app))
@@ -1,5 +1,7 @@
 import numpy as np
 
+from backend.organs.signal_context import SignalContext
+
 class ConsciousnessOrgan:
     """
     Consciousness Organ
@@ -10,14 +12,14 @@ class ConsciousnessOrgan:
     def __init__(self, window=32):
         self.window = window
 
-    def analyze(self, signal: np.ndarray):
-        x = np.array(signal, dtype=float)
+    def analyze(self, signal: np.ndarray, context: SignalContext = None):
+        ctx = SignalContext.wrap(signal, context)
 
-        if len(x) < 4:
+        if ctx.signal.size < 4:
             return {"error": "Signal too short for consciousness analysis"}
 
-        # Normalize
-        x_norm = (x - np.mean(x)) / (np.std(x) + 1e-8)
+        # Normalize (shared with other organs through the context)
+        x_norm = ctx.normalized
 
         # --- 1. Prediction error (Friston-style)
         shifted = np.roll(x_norm, 1)
@@ -40,7 +42,7 @@ class ConsciousnessOrgan:
             ignition = float(np.var(x_norm))
 
         # --- 4. Coherence (synchrony)
-        fft_vals = np.fft.rfft(x_norm)
+        fft_vals = ctx.rfft_normalized
         coherence = float(np.mean(np.abs(fft_vals)))
 
         return {
@@ -1,5 +1,7 @@
 import numpy as np
 
+from backend.organs.signal_context import SignalContext
+
 class SelfReferenceOrgan:
     """
     Self-Reference Organ
@@ -11,14 +13,14 @@ class SelfReferenceOrgan:
     def __init__(self, iterations=32):
         self.iterations = iterations
 
-    def analyze(self, signal: np.ndarray):
-        x = np.array(signal, dtype=float)
+    def analyze(self, signal: np.ndarray, context: SignalContext = None):
+        ctx = SignalContext.wrap(signal, context)
 
-        if len(x) == 0:
+        if ctx.signal.size == 0:
             return {"error": "Empty signal"}
 
-        # Normalize
-        x0 = (x - np.mean(x)) / (np.std(x) + 1e-8)
+        # Normalize (shared with other organs through the context)
+        x0 = ctx.normalized
 
         # Recursive self-map: f(x) = tanh(Wx)
         # Use a simple scalar contraction for stability
@@ -29,14 +31,14 @@ class SelfReferenceOrgan:
 
         for _ in range(self.iterations):
             next_state = np.tanh(W * current)
-            history.append(next_state.tolist())
+            history.append(next_state)
 
             # Check for fixed point
             if np.allclose(next_state, current, atol=1e-6):
                 return {
-                    "fixed_point": next_state.tolist(),
+                    "fixed_point": next_state,
                     "iterations": len(history),
-                    "trajectory": history
+                    "trajectory": np.stack(history)
                 }
 
             current = next_state
@@ -45,6 +47,6 @@ class SelfReferenceOrgan:
         return {
             "fixed_point": None,
             "iterations": self.iterations,
-            "trajectory": history,
-            "final_state": current.tolist()
+            "trajectory": np.stack(history) if history else np.empty((0, x0.size)),
+            "final_state": current
         }
\ No newline at end of file
@@ -1,43 +1,152 @@
 import numpy as np
 
+from backend.organs.physics.hamiltonians import HAMILTONIANS, get_hamiltonian
+from backend.organs.physics.symplectic_organ import ordered_sum
+
 class ActionOrgan:
     """
     Action Organ
     - Computes action S and phase S/ħ along a trajectory.
+    - Energies come from the shared Hamiltonian registry.
     """
 
     def __init__(self, hbar=1.0):
         self.hbar = hbar
 
-    def _hamiltonian(self, name, x, p, params=None):
-        if params is None:
-            params = {}
-        m = params.get("m", 1.0)
-        k = params.get("k", 1.0)
+    def accumulator(self, H_name="harmonic"):
+        """ActionAccumulator for a trajectory of `H_name`, fed by the integrator."""
+        return ActionAccumulator(hbar=self.hbar, vector=get_hamiltonian(H_name).vector)
 
-        if name == "harmonic":
-            return 0.5 * p**2 / m + 0.5 * k * x**2
-        if name == "free":
-            return 0.5 * p**2 / m
+    def compute_action_hamiltonian(self, t, x, p, H_name="harmonic", params=None):
+        """
+        S = sum(p dx - H dt) over the trajectory segments. x/p may carry
+        ensemble axes after time and, for vector systems, a trailing
+        coordinate axis (p dx is then summed over coordinates).
+        """
+        if H_name not in HAMILTONIANS:
+            return {"error": f"Unknown Hamiltonian '{H_name}'; available: {sorted(HAMILTONIANS)}"}
+        hamiltonian = get_hamiltonian(H_name)
 
-        return 0.5 * p**2 / m + 0.5 * k * x**2
+        t = np.asarray(t)
+        x = np.asarray(x)
+        p = np.asarray(p)
 
-    def compute_action_hamiltonian(self, t, x, p, H_name="harmonic", params=None):
-        t = np.array(t)
-        x = np.array(x)
-        p = np.array(p)
-        dt = np.diff(t)
+        dx = np.diff(x, axis=0)
+        H_vals = hamiltonian.energy(x[:-1], p[:-1], params)
+        dt = np.diff(t).reshape((-1,) + (1,) * (H_vals.ndim - 1))
 
-        dx = np.diff(x)
-        H_vals = self._hamiltonian(H_name, x[:-1], p[:-1], params)
+        p_dx = p[:-1] * dx
+        if hamiltonian.vector:
+            p_dx = p_dx.sum(axis=-1)
 
-        S_segments = p[:-1] * dx - H_vals * dt
-        S = np.cumsum(S_segments)
+        S_segments = p_dx - H_vals * dt
+        S = np.cumsum(S_segments, axis=0)
         phase = S / self.hbar
 
         return {
-            "time_mid": t[1:].tolist(),
-            "action_segments": S_segments.tolist(),
-            "action_cumulative": S.tolist(),
-            "phase": phase.tolist(),
-        }
\ No newline at end of file
+            "time_mid": t[1:],
+            "action_segments": S_segments,
+            "action_cumulative": S,
+            "phase": phase,
+        }
+
+
+class ActionAccumulator:
+    """
+    Running action S = sum(p dx - H dt), fed blocks of consecutive
+    states while the trajectory is integrated (same left-point rule as
+    compute_action_hamiltonian), so the trajectory is never revisited.
+    S is snapshotted at the rows marked as recorded.
+    """
+
+    def __init__(self, hbar=1.0, vector=False):
+        self.hbar = hbar
+        self.vector = vector
+        self.S = None
+        self.segments = 0
+        self._x = self._p = self._H = None
+        self._marks = []
+
+    def _p_dx(self, p, dx):
+        p_dx = p * dx
+        return p_dx.sum(axis=-1) if self.vector else p_dx
+
+    def add_block(self, xs, ps, energies, dt, marks=()):
+        """
+        Fold in consecutive states xs/ps (rows, ...) with their energies,
+        continuing from the last state of the previous block, and keep S
+        at the row indices `marks`. Segments are added in row order (see
+        ordered_sum), so block and segment boundaries do not change S.
+        """
+        energies = np.asarray(energies, dtype=float)
+        if not len(energies):
+            return
+        segments = np.empty(energies.shape)
+        if self._x is None:
+            # The first state starts the trajectory: no segment ends on it
+            self.S = np.zeros(energies.shape[1:])
+            segments[0] = 0.0
+            self.segments += len(energies) - 1
+        else:
+            segments[0] = self._p_dx(self._p, xs[0] - self._x) - self._H * dt
+            self.segments += len(energies)
+        segments[1:] = self._p_dx(ps[:-1], np.diff(xs, axis=0)) - energies[:-1] * dt
+
+        if len(marks):
+            self._marks.append(ordered_sum(segments, self.S, running=True)[marks])
+        else:
+            ordered_sum(segments, self.S)
+        self._x, self._p, self._H = xs[-1].copy(), ps[-1].copy(), energies[-1].copy()
+
+    def take_marks(self) -> np.ndarray:
+        """Marked values since the last call (checkpointed runs flush them per segment)."""
+        marks = self._cumulative()
+        self._marks = []
+        return marks
+
+    def _cumulative(self) -> np.ndarray:
+        if not self._marks:
+            return np.empty((0,) + np.shape(self.S))
+        return np.concatenate(self._marks)
+
+    def state(self, prefix="") -> dict:
+        """Arrays to checkpoint the accumulator with (see from_state)."""
+        return {
+            f"{prefix}S": np.asarray(self.S),
+            f"{prefix}segments": np.asarray(self.segments),
+            f"{prefix}x": self._x,
+            f"{prefix}p": self._p,
+            f"{prefix}H": np.asarray(self._H),
+        }
+
+    @classmethod
+    def from_state(cls, state, hbar=1.0, vector=False, prefix=""):
+        action = cls(hbar=hbar, vector=vector)
+        action.S = np.array(state[f"{prefix}S"], dtype=float)
+        action.segments = int(state[f"{prefix}segments"])
+        action._x = np.array(state[f"{prefix}x"], dtype=float)
+        action._p = np.array(state[f"{prefix}p"], dtype=float)
+        action._H = np.array(state[f"{prefix}H"], dtype=float)
+        return action
+
+    def result(self, t=None) -> dict:
+        """
+        Totals, plus the cumulative action at the marked steps when
+        their times `t` are given (time_mid / action_segments /
+        action_cumulative / phase, as compute_action_hamiltonian).
+        """
+        S = np.asarray(self.S)
+        result = {
+            "segments": self.segments,
+            "action_total": S,
+            "phase_total": S / self.hbar,
+        }
+        if t is not None and self._marks:
+            cumulative = self._cumulative()
+            result.update({
+                "time_mid": np.asarray(t)[1:],
+                "action_segments": np.diff(cumulative, axis=0),
+                "action_cumulative": cumulative[1:],
+                "phase": cumulative[1:] / self.hbar,
+            })
+        return result
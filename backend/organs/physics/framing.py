@@ -0,0 +1,93 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# ---------------------------------------------------------
+# Segment framing shared by the chunked spectral organs
+# ---------------------------------------------------------
+
+WINDOWS = ("hann", "hamming", "blackman", "bartlett", "boxcar")
+DETRENDS = ("constant", "linear", "none")
+COMPUTE_DTYPES = ("float32", "float64")
+
+
+def get_window(name: str, n: int, dtype="float64") -> np.ndarray:
+    """
+    Periodic (DFT-even) window of length n, as used for spectral
+    estimation: the symmetric window of length n + 1 without its
+    last sample.
+    """
+    if name == "boxcar":
+        return np.ones(n, dtype=dtype)
+    if name not in WINDOWS:
+        raise ValueError(f"window must be one of {list(WINDOWS)}, got '{name}'")
+    build = {
+        "hann": np.hanning,
+        "hamming": np.hamming,
+        "blackman": np.blackman,
+        "bartlett": np.bartlett,
+    }[name]
+    return build(n + 1)[:-1].astype(dtype)
+
+
+def detrend_segments(frames: np.ndarray, kind: str = "constant") -> np.ndarray:
+    """
+    Remove the mean ("constant") or least-squares line ("linear") from
+    each row of a (segments, nperseg) array. Always returns a new array.
+    """
+    if kind == "none":
+        return np.array(frames)
+    if kind not in DETRENDS:
+        raise ValueError(f"detrend must be one of {list(DETRENDS)}, got '{kind}'")
+
+    out = frames - frames.mean(axis=1, keepdims=True)
+    if kind == "linear":
+        t = np.arange(frames.shape[1], dtype=out.dtype)
+        t -= t.mean()
+        slope = (out @ t) / (t @ t)
+        out -= slope[:, np.newaxis] * t
+    return out
+
+
+class SegmentFramer:
+    """
+    Segment Framer
+    Cuts a stream of sample chunks into overlapping fixed-length segments:
+    - segment j starts at sample j * step (step = nperseg - noverlap)
+    - only the tail that can still start a segment is carried between
+      chunks, so memory is bounded by the chunk size
+    """
+
+    def __init__(self, nperseg: int, noverlap: int = 0, dtype="float64"):
+        nperseg, noverlap = int(nperseg), int(noverlap)
+        if nperseg < 1:
+            raise ValueError("nperseg must be at least 1")
+        if not 0 <= noverlap < nperseg:
+            raise ValueError("noverlap must satisfy 0 <= noverlap < nperseg")
+
+        self.nperseg = nperseg
+        self.noverlap = noverlap
+        self.step = nperseg - noverlap
+        self.dtype = np.dtype(dtype)
+        self.samples = 0     # samples consumed
+        self.segments = 0    # segments emitted
+        self._carry = np.empty(0, dtype=self.dtype)
+
+    def push(self, chunk) -> np.ndarray:
+        """
+        Consume a chunk and return the segments it completes as a
+        (k, nperseg) array, possibly a view that is only valid until
+        the next call.
+        """
+        chunk = np.asarray(chunk, dtype=self.dtype).ravel()
+        self.samples += chunk.size
+        buf = np.concatenate([self._carry, chunk]) if self._carry.size else chunk
+
+        if buf.size < self.nperseg:
+            self._carry = buf.copy()
+            return np.empty((0, self.nperseg), dtype=self.dtype)
+
+        frames = sliding_window_view(buf, self.nperseg)[::self.step]
+        self.segments += frames.shape[0]
+        self._carry = buf[frames.shape[0] * self.step:].copy()
+        return frames
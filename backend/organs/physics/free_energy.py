@@ -1,5 +1,7 @@
 import numpy as np
 
+from backend.organs.signal_context import SignalContext
+
 class FreeEnergyOrgan:
     """
     Variational Free Energy Organ
@@ -11,11 +13,11 @@ class FreeEnergyOrgan:
     def __init__(self, sample_rate=1.0):
         self.sample_rate = sample_rate
 
-    def analyze(self, signal: np.ndarray):
-        x = np.array(signal, dtype=float)
+    def analyze(self, signal: np.ndarray, context: SignalContext = None):
+        ctx = SignalContext.wrap(signal, context, sample_rate=self.sample_rate)
 
-        # Normalize signal
-        x_norm = (x - np.mean(x)) / (np.std(x) + 1e-8)
+        # Normalize signal (shared with other organs through the context)
+        x_norm = ctx.normalized
 
         # Approximate posterior q(s) ~ N(mu, sigma)
         mu = np.mean(x_norm)
@@ -0,0 +1,180 @@
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+import numpy as np
+
+
+# ---------------------------------------------------------
+# Hamiltonian registry
+#
+# Every entry is separable, H(x, p) = T(p) + V(x), with vectorized
+# value and gradient functions of (x, p, params). Scalar systems work
+# elementwise on arrays of any shape (one entry per ensemble member);
+# vector systems (vector=True) keep coordinates on the last axis and
+# return one energy per leading index; their per-member params carry a
+# trailing unit axis so they broadcast against the coordinates.
+# ---------------------------------------------------------
+
+class UnknownHamiltonianError(KeyError):
+    """Raised when no Hamiltonian is registered under a name."""
+
+
+@dataclass(frozen=True)
+class Hamiltonian:
+    name: str
+    energy: Callable
+    grad_x: Callable     # dH/dx = dV/dx
+    grad_p: Callable     # dH/dp = dT/dp
+    vector: bool = False
+    dims: int = None     # fixed coordinate count for vector systems (None = any)
+    params: Dict[str, float] = None
+    description: str = ""
+
+    def metadata(self) -> dict:
+        return {
+            "name": self.name,
+            "vector": self.vector,
+            "dims": self.dims,
+            "params": dict(self.params or {}),
+            "description": self.description,
+        }
+
+
+HAMILTONIANS: Dict[str, Hamiltonian] = {}
+
+
+def register_hamiltonian(hamiltonian: Hamiltonian) -> Hamiltonian:
+    HAMILTONIANS[hamiltonian.name] = hamiltonian
+    return hamiltonian
+
+
+def get_hamiltonian(name: str) -> Hamiltonian:
+    try:
+        return HAMILTONIANS[name]
+    except KeyError:
+        raise UnknownHamiltonianError(name) from None
+
+
+def _param(params, key, default):
+    if not params:
+        return default
+    return params.get(key, default)
+
+
+def _kinetic(p, params, axis=None):
+    m = _param(params, "m", 1.0)
+    T = 0.5 * p ** 2 / m
+    return T if axis is None else T.sum(axis=axis)
+
+
+def _velocity(x, p, params):
+    return p / _param(params, "m", 1.0)
+
+
+# ---------------------------------------------------------
+# Scalar systems
+# ---------------------------------------------------------
+
+register_hamiltonian(Hamiltonian(
+    "harmonic",
+    energy=lambda x, p, params: _kinetic(p, params) + 0.5 * _param(params, "k", 1.0) * x ** 2,
+    grad_x=lambda x, p, params: _param(params, "k", 1.0) * x,
+    grad_p=_velocity,
+    params={"m": 1.0, "k": 1.0},
+    description="p^2/2m + k x^2/2",
+))
+
+register_hamiltonian(Hamiltonian(
+    "free",
+    energy=lambda x, p, params: _kinetic(p, params) + 0.0 * x,
+    grad_x=lambda x, p, params: np.zeros_like(x),
+    grad_p=_velocity,
+    params={"m": 1.0},
+    description="p^2/2m",
+))
+
+
+def _pendulum_energy(x, p, params):
+    m, g, l = _param(params, "m", 1.0), _param(params, "g", 1.0), _param(params, "l", 1.0)
+    return 0.5 * p ** 2 / (m * l ** 2) + m * g * l * (1.0 - np.cos(x))
+
+
+register_hamiltonian(Hamiltonian(
+    "pendulum",
+    energy=_pendulum_energy,
+    grad_x=lambda x, p, params: (
+        _param(params, "m", 1.0) * _param(params, "g", 1.0) * _param(params, "l", 1.0) * np.sin(x)
+    ),
+    grad_p=lambda x, p, params: p / (_param(params, "m", 1.0) * _param(params, "l", 1.0) ** 2),
+    params={"m": 1.0, "g": 1.0, "l": 1.0},
+    description="p^2/(2 m l^2) + m g l (1 - cos x)",
+))
+
+register_hamiltonian(Hamiltonian(
+    "anharmonic",
+    energy=lambda x, p, params: (
+        _kinetic(p, params)
+        + 0.5 * _param(params, "k", 1.0) * x ** 2
+        + 0.25 * _param(params, "lam", 1.0) * x ** 4
+    ),
+    grad_x=lambda x, p, params: _param(params, "k", 1.0) * x + _param(params, "lam", 1.0) * x ** 3,
+    grad_p=_velocity,
+    params={"m": 1.0, "k": 1.0, "lam": 1.0},
+    description="p^2/2m + k x^2/2 + lam x^4/4",
+))
+
+
+# ---------------------------------------------------------
+# Vector systems (coordinates on the last axis)
+# ---------------------------------------------------------
+
+def _henon_heiles_energy(x, p, params):
+    lam = _param(params, "lam", 1.0)
+    q1, q2 = x[..., 0:1], x[..., 1:2]
+    V = 0.5 * (q1 ** 2 + q2 ** 2) + lam * (q1 ** 2 * q2 - q2 ** 3 / 3.0)
+    return _kinetic(p, params, axis=-1) + V[..., 0]
+
+
+def _henon_heiles_grad(x, p, params):
+    lam = _param(params, "lam", 1.0)
+    q1, q2 = x[..., 0:1], x[..., 1:2]
+    return np.concatenate([q1 + 2.0 * lam * q1 * q2, q2 + lam * (q1 ** 2 - q2 ** 2)], axis=-1)
+
+
+register_hamiltonian(Hamiltonian(
+    "henon_heiles",
+    energy=_henon_heiles_energy,
+    grad_x=_henon_heiles_grad,
+    grad_p=_velocity,
+    vector=True,
+    dims=2,
+    params={"m": 1.0, "lam": 1.0},
+    description="|p|^2/2m + (x^2 + y^2)/2 + lam (x^2 y - y^3/3)",
+))
+
+
+def _coupled_energy(x, p, params):
+    k, kappa = _param(params, "k", 1.0), _param(params, "kappa", 1.0)
+    springs = np.diff(x, axis=-1)
+    V = 0.5 * k * (x ** 2).sum(axis=-1) + 0.5 * kappa * (springs ** 2).sum(axis=-1)
+    return _kinetic(p, params, axis=-1) + V
+
+
+def _coupled_grad(x, p, params):
+    k, kappa = _param(params, "k", 1.0), _param(params, "kappa", 1.0)
+    springs = kappa * np.diff(x, axis=-1)
+    grad = k * x
+    grad[..., :-1] -= springs
+    grad[..., 1:] += springs
+    return grad
+
+
+register_hamiltonian(Hamiltonian(
+    "coupled",
+    energy=_coupled_energy,
+    grad_x=_coupled_grad,
+    grad_p=_velocity,
+    vector=True,
+    params={"m": 1.0, "k": 1.0, "kappa": 1.0},
+    description="Open chain of n oscillators: sum p^2/2m + k x^2/2 + kappa (x_{i+1} - x_i)^2/2",
+))
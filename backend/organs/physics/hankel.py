@@ -0,0 +1,109 @@
+import numpy as np
+from numpy.linalg import svd
+
+
+# ---------------------------------------------------------
+# Hankel (delay-embedding) matrices without materializing them
+#
+# Shared by the Matrix Pencil pole estimator and Hankel DMD: both
+# factor the L x (N-L) delay matrix of a signal and multiply by its
+# one-sample shift.
+# ---------------------------------------------------------
+
+def fft_length(n: int) -> int:
+    """Smallest 2^a 3^b 5^c >= n; pocketfft transforms these sizes fast."""
+    best = 1 << max(n - 1, 0).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            m = p35
+            while m < n:
+                m *= 2
+            best = min(best, m)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+class HankelOperator:
+    """
+    Products with the delay matrices of a signal without forming them.
+
+    Y0[i, j] = x[i + j] and Y1[i, j] = x[i + j + 1] for i < L, j < N - L,
+    so Y @ v and Y^T @ u are correlations of x with v or u, done by FFT.
+    Blocks are transformed as (k, nfft) rows, so every FFT runs along
+    contiguous memory.
+    """
+
+    def __init__(self, signal: np.ndarray, L: int):
+        self.rows = L
+        self.cols = signal.size - L
+        self.nfft = fft_length(signal.size - 1 + max(self.rows, self.cols))
+        # Spectra of x[:-1] (Y0) and x[1:] (Y1)
+        self._spectra = (
+            np.fft.rfft(signal[:-1], n=self.nfft),
+            np.fft.rfft(signal[1:], n=self.nfft),
+        )
+
+    def _correlate(self, block: np.ndarray, start: int, length: int, shift: int) -> np.ndarray:
+        rows = np.ascontiguousarray(block.T[:, ::-1])
+        block_f = np.fft.rfft(rows, n=self.nfft, axis=-1)
+        block_f *= self._spectra[shift]
+        full = np.fft.irfft(block_f, n=self.nfft, axis=-1)
+        # (length, k) view of the rows; callers only read it
+        return full[:, start:start + length].T
+
+    def matmul(self, V: np.ndarray, shift: int = 0) -> np.ndarray:
+        """Y @ V for V of shape (cols, k)."""
+        return self._correlate(V, self.cols - 1, self.rows, shift)
+
+    def rmatmul(self, U: np.ndarray, shift: int = 0) -> np.ndarray:
+        """Y^T @ U for U of shape (rows, k)."""
+        return self._correlate(U, self.rows - 1, self.cols, shift)
+
+
+def randomized_hankel_svd(
+    hankel: HankelOperator,
+    rank: int = None,
+    max_rank: int = 64,
+    oversample: int = 10,
+    power_iters: int = 2,
+    tol: float = 1e-6,
+    seed: int = 0,
+):
+    """
+    Truncated SVD of Y0 by a randomized range finder (Halko et al.)
+    with power iterations. With no rank given, the sketch grows until
+    the smallest computed singular value drops below tol * S[0] or
+    max_rank is reached. Seeded, so repeated calls agree.
+    """
+    limit = min(hankel.rows, hankel.cols)
+    rng = np.random.default_rng(seed)
+
+    if rank is not None:
+        target = min(int(rank), limit)
+    else:
+        target = min(16, limit, max_rank)
+
+    while True:
+        k = min(target + oversample, limit)
+        Q = hankel.matmul(rng.standard_normal((hankel.cols, k)))
+        Q, _ = np.linalg.qr(Q)
+        for _ in range(power_iters):
+            Z, _ = np.linalg.qr(hankel.rmatmul(Q))
+            Q, _ = np.linalg.qr(hankel.matmul(Z))
+
+        # B = Q^T Y0  (k x cols), computed as (Y0^T Q)^T
+        B = hankel.rmatmul(Q).T
+        Ub, S, Vh = svd(B, full_matrices=False)
+        U = Q @ Ub
+
+        if rank is not None or target >= min(limit, max_rank):
+            break
+        if S[min(target, S.size) - 1] <= tol * S[0]:
+            break
+        target = min(2 * target, limit, max_rank)
+
+    keep = min(target, S.size)
+    return U[:, :keep], S[:keep], Vh[:keep]
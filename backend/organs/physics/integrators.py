@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+
+# ---------------------------------------------------------
+# Symplectic splitting integrators for separable H = T(p) + V(x)
+#
+# Each scheme is a sequence of ("kick", c) / ("drift", d) operations
+# applied with step dt:
+#     kick:  p -= c dt dV/dx(x)
+#     drift: x += d dt dT/dp(p)
+# Higher orders are symmetric compositions of the second-order
+# leapfrog (Yoshida 1990); adjacent operations of the same kind are
+# merged so every stage costs one gradient evaluation.
+# ---------------------------------------------------------
+
+class UnknownIntegratorError(KeyError):
+    """Raised when no integrator is registered under a name."""
+
+
+@dataclass(frozen=True)
+class Integrator:
+    name: str
+    order: int
+    ops: Tuple[Tuple[str, float], ...]
+    description: str = ""
+
+    @property
+    def force_evaluations(self) -> int:
+        """Gradient evaluations per step (the force is reused across kicks at the same x)."""
+        kicks = sum(1 for kind, _ in self.ops if kind == "kick")
+        return min(kicks, len(self.ops) - kicks)
+
+    def metadata(self) -> dict:
+        return {
+            "name": self.name,
+            "order": self.order,
+            "stages": len(self.ops),
+            "force_evaluations": self.force_evaluations,
+            "description": self.description,
+        }
+
+
+def compose(weights, first="kick"):
+    """
+    Operation sequence of the composition S2(w_1 dt) ... S2(w_s dt),
+    with S2 the kick-drift-kick (first="kick") or drift-kick-drift
+    (first="drift") leapfrog.
+    """
+    second = "drift" if first == "kick" else "kick"
+    ops = []
+    for w in weights:
+        for kind, c in ((first, 0.5 * w), (second, w), (first, 0.5 * w)):
+            if ops and ops[-1][0] == kind:
+                ops[-1] = (kind, ops[-1][1] + c)
+            else:
+                ops.append((kind, c))
+    return tuple(ops)
+
+
+def _triple_jump(order):
+    """Weights raising a symmetric scheme of order `order` by two."""
+    w1 = 1.0 / (2.0 - 2.0 ** (1.0 / (order + 1)))
+    return (w1, 1.0 - 2.0 * w1, w1)
+
+
+# Yoshida (1990) sixth-order solution A
+_YOSHIDA6 = (0.784513610477560, 0.235573213359357, -1.17767998417887)
+_YOSHIDA6_W0 = 1.0 - 2.0 * sum(_YOSHIDA6)
+
+INTEGRATORS: Dict[str, Integrator] = {
+    integrator.name: integrator
+    for integrator in (
+        Integrator("leapfrog", 2, compose((1.0,)), "Kick-drift-kick Stormer-Verlet"),
+        Integrator(
+            "forest_ruth", 4, compose(_triple_jump(2), first="drift"),
+            "Forest-Ruth: position-first triple jump of drift-kick-drift",
+        ),
+        Integrator(
+            "yoshida4", 4, compose(_triple_jump(2)),
+            "Yoshida triple jump of kick-drift-kick",
+        ),
+        Integrator(
+            "yoshida6", 6, compose(_YOSHIDA6 + (_YOSHIDA6_W0,) + _YOSHIDA6[::-1]),
+            "Yoshida seven-stage composition (solution A)",
+        ),
+    )
+}
+
+
+def get_integrator(name: str) -> Integrator:
+    try:
+        return INTEGRATORS[name]
+    except KeyError:
+        raise UnknownIntegratorError(name) from None
+
+
+def step(integrator: Integrator, hamiltonian, x, p, dt, params, force=None):
+    """
+    Advance (x, p) in place by one step of `integrator`.
+    `force` is dV/dx at the current x if already known; the force at
+    the new x is returned (None if the step ended on a drift) so the
+    next call can skip re-evaluating it.
+    """
+    for kind, c in integrator.ops:
+        if kind == "kick":
+            if force is None:
+                force = hamiltonian.grad_x(x, p, params)
+            p -= (c * dt) * force
+        else:
+            x += (c * dt) * hamiltonian.grad_p(x, p, params)
+            force = None
+    return force
+
+
+def step_scalar(integrator: Integrator, hamiltonian, x, p, dt, params, force=None):
+    """
+    step() for a single trajectory of a scalar system held in Python
+    floats, which skips NumPy's per-call overhead on 0-d arrays.
+    Returns the new (x, p, force).
+    """
+    for kind, c in integrator.ops:
+        if kind == "kick":
+            if force is None:
+                force = float(hamiltonian.grad_x(x, p, params))
+            p -= (c * dt) * force
+        else:
+            x += (c * dt) * float(hamiltonian.grad_p(x, p, params))
+            force = None
+    return x, p, force
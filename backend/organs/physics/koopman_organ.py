@@ -1,23 +1,268 @@
+from collections import deque
+
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from backend.organs.physics.hankel import HankelOperator, randomized_hankel_svd
 
 class KoopmanOrgan:
-    def __init__(self, sample_rate=1.0):
+    """
+    Koopman Organ
+    Koopman spectrum of a scalar signal from its delay (Hankel) embedding:
+    - method="svd": singular values of the embedding (delays=2 is the
+      original two-column embedding)
+    - method="dmd": exact DMD on the Hankel snapshots, returning Koopman
+      eigenvalues, modes and amplitudes
+    - embeddings deeper than DENSE_MAX_DELAYS use a randomized SVD over
+      FFT Hankel products instead of a dense factorization
+    - singular vectors are only returned with return_vectors=True
+    """
+
+    DENSE_MAX_DELAYS = 256
+    MAX_RANK = 64
+    RANK_TOL = 1e-10
+
+    def __init__(self, sample_rate=1.0, method="svd", delays=2, rank=None, return_vectors=False):
         self.sample_rate = sample_rate
+        self.method = method
+        self.delays = delays
+        self.rank = rank
+        self.return_vectors = return_vectors
 
     def analyze(self, signal: np.ndarray):
-        # Simple Koopman approximation: delay embedding + SVD
         x = np.array(signal, dtype=float)
-        if len(x) < 3:
+        d = int(self.delays)
+
+        if self.method not in ("svd", "dmd"):
+            return {"error": f"method must be 'svd' or 'dmd', got '{self.method}'"}
+        if d < 1:
+            return {"error": "delays must be at least 1"}
+        if len(x) < d + (2 if self.method == "dmd" else 1):
             return {"error": "Signal too short for Koopman analysis"}
 
-        # Delay embedding (2D)
-        X = np.vstack([x[:-1], x[1:]]).T
+        if self.method == "dmd":
+            return self._dmd(x, d)
+
+        # Delay embedding: rows are [x[t], ..., x[t+d-1]]
+        U, S, Vt = self._factor(x, d, embedding=True)
+
+        result = {"singular_values": S}
+        if self.return_vectors:
+            result["left_vectors"] = U
+            result["right_vectors"] = Vt
+        return result
+
+    # ---------------------------------------------------------
+    # Hankel DMD
+    # ---------------------------------------------------------
+    def _dmd(self, x: np.ndarray, d: int):
+        """
+        Exact DMD with snapshots X[:, j] = x[j:j+d], Y[:, j] = x[j+1:j+d+1]:
+            A_r = U_r^T Y V_r S_r^-1,  A_r W = W diag(lambda),
+            modes = Y V_r S_r^-1 W,    amplitudes = modes \\ x[:d]
+        """
+        U, S, Vh = self._factor(x, d)
+        if S.size == 0 or S[0] == 0:
+            return {"error": "Signal has no dynamics to decompose"}
+
+        if self.rank is not None:
+            r = int(min(max(int(self.rank), 1), S.size))
+        else:
+            r = int(np.sum(S > self.RANK_TOL * S[0]))
+        Ur, Sr, Vr = U[:, :r], S[:r], Vh[:r]
+
+        # Y @ V_r^T, without forming Y for deep embeddings
+        if d <= self.DENSE_MAX_DELAYS:
+            YV = sliding_window_view(x, d)[1:].T @ Vr.T
+        else:
+            YV = HankelOperator(x, d).matmul(Vr.T, shift=1)
+        YV /= Sr[np.newaxis, :]
+
+        eigvals, W = np.linalg.eig(Ur.T @ YV)
+        modes = YV @ W
+        amplitudes, _, _, _ = np.linalg.lstsq(modes, x[:d].astype(np.complex128), rcond=None)
+
+        order = np.argsort(-np.abs(amplitudes))
+        eigvals, modes, amplitudes = eigvals[order], modes[:, order], amplitudes[order]
+
+        continuous = np.log(eigvals.astype(np.complex128)) * self.sample_rate
+
+        result = {
+            "eigenvalues": eigvals,
+            "continuous_eigenvalues": continuous,
+            "frequencies": continuous.imag / (2 * np.pi),
+            "growth_rates": continuous.real,
+            "amplitudes": amplitudes,
+            "modes": modes,
+            "singular_values": S,
+            "rank": r,
+            "delays": d,
+        }
+        if self.return_vectors:
+            result["left_vectors"] = Ur
+            result["right_vectors"] = Vr
+        return result
+
+    def _factor(self, x: np.ndarray, d: int, embedding: bool = False):
+        """
+        Thin SVD of the d x (N-d) Hankel snapshot matrix or, with
+        embedding=True, of the (N-d+1) x d row embedding used by
+        method="svd". Dense for shallow embeddings, randomized beyond
+        DENSE_MAX_DELAYS.
+        """
+        if d <= self.DENSE_MAX_DELAYS:
+            windows = sliding_window_view(x, d)
+            if embedding:
+                return np.linalg.svd(windows, full_matrices=False)
+            return np.linalg.svd(windows[:-1].T, full_matrices=False)
+
+        # The operator's Y0 spans x[:-1]; pad by one sample to cover every window
+        source = np.append(x, 0.0) if embedding else x
+        U, S, Vh = randomized_hankel_svd(
+            HankelOperator(source, d),
+            None if self.rank is None else int(self.rank),
+            max_rank=self.MAX_RANK,
+            tol=self.RANK_TOL,
+        )
+        if embedding:
+            return Vh.T, S, U.T
+        return U, S, Vh
+
+
+class OnlineDMD:
+    """
+    Online DMD
+    Koopman spectrum of a live signal, updated sample by sample:
+    - snapshots are Hankel vectors of `delays` samples, x_k -> y_k
+    - after a batch warm-up, each new pair is a rank-one update of the
+      operator A and of P = (X X^T)^-1, O(delays^2) per sample:
+          g = P x / (rho + x^T P x)
+          A += (y - A x) g^T,  P = (P - P x g^T) / rho
+    - `forgetting` rho < 1 discounts old snapshots exponentially;
+      `window` instead keeps the last `window` pairs exactly by
+      downdating the pair that leaves
+    - spectrum() eigendecomposes the delays x delays operator on demand
+    """
+
+    def __init__(self, delays=8, sample_rate=1.0, forgetting=1.0, window=None, warmup=None, ridge=1e-9):
+        if int(delays) < 1:
+            raise ValueError("delays must be at least 1")
+        if not 0.0 < float(forgetting) <= 1.0:
+            raise ValueError("forgetting must be in (0, 1]")
+
+        self.delays = int(delays)
+        self.sample_rate = float(sample_rate)
+        self.forgetting = float(forgetting)
+        self.window = None if window is None else int(window)
+        self.warmup = max(int(warmup) if warmup else 2 * self.delays, self.delays + 1)
+        if self.window is not None and self.window < self.warmup:
+            raise ValueError(f"window must hold at least the warm-up ({self.warmup} snapshots)")
+        self.ridge = float(ridge)
+
+        self.samples = 0
+        self.updates = 0
+        self.A = None
+        self.P = None
+        self._tail = np.empty(0)      # last `delays` samples
+        self._pending = []            # snapshot rows collected during warm-up
+        self._pairs = deque()         # snapshot rows inside the window
+
+    @property
+    def initialized(self) -> bool:
+        return self.A is not None
+
+    @property
+    def nbytes(self) -> int:
+        n = self.delays
+        pairs = self.window if self.window is not None else self.warmup
+        return 8 * (2 * n * n + (pairs + 1) * (n + 1))
+
+    # ---------------------------------------------------------
+    # Updates
+    # ---------------------------------------------------------
+    def update(self, chunk) -> int:
+        """
+        Consume a chunk of samples; returns the total sample count.
+        """
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        self.samples += chunk.size
+        buf = np.concatenate([self._tail, chunk])
+        self._tail = buf[-self.delays:].copy()
+        if buf.size < self.delays + 1:
+            return self.samples
+
+        # Row k holds x_k = row[:-1] and y_k = row[1:]
+        rows = sliding_window_view(buf, self.delays + 1)
+        start = 0
+        if not self.initialized:
+            need = self.warmup - len(self._pending)
+            self._pending.extend(np.array(rows[:need]))
+            start = need
+            if len(self._pending) < self.warmup:
+                return self.samples
+            self._initialize(np.array(self._pending))
+            self.updates = len(self._pending)
+            self._pending = []
+
+        for row in rows[start:]:
+            self._add(row)
+        return self.samples
+
+    def _initialize(self, rows: np.ndarray):
+        X, Y = rows[:, :-1].T, rows[:, 1:].T
+        gram = X @ X.T
+        gram += self.ridge * (np.trace(gram) / self.delays + 1.0) * np.eye(self.delays)
+        self.P = np.linalg.inv(gram)
+        self.A = (Y @ X.T) @ self.P
+        if self.window is not None:
+            self._pairs = deque(np.array(r) for r in rows)
+
+    def _add(self, row: np.ndarray):
+        x, y = row[:-1], row[1:]
+        rho = 1.0 if self.window is not None else self.forgetting
+
+        Px = self.P @ x
+        denom = rho + x @ Px
+        self.A += np.outer(y - self.A @ x, Px / denom)
+        self.P = (self.P - np.outer(Px, Px) / denom) / rho
+        self.updates += 1
+
+        if self.window is not None:
+            self._pairs.append(np.array(row))
+            if len(self._pairs) > self.window:
+                self._remove(self._pairs.popleft())
+
+    def _remove(self, row: np.ndarray):
+        x, y = row[:-1], row[1:]
+        Px = self.P @ x
+        denom = 1.0 - x @ Px
+        if denom <= 1e-10:
+            # Downdate would lose positive definiteness: refit the window
+            self._initialize(np.array(self._pairs))
+            return
+        self.A -= np.outer(y - self.A @ x, Px / denom)
+        self.P = self.P + np.outer(Px, Px) / denom
 
-        # SVD
-        U, S, Vt = np.linalg.svd(X, full_matrices=False)
+    # ---------------------------------------------------------
+    # Query
+    # ---------------------------------------------------------
+    def spectrum(self) -> dict:
+        status = {
+            "samples": self.samples,
+            "updates": self.updates,
+            "delays": self.delays,
+            "initialized": self.initialized,
+        }
+        if not self.initialized:
+            return {**status, "notes": f"Warming up: {self.warmup} snapshots needed"}
 
+        eigvals = np.linalg.eigvals(self.A)
+        eigvals = eigvals[np.argsort(-np.abs(eigvals))]
+        continuous = np.log(eigvals.astype(np.complex128)) * self.sample_rate
         return {
-            "singular_values": S.tolist(),
-            "left_vectors": U.tolist(),
-            "right_vectors": Vt.tolist()
-        }
\ No newline at end of file
+            **status,
+            "eigenvalues": eigvals,
+            "continuous_eigenvalues": continuous,
+            "frequencies": continuous.imag / (2 * np.pi),
+            "growth_rates": continuous.real,
+        }
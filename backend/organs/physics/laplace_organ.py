@@ -1,5 +1,8 @@
 import numpy as np
-from numpy.linalg import lstsq, svd, pinv
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.linalg import lstsq, svd
+
+from backend.organs.physics.hankel import HankelOperator, randomized_hankel_svd
 
 
 class LaplaceOrgan:
@@ -8,20 +11,58 @@ class LaplaceOrgan:
     various pole estimation methods (Prony, Matrix Pencil, Burg/AR, continuous-time).
     """
 
-    def __init__(self, sample_rate: float = 1.0, method: str = "prony", order: int = 10):
+    # Matrix Pencil: dense SVD up to this many samples, FFT-based
+    # randomized SVD beyond (or whenever a rank is requested)
+    MP_DENSE_MAX = 2048
+    MP_MAX_RANK = 64
+    MP_OVERSAMPLE = 10
+    MP_POWER_ITERS = 2
+
+    # Batched Burg: channels per block are chosen so a block holds
+    # about this many samples
+    BURG_BLOCK_SAMPLES = 1 << 16
+
+    AUTO_ORDER_METHODS = ("prony", "burg")
+    ORDER_CRITERIA = ("aic", "mdl", "fpe")
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        method: str = "prony",
+        order: int = 10,
+        pencil: int = None,
+        rank: int = None,
+        max_order: int = 40,
+        criterion: str = "aic",
+    ):
         """
         :param sample_rate: Sampling rate of the input signal.
         :param method: Pole estimation method. One of:
                        "prony", "matrix_pencil", "burg", "continuous_time".
-        :param order: Model order (used by some methods).
+        :param order: Model order (used by some methods), or "auto" for
+                      Prony/Burg to pick it by `criterion`.
+        :param pencil: Matrix Pencil only: cap on the pencil parameter L
+                       (default N // 2).
+        :param rank: Matrix Pencil only: number of singular values kept.
+                     Default: estimated from the spectrum (up to MP_MAX_RANK
+                     on long signals).
+        :param max_order: Largest order tried when order="auto".
+        :param criterion: Order selection criterion: "aic", "mdl" or "fpe".
         """
         self.sample_rate = sample_rate
         self.method = method
         self.order = order
+        self.pencil = pencil
+        self.rank = rank
+        self.max_order = max_order
+        self.criterion = criterion
 
     def analyze(self, signal: np.ndarray) -> dict:
         signal = np.asarray(signal)
 
+        if signal.ndim == 2:
+            return self.analyze_batch(signal)
+
         if signal.ndim != 1 or signal.size < 4:
             return {
                 "poles": [],
@@ -32,15 +73,34 @@ class LaplaceOrgan:
                 "notes": "Signal too short or invalid for Laplace analysis",
             }
 
+        auto = self.order == "auto"
+        if auto:
+            error = self._check_auto_order()
+            if error:
+                return {"error": error}
+
         # Choose pole estimation method
+        selection = None
         if self.method == "prony":
-            poles = self._prony_poles(signal, order=self.order, sample_rate=self.sample_rate)
+            if auto:
+                poles, selection = self._prony_auto_poles(
+                    signal, self.max_order, self.criterion, sample_rate=self.sample_rate
+                )
+            else:
+                poles = self._prony_poles(signal, order=self.order, sample_rate=self.sample_rate)
             method_name = "Prony"
         elif self.method == "matrix_pencil":
-            poles = self._matrix_pencil_poles(signal, sample_rate=self.sample_rate)
+            poles = self._matrix_pencil_poles(
+                signal, sample_rate=self.sample_rate, pencil=self.pencil, rank=self.rank
+            )
             method_name = "Matrix Pencil"
         elif self.method == "burg":
-            poles = self._burg_ar_poles(signal, order=self.order, sample_rate=self.sample_rate)
+            if auto:
+                poles, selection = self._burg_auto_poles(
+                    signal, self.max_order, self.criterion, sample_rate=self.sample_rate
+                )
+            else:
+                poles = self._burg_ar_poles(signal, order=self.order, sample_rate=self.sample_rate)
             method_name = "Burg AR"
         elif self.method == "continuous_time":
             poles = self._continuous_time_poles(signal, order=self.order, sample_rate=self.sample_rate)
@@ -74,14 +134,17 @@ class LaplaceOrgan:
         # Stability class from real part
         stability = self._classify(dominant)
 
-        return {
-            "poles": poles.tolist(),
+        result = {
+            "poles": poles,
             "dominant_pole": complex(dominant),
             "damping_ratio": float(damping),
             "growth_rate": growth,
             "stability_class": stability,
             "notes": f"{method_name} method, dominant pole={dominant:.3f}, stability={stability}",
         }
+        if selection is not None:
+            result["order_selection"] = selection
+        return result
 
     # ------------------------------------------------------------------
     # Advanced pole estimation methods
@@ -115,11 +178,22 @@ class LaplaceOrgan:
 
         return p_poles
 
-    def _matrix_pencil_poles(self, signal: np.ndarray, sample_rate: float):
+    def _matrix_pencil_poles(self, signal: np.ndarray, sample_rate: float, pencil: int = None, rank: int = None):
         """
         Matrix Pencil method for damped exponential decomposition.
+
+        Short signals use a dense SVD of the Hankel pencil. Long signals
+        (or an explicit rank) never form the L x (N-L) matrices: Hankel
+        products are correlations, evaluated by FFT, and feed a randomized
+        SVD, so the cost is O(k N log N) for k kept singular values.
+        Raises ValueError for rank < 1 or pencil < 2.
         """
-        signal = np.asarray(signal)
+        if rank is not None and rank < 1:
+            raise ValueError(f"rank must be at least 1, got {rank}")
+        if pencil is not None and pencil < 2:
+            raise ValueError(f"pencil must be at least 2, got {pencil}")
+
+        signal = np.asarray(signal, dtype=float)
         N = signal.size
 
         if N < 6:
@@ -127,28 +201,38 @@ class LaplaceOrgan:
 
         # Pencil parameter
         L = N // 2
+        if pencil is not None:
+            L = int(min(pencil, L))
 
-        # Build Hankel matrices
-        # Y0: columns are signal[i:i+L]
-        # Y1: shifted by one
-        Y0 = np.column_stack([signal[i:i + L] for i in range(N - L)])
-        Y1 = np.column_stack([signal[i + 1:i + L + 1] for i in range(N - L)])
-
-        # SVD
-        U, S, Vh = svd(Y0, full_matrices=False)
+        if rank is None and N <= self.MP_DENSE_MAX:
+            U, S, Vh = self._dense_hankel_svd(signal, L)
+            Y1 = sliding_window_view(signal, L)[1:].T
+            Y1_Vr = None
+        else:
+            hankel = HankelOperator(signal, L)
+            U, S, Vh = self._randomized_hankel_svd(hankel, rank)
+            Y1 = None
+            Y1_Vr = hankel.matmul(Vh.T, shift=1)
 
         # Rank selection: keep dominant singular values
-        tol = 1e-6 * S[0] if S.size > 0 else 0.0
-        r = int(np.sum(S > tol))
+        if rank is None:
+            tol = 1e-6 * S[0] if S.size > 0 else 0.0
+            r = int(np.sum(S > tol))
+        else:
+            r = int(min(rank, S.size))
         if r == 0:
             return np.array([], dtype=np.complex128)
 
         Ur = U[:, :r]
-        Sr = np.diag(S[:r])
+        Sr = S[:r]
         Vr = Vh[:r, :]
 
         # Solve: A ≈ Ur^T Y1 Vr^T Sr^{-1}
-        A = Ur.T @ Y1 @ Vr.T @ pinv(Sr)
+        if Y1_Vr is None:
+            A = Ur.T @ Y1 @ Vr.T
+        else:
+            A = Ur.T @ Y1_Vr[:, :r]
+        A = A / Sr[np.newaxis, :]
 
         eigvals = np.linalg.eigvals(A)
 
@@ -158,6 +242,22 @@ class LaplaceOrgan:
 
         return poles
 
+    def _dense_hankel_svd(self, signal: np.ndarray, L: int):
+        """
+        Thin SVD of Y0, whose columns are signal[i:i+L] for i < N-L.
+        """
+        # Zero-copy view; the SVD makes the only copy
+        Y0 = sliding_window_view(signal, L)[:-1].T
+        return svd(Y0, full_matrices=False)
+
+    def _randomized_hankel_svd(self, hankel: HankelOperator, rank: int = None):
+        return randomized_hankel_svd(
+            hankel, rank,
+            max_rank=self.MP_MAX_RANK,
+            oversample=self.MP_OVERSAMPLE,
+            power_iters=self.MP_POWER_ITERS,
+        )
+
     def _burg_ar_poles(self, signal: np.ndarray, order: int, sample_rate: float):
         """
         Burg's method for AR model. Poles are roots of AR polynomial.
@@ -168,6 +268,23 @@ class LaplaceOrgan:
         if N <= order + 1:
             return np.array([], dtype=np.complex128)
 
+        a = None
+        for _, a, _ in self._burg_lattice(signal, order):
+            pass
+
+        # AR polynomial roots → discrete poles
+        z_poles = np.roots(a)
+
+        dt = 1.0 / sample_rate
+        p_poles = np.log(z_poles) / dt
+
+        return p_poles
+
+    def _burg_lattice(self, signal: np.ndarray, order: int):
+        """
+        Burg's lattice recursion. Yields (k, a, E) after every order k:
+        the AR polynomial padded to order + 1 and the prediction error power.
+        """
         # Initialize forward and backward errors
         ef = signal[1:].astype(np.complex128).copy()
         eb = signal[:-1].astype(np.complex128).copy()
@@ -176,7 +293,7 @@ class LaplaceOrgan:
         a = np.zeros(order + 1, dtype=np.complex128)
         a[0] = 1.0
 
-        E = np.sum(signal ** 2) / N + 1e-12
+        E = np.sum(signal ** 2) / signal.size + 1e-12
 
         for k in range(1, order + 1):
             num = -2.0 * np.dot(eb.conj(), ef)
@@ -194,16 +311,99 @@ class LaplaceOrgan:
 
             E *= (1 - np.abs(gamma) ** 2 + 1e-12)
 
+            yield k, a, float(np.real(E))
+
             if ef.size < 2 or eb.size < 2:
                 break
 
-        # AR polynomial roots → discrete poles
-        z_poles = np.roots(a)
+    # ------------------------------------------------------------------
+    # Automatic order selection
+    # ------------------------------------------------------------------
+
+    def _check_auto_order(self):
+        if self.method not in self.AUTO_ORDER_METHODS:
+            return f"order='auto' supports methods {list(self.AUTO_ORDER_METHODS)}, got '{self.method}'"
+        if self.criterion not in self.ORDER_CRITERIA:
+            return f"criterion must be one of {list(self.ORDER_CRITERIA)}, got '{self.criterion}'"
+        if int(self.max_order) < 1:
+            return "max_order must be at least 1"
+        return None
 
+    def _select_order(self, errors: np.ndarray, n: int, criterion: str):
+        """
+        Score prediction error powers E_1..E_P for n effective samples.
+        Returns (selected order, order_selection dict).
+        """
+        orders = np.arange(1, errors.size + 1)
+        E = np.maximum(errors, np.finfo(float).tiny)
+
+        if criterion == "aic":
+            values = n * np.log(E) + 2 * orders
+        elif criterion == "mdl":
+            values = n * np.log(E) + orders * np.log(n)
+        else:
+            values = E * (n + orders + 1) / np.maximum(n - orders - 1, 1)
+
+        selected = int(orders[np.argmin(values)])
+        return selected, {
+            "criterion": criterion,
+            "orders": orders,
+            "values": values,
+            "prediction_error": errors,
+            "selected_order": selected,
+        }
+
+    def _burg_auto_poles(self, signal: np.ndarray, max_order: int, criterion: str, sample_rate: float):
+        """
+        One Burg recursion up to max_order; every lower order is a
+        by-product, so all candidates cost the same as the largest.
+        """
+        signal = np.asarray(signal)
+        N = signal.size
+        max_order = min(int(max_order), N - 3)
+        if max_order < 1:
+            return np.array([], dtype=np.complex128), None
+
+        polys, errors = [], []
+        for k, a, E in self._burg_lattice(signal, max_order):
+            polys.append(a[:k + 1].copy())
+            errors.append(E)
+
+        selected, selection = self._select_order(np.array(errors), N, criterion)
+
+        z_poles = np.roots(polys[selected - 1])
         dt = 1.0 / sample_rate
-        p_poles = np.log(z_poles) / dt
+        return np.log(z_poles) / dt, selection
 
-        return p_poles
+    def _prony_auto_poles(self, signal: np.ndarray, max_order: int, criterion: str, sample_rate: float):
+        """
+        Prony fits of every order up to max_order from one QR of the
+        regression matrix [x[t-1] .. x[t-P] | x[t]] over t = P..N-1.
+        With nested columns, the residual of order k is the tail
+        ||R[k:, P]|| and its coefficients solve R[:k, :k] a = R[:k, P].
+        """
+        signal = np.asarray(signal, dtype=float)
+        N = signal.size
+        P = min(int(max_order), (N - 1) // 2)
+        if P < 1:
+            return np.array([], dtype=np.complex128), None
+
+        # Rows [x[t], x[t-1], ..., x[t-P]] for t = P..N-1, reordered to [H | Y]
+        lagged = sliding_window_view(signal, P + 1)[:, ::-1]
+        M = lagged[:, np.r_[1:P + 1, 0]]
+
+        R = np.linalg.qr(M, mode="r")
+        rhs = R[:, P]
+        rss = np.cumsum((rhs ** 2)[::-1])[::-1]
+
+        n = N - P
+        selected, selection = self._select_order(rss[1:] / n, n, criterion)
+
+        a, _, _, _ = lstsq(R[:selected, :selected], rhs[:selected], rcond=None)
+        z_poles = np.roots(np.concatenate(([1.0], -a)))
+
+        dt = 1.0 / sample_rate
+        return np.log(z_poles) / dt, selection
 
     def _continuous_time_poles(self, signal: np.ndarray, order: int, sample_rate: float):
         """
@@ -260,6 +460,240 @@ class LaplaceOrgan:
 
         return poles
 
+    # ------------------------------------------------------------------
+    # Batched (channels x samples) analysis
+    # ------------------------------------------------------------------
+
+    STABILITY_CLASSES = ("stable", "marginal", "unstable", "undefined")
+
+    def analyze_batch(self, signals: np.ndarray) -> dict:
+        """
+        Analyze a (channels, samples) array in one call.
+
+        Prony and Burg are vectorized across channels (stacked normal
+        equations / lattice recursion, stacked companion eigvals);
+        the other methods loop over channels. Results are columnar:
+        poles is (channels, max_poles), NaN-padded where a channel has
+        fewer poles, and every other field has one entry per channel.
+        """
+        signals = np.asarray(signals)
+        C, N = signals.shape
+
+        if N < 4 or C == 0:
+            return self._batch_result(
+                np.full((C, 0), np.nan, dtype=np.complex128),
+                "Signal too short or invalid for Laplace analysis",
+            )
+
+        auto = self.order == "auto"
+        if auto:
+            error = self._check_auto_order()
+            if error:
+                return {"error": error}
+
+        selected = None
+        if auto:
+            # Order selection is per channel; each channel reuses one fit
+            fit = self._prony_auto_poles if self.method == "prony" else self._burg_auto_poles
+            per_channel, selected = [], []
+            for x in signals:
+                channel_poles, selection = fit(x, self.max_order, self.criterion, sample_rate=self.sample_rate)
+                per_channel.append(channel_poles)
+                selected.append(selection["selected_order"] if selection else 0)
+            poles = self._pad_poles(per_channel)
+        elif self.method == "prony":
+            poles = self._prony_poles_batch(signals, order=self.order, sample_rate=self.sample_rate)
+        elif self.method == "burg":
+            poles = self._burg_ar_poles_batch(signals, order=self.order, sample_rate=self.sample_rate)
+        else:
+            poles = self._pad_poles([self._single_channel_poles(x) for x in signals])
+
+        method_name = {
+            "prony": "Prony",
+            "burg": "Burg AR",
+            "matrix_pencil": "Matrix Pencil",
+            "continuous_time": "Continuous-Time LS",
+        }.get(self.method, "FFT proxy")
+
+        result = self._batch_result(poles, f"{method_name} method, {C} channels")
+        if selected is not None:
+            result["selected_order"] = np.array(selected)
+        return result
+
+    @staticmethod
+    def _pad_poles(per_channel) -> np.ndarray:
+        per_channel = [np.asarray(p, dtype=np.complex128) for p in per_channel]
+        width = max((p.size for p in per_channel), default=0)
+        poles = np.full((len(per_channel), width), np.nan, dtype=np.complex128)
+        for c, p in enumerate(per_channel):
+            poles[c, :p.size] = p
+        return poles
+
+    def _single_channel_poles(self, signal: np.ndarray):
+        if self.method == "matrix_pencil":
+            return self._matrix_pencil_poles(
+                signal, sample_rate=self.sample_rate, pencil=self.pencil, rank=self.rank
+            )
+        if self.method == "continuous_time":
+            return self._continuous_time_poles(signal, order=self.order, sample_rate=self.sample_rate)
+        return self._fft_proxy_poles(signal, sample_rate=self.sample_rate)
+
+    def _batch_result(self, poles: np.ndarray, notes: str) -> dict:
+        C = poles.shape[0]
+        valid = ~np.isnan(poles)
+        has_poles = valid.any(axis=1)
+
+        magnitude = np.where(valid, np.abs(np.nan_to_num(poles)), -1.0)
+        dominant = np.zeros(C, dtype=np.complex128)
+        if poles.shape[1]:
+            dominant = poles[np.arange(C), np.argmax(magnitude, axis=1)]
+        dominant = np.where(has_poles, dominant, 0.0)
+
+        sigma = dominant.real
+        omega = dominant.imag
+        damping = -sigma / (np.sqrt(sigma ** 2 + omega ** 2) + 1e-12)
+
+        eps = 1e-9
+        stability = np.where(sigma < -eps, "stable", np.where(np.abs(sigma) <= eps, "marginal", "unstable"))
+        stability = np.where(has_poles, stability, "undefined")
+
+        return {
+            "channels": C,
+            "poles": poles,
+            "dominant_pole": dominant,
+            "damping_ratio": damping,
+            "growth_rate": sigma,
+            "stability_class": stability.tolist(),
+            "stability_summary": {cls: int(np.sum(stability == cls)) for cls in self.STABILITY_CLASSES},
+            "notes": notes,
+        }
+
+    def _prony_poles_batch(self, signals: np.ndarray, order: int, sample_rate: float):
+        """
+        Prony's method over all channels via the covariance normal
+        equations. The Gram matrix of [Y | H] comes from order + 1 dot
+        products per channel, extended down each diagonal by the samples
+        entering and leaving the window, so H is never formed; a stacked
+        eigendecomposition gives the minimum-norm solution.
+        """
+        C, N = signals.shape
+        if N <= order + 1:
+            return np.full((C, 0), np.nan, dtype=np.complex128)
+
+        signals = signals.astype(float, copy=False)
+        T = N - order
+
+        # G[c, i, j] = sum_t x[c, t + order - i] x[c, t + order - j]:
+        # index 0 is Y, indices 1..order are the columns of H in _prony_poles
+        G = np.empty((C, order + 1, order + 1))
+        Y = signals[:, order:]
+        for d in range(order + 1):
+            i = np.arange(order - d)
+            enter = signals[:, order - 1 - i] * signals[:, order - 1 - i - d]
+            leave = signals[:, N - 1 - i] * signals[:, N - 1 - i - d]
+            diagonal = np.empty((C, order + 1 - d))
+            diagonal[:, 0] = np.einsum("ct,ct->c", Y, signals[:, order - d:N - d])
+            diagonal[:, 1:] = diagonal[:, :1] + np.cumsum(enter - leave, axis=1)
+            G[:, np.arange(order + 1 - d), np.arange(d, order + 1)] = diagonal
+            G[:, np.arange(d, order + 1), np.arange(order + 1 - d)] = diagonal
+
+        w, V = np.linalg.eigh(G[:, 1:, 1:])
+        keep = w > np.finfo(float).eps * max(T, order) * w[:, -1:]
+        inv_w = np.where(keep, 1.0 / np.where(keep, w, 1.0), 0.0)
+        coeffs = np.einsum("cjk,cj->ck", V, G[:, 1:, 0]) * inv_w
+        a = np.einsum("cjk,ck->cj", V, coeffs)
+
+        # Roots of z^order - a1 z^(order-1) - ... - a_order
+        z_poles = self._companion_roots(np.concatenate([np.ones((C, 1)), -a], axis=1))
+
+        dt = 1.0 / sample_rate
+        return np.log(z_poles.astype(np.complex128)) / dt
+
+    def _burg_ar_poles_batch(self, signals: np.ndarray, order: int, sample_rate: float):
+        """
+        Burg's lattice recursion advanced for several channels at once,
+        in blocks of about BURG_BLOCK_SAMPLES samples so the lattice
+        errors stay in cache across orders.
+        """
+        C, N = signals.shape
+        if N <= order + 1:
+            return np.full((C, 0), np.nan, dtype=np.complex128)
+
+        rows = max(1, self.BURG_BLOCK_SAMPLES // N)
+        a = np.concatenate([
+            self._burg_lattice_batch(signals[start:start + rows], order)
+            for start in range(0, C, rows)
+        ])
+
+        z_poles = self._companion_roots(a)
+
+        dt = 1.0 / sample_rate
+        return np.log(z_poles.astype(np.complex128)) / dt
+
+    def _burg_lattice_batch(self, signals: np.ndarray, order: int) -> np.ndarray:
+        """
+        AR polynomials (channels, order + 1) of _burg_lattice, one per row.
+        Real signals stay in real arithmetic, the error power is carried
+        by recursion, and the errors are updated in place, so each order
+        costs one reduction and one pass over the lattice.
+        """
+        C = signals.shape[0]
+        dtype = np.complex128 if np.iscomplexobj(signals) else np.float64
+        conj = np.conj if dtype is np.complex128 else (lambda v: v)
+
+        ef = signals[:, 1:].astype(dtype)
+        eb = signals[:, :-1].astype(dtype)
+        forward = np.empty_like(ef)
+        backward = np.empty_like(eb)
+
+        # sum |ef|^2 + |eb|^2, the denominator of every reflection coefficient
+        den = np.einsum("ct,ct->c", conj(ef), ef).real + np.einsum("ct,ct->c", conj(eb), eb).real
+
+        a = np.zeros((C, order + 1), dtype=dtype)
+        a[:, 0] = 1.0
+
+        for k in range(1, order + 1):
+            gamma = -2.0 * np.einsum("ct,ct->c", conj(eb), ef) / (den + 1e-12)
+            g = gamma[:, None]
+
+            a[:, 1:k] += g * conj(a[:, k - 1:0:-1])
+            a[:, k] = gamma
+
+            # Burg's gamma leaves (1 - |gamma|^2) of the error power; the
+            # first forward and last backward terms drop off the lattice
+            den = (
+                (1.0 - np.abs(gamma) ** 2) * den
+                - np.abs(ef[:, 0] + gamma * eb[:, 0]) ** 2
+                - np.abs(eb[:, -1] + conj(gamma) * ef[:, -1]) ** 2
+            )
+
+            # ef[t] <- ef[t+1] + gamma eb[t+1], eb[t] <- eb[t] + conj(gamma) ef[t]
+            L = ef.shape[1] - 1
+            np.multiply(g, eb[:, 1:], out=forward[:, :L])
+            np.multiply(conj(g), ef[:, :-1], out=backward[:, :L])
+            ef, eb = ef[:, 1:], eb[:, :-1]
+            ef += forward[:, :L]
+            eb += backward[:, :L]
+
+            if L < 2:
+                break
+
+        return a
+
+    @staticmethod
+    def _companion_roots(poly: np.ndarray) -> np.ndarray:
+        """
+        Roots of monic polynomials, one per row, via stacked companion
+        matrix eigenvalues (np.roots does the same for a single row).
+        """
+        C, n = poly.shape
+        degree = n - 1
+        companion = np.zeros((C, degree, degree), dtype=poly.dtype)
+        companion[:, 0, :] = -poly[:, 1:]
+        if degree > 1:
+            companion[:, np.arange(1, degree), np.arange(degree - 1)] = 1.0
+        return np.linalg.eigvals(companion)
+
     # ------------------------------------------------------------------
     # Derived metrics
     # ------------------------------------------------------------------
@@ -278,4 +712,5 @@ class LaplaceOrgan:
             return "stable"
         if abs(sigma) <= eps:
             return "marginal"
-        return "unstable"
\ No newline at end of file
+        return "unstable"
+
@@ -0,0 +1,171 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from backend.organs.physics.laplace_organ import LaplaceOrgan
+
+
+class LaplaceTrackerOrgan(LaplaceOrgan):
+    """
+    Laplace Tracker Organ
+    Time-varying pole tracking over sliding windows (window, hop in samples):
+    - one Prony or Burg fit per window, reported as a time series of
+      dominant pole, damping ratio, growth rate and stability class
+    - both fits are read off the lagged product matrix
+      Phi[i, j] = sum_n x[n-i] x[n-j], which is slid by `hop` rows per
+      window (O(hop * order^2)) and rebuilt every `refresh` windows to
+      bound rounding drift
+    - per-window solves and root finding run in stacked blocks
+    """
+
+    TRACK_METHODS = ("prony", "burg")
+    BLOCK = 4096
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        method: str = "burg",
+        order: int = 10,
+        window: int = 1024,
+        hop: int = 256,
+        refresh: int = 64,
+    ):
+        super().__init__(sample_rate=sample_rate, method=method, order=order)
+        self.window = int(window)
+        self.hop = int(hop)
+        self.refresh = max(int(refresh), 1)
+
+    def analyze(self, signal: np.ndarray) -> dict:
+        x = np.asarray(signal, dtype=float)
+
+        if self.order == "auto":
+            return {"error": "Tracking needs a fixed order"}
+        p, W, hop = int(self.order), self.window, self.hop
+
+        if self.method not in self.TRACK_METHODS:
+            return {"error": f"Tracking supports methods {list(self.TRACK_METHODS)}, got '{self.method}'"}
+        if x.ndim != 1:
+            return {"error": "Tracking needs a one-dimensional signal"}
+        if p < 1 or hop < 1 or W < p + 3:
+            return {"error": "Need order >= 1, hop >= 1 and window >= order + 3"}
+        if x.size < W:
+            return {"error": f"Signal of {x.size} samples is shorter than the window ({W})"}
+
+        starts = np.arange(0, x.size - W + 1, hop)
+
+        # Row r is the lag vector z_{r+p} = [x[r+p], x[r+p-1], ..., x[r]]
+        Z = sliding_window_view(x, p + 1)[:, ::-1]
+
+        blocks = []
+        phi = None
+        for first in range(0, starts.size, self.BLOCK):
+            block = starts[first:first + self.BLOCK]
+            phis, phi = self._slide_products(Z, block, first, phi)
+            if self.method == "prony":
+                poly = self._prony_from_products(phis)
+            else:
+                poly = self._burg_from_products(phis, self._head_vectors(x, block))
+            blocks.append(self._companion_roots(poly))
+
+        z_poles = np.concatenate(blocks).astype(np.complex128)
+        dt = 1.0 / self.sample_rate
+        result = self._batch_result(np.log(z_poles) / dt, "")
+
+        del result["channels"], result["poles"]
+        method_name = "Prony" if self.method == "prony" else "Burg AR"
+        return {
+            "time": (starts + W / 2.0) * dt,
+            "start_time": starts * dt,
+            **result,
+            "windows": int(starts.size),
+            "window": W,
+            "hop": hop,
+            "notes": f"{method_name} tracking, {starts.size} windows of {W} samples, hop {hop}",
+        }
+
+    # ------------------------------------------------------------------
+    # Sliding lagged products
+    # ------------------------------------------------------------------
+
+    def _slide_products(self, Z: np.ndarray, starts: np.ndarray, first: int, phi):
+        """
+        Phi over rows n = s+p .. s+W-1 of each window starting at s.
+        Consecutive windows differ by `hop` rows leaving and `hop` rows
+        entering, so each step costs O(hop * order^2).
+        """
+        W, hop, p = self.window, self.hop, int(self.order)
+        rows = W - p
+        phis = np.empty((starts.size, p + 1, p + 1))
+
+        for i, s in enumerate(starts):
+            index = first + i
+            if phi is None or index % self.refresh == 0 or hop > rows:
+                block = Z[s:s + rows]
+                phi = block.T @ block
+            else:
+                old = Z[s - hop:s]
+                new = Z[s - hop + rows:s + rows]
+                phi = phi - old.T @ old + new.T @ new
+            phis[i] = phi
+
+        return phis, phi
+
+    def _head_vectors(self, x: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """
+        Lag vectors z_n for local n = 1..p-1 at the start of each window,
+        zero-padded past the window edge: (windows, p-1, p+1).
+        Burg's order-k sums run over n = k..W-1, so they need these
+        rows on top of Phi (which starts at n = p).
+        """
+        p = int(self.order)
+        n = np.arange(1, p)[:, None]
+        lag = np.arange(p + 1)[None, :]
+        offset = n - lag
+        valid = offset >= 0
+        return np.where(valid, x[starts[:, None, None] + np.clip(offset, 0, None)], 0.0)
+
+    # ------------------------------------------------------------------
+    # Fits from products
+    # ------------------------------------------------------------------
+
+    def _prony_from_products(self, phis: np.ndarray) -> np.ndarray:
+        """
+        Prony normal equations Phi[1:, 1:] a = Phi[1:, 0] per window.
+        Returns the AR polynomials [1, -a].
+        """
+        G = phis[:, 1:, 1:]
+        b = phis[:, 1:, 0]
+        a = np.einsum("wij,wj->wi", np.linalg.pinv(G, hermitian=True), b)
+        return np.concatenate([np.ones((a.shape[0], 1)), -a], axis=1)
+
+    def _burg_from_products(self, phis: np.ndarray, heads: np.ndarray) -> np.ndarray:
+        """
+        Burg's recursion in covariance form: at order k the forward and
+        backward error energies and their cross term are quadratic forms
+        of the current polynomial in Phi_k (sums over n = k..W-1), so
+        no error sequences are formed. Matches LaplaceOrgan._burg_ar_poles
+        on real signals.
+        """
+        count, p = phis.shape[0], int(self.order)
+
+        # Phi_1 = Phi + sum_{n=1}^{p-1} z_n z_n^T; Phi_{k+1} = Phi_k - z_k z_k^T
+        phi_k = phis + np.einsum("wni,wnj->wij", heads, heads)
+
+        a = np.zeros((count, p + 1))
+        a[:, 0] = 1.0
+        for k in range(1, p + 1):
+            if k > 1:
+                head = heads[:, k - 2]
+                phi_k = phi_k - np.einsum("wi,wj->wij", head, head)
+
+            u = a[:, :k]          # forward error over lags 0..k-1
+            v = a[:, k - 1::-1]   # backward error over lags 1..k
+            ff = np.einsum("wi,wij,wj->w", u, phi_k[:, :k, :k], u)
+            bb = np.einsum("wi,wij,wj->w", v, phi_k[:, 1:k + 1, 1:k + 1], v)
+            fb = np.einsum("wi,wij,wj->w", u, phi_k[:, :k, 1:k + 1], v)
+            gamma = -2.0 * fb / (ff + bb + 1e-12)
+
+            a_prev = a.copy()
+            a[:, 1:k] = a_prev[:, 1:k] + gamma[:, None] * a_prev[:, k - 1:0:-1]
+            a[:, k] = gamma
+
+        return a
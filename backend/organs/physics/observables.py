@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+import numpy as np
+
+
+# ---------------------------------------------------------
+# Phase-space observables for Poisson brackets
+#
+# Functions take vector-form states, x and p of shape (..., n), and
+# return the value (...) and the gradients dI/dq, dI/dp (..., n).
+# The Hamiltonian itself is not listed here: PoissonOrgan takes it
+# from the Hamiltonian registry.
+# ---------------------------------------------------------
+
+class UnknownObservableError(KeyError):
+    """Raised when no observable is registered under a name."""
+
+
+@dataclass(frozen=True)
+class Observable:
+    name: str
+    value: Callable
+    grad: Callable       # (x, p, params) -> (dI/dq, dI/dp)
+    dims: int = None     # required coordinate count (None = any)
+    description: str = ""
+
+
+OBSERVABLES: Dict[str, Observable] = {}
+
+
+def register_observable(observable: Observable) -> Observable:
+    OBSERVABLES[observable.name] = observable
+    return observable
+
+
+def get_observable(name: str) -> Observable:
+    try:
+        return OBSERVABLES[name]
+    except KeyError:
+        raise UnknownObservableError(name) from None
+
+
+def _mass(params):
+    return params.get("m", 1.0) if params else 1.0
+
+
+register_observable(Observable(
+    "momentum",
+    value=lambda x, p, params: p.sum(axis=-1),
+    grad=lambda x, p, params: (np.zeros_like(x), np.ones_like(p)),
+    description="Total momentum sum p_i",
+))
+
+register_observable(Observable(
+    "kinetic_energy",
+    value=lambda x, p, params: (0.5 * p ** 2 / _mass(params)).sum(axis=-1),
+    grad=lambda x, p, params: (np.zeros_like(x), p / _mass(params)),
+    description="sum p_i^2 / 2m",
+))
+
+
+def _angular_grad(x, p, params):
+    dq = np.concatenate([p[..., 1:2], -p[..., 0:1]], axis=-1)
+    dp = np.concatenate([-x[..., 1:2], x[..., 0:1]], axis=-1)
+    return dq, dp
+
+
+register_observable(Observable(
+    "angular_momentum",
+    value=lambda x, p, params: x[..., 0] * p[..., 1] - x[..., 1] * p[..., 0],
+    grad=_angular_grad,
+    dims=2,
+    description="L = x p_y - y p_x (planar systems)",
+))
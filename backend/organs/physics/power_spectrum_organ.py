@@ -1,17 +1,137 @@
 import numpy as np
 
+from backend.organs.physics.framing import COMPUTE_DTYPES, SegmentFramer, detrend_segments, get_window
+from backend.organs.signal_context import SignalContext
+
 class PowerSpectrumOrgan:
-    def __init__(self, sample_rate=1.0):
+    # Whole-signal Welch input is fed to the accumulator in chunks of this many samples
+    CHUNK = 1 << 20
+
+    def __init__(
+        self,
+        sample_rate=1.0,
+        method="periodogram",
+        nperseg=256,
+        noverlap=None,
+        window="hann",
+        detrend="constant",
+        compute_dtype="float64",
+    ):
         self.sample_rate = sample_rate
+        self.method = method
+        self.nperseg = nperseg
+        self.noverlap = noverlap
+        self.window = window
+        self.detrend = detrend
+        self.compute_dtype = compute_dtype
+
+    def welch(self) -> "WelchSpectrum":
+        return WelchSpectrum(
+            sample_rate=self.sample_rate,
+            nperseg=self.nperseg,
+            noverlap=self.noverlap,
+            window=self.window,
+            detrend=self.detrend,
+            compute_dtype=self.compute_dtype,
+        )
+
+    def analyze(self, signal: np.ndarray, context: SignalContext = None):
+        if self.method == "welch":
+            return self._analyze_welch(signal)
+        if self.method != "periodogram":
+            return {"error": f"method must be 'periodogram' or 'welch', got '{self.method}'"}
 
-    def analyze(self, signal: np.ndarray):
-        dt = 1.0 / self.sample_rate
+        ctx = SignalContext.wrap(signal, context, sample_rate=self.sample_rate)
 
-        fft_vals = np.fft.rfft(signal)
-        freqs = np.fft.rfftfreq(len(signal), d=dt)
+        fft_vals = ctx.rfft
+        freqs = ctx.rfftfreq(self.sample_rate)
         power = np.abs(fft_vals) ** 2
 
         return {
-            "frequencies": freqs.tolist(),
-            "power": power.tolist()
-        }
\ No newline at end of file
+            "frequencies": freqs,
+            "power": power
+        }
+
+    def _analyze_welch(self, signal: np.ndarray):
+        signal = np.asarray(signal)
+        try:
+            welch = self.welch()
+        except ValueError as exc:
+            return {"error": str(exc)}
+
+        for start in range(0, signal.size, self.CHUNK):
+            welch.update(signal[start:start + self.CHUNK])
+        return welch.result()
+
+
+class WelchSpectrum:
+    """
+    Welch Spectrum
+    Averaged-periodogram power spectral density over a stream of chunks:
+    - segments of nperseg samples overlapping by noverlap (default half)
+    - per-segment detrend ("constant", "linear", "none") and window
+    - every chunk's segments go through one batched rfft and only their
+      summed power is kept, so memory is bounded by the chunk size
+    - compute_dtype="float32" frames and transforms in single precision;
+      the running sum stays float64
+    """
+
+    def __init__(
+        self,
+        sample_rate=1.0,
+        nperseg=256,
+        noverlap=None,
+        window="hann",
+        detrend="constant",
+        compute_dtype="float64",
+    ):
+        if compute_dtype not in COMPUTE_DTYPES:
+            raise ValueError(f"compute_dtype must be one of {list(COMPUTE_DTYPES)}, got '{compute_dtype}'")
+        if detrend not in ("constant", "linear", "none"):
+            raise ValueError(f"detrend must be 'constant', 'linear' or 'none', got '{detrend}'")
+
+        nperseg = int(nperseg)
+        noverlap = nperseg // 2 if noverlap is None else int(noverlap)
+
+        self.sample_rate = float(sample_rate)
+        self.framer = SegmentFramer(nperseg, noverlap, dtype=compute_dtype)
+        self.window_name = window
+        self.window = get_window(window, nperseg, dtype=compute_dtype)
+        self.detrend = detrend
+        self.compute_dtype = compute_dtype
+        self._power_sum = np.zeros(nperseg // 2 + 1, dtype=np.float64)
+
+    def update(self, chunk):
+        frames = self.framer.push(chunk)
+        if frames.shape[0] == 0:
+            return
+        segments = detrend_segments(frames, self.detrend)
+        segments *= self.window
+        spectra = np.fft.rfft(segments, axis=1)
+        power = spectra.real ** 2 + spectra.imag ** 2
+        self._power_sum += power.sum(axis=0, dtype=np.float64)
+
+    def result(self) -> dict:
+        framer = self.framer
+        if framer.segments == 0:
+            return {"error": f"Signal of {framer.samples} samples is shorter than one segment ({framer.nperseg})"}
+
+        # One-sided density: |X|^2 / (fs * sum(w^2)), doubled except at DC/Nyquist
+        scale = self.sample_rate * float(np.sum(self.window.astype(np.float64) ** 2))
+        psd = self._power_sum / (framer.segments * scale)
+        if framer.nperseg % 2:
+            psd[1:] *= 2
+        else:
+            psd[1:-1] *= 2
+
+        return {
+            "frequencies": np.fft.rfftfreq(framer.nperseg, d=1.0 / self.sample_rate),
+            "power": psd,
+            "segments": framer.segments,
+            "samples": framer.samples,
+            "nperseg": framer.nperseg,
+            "noverlap": framer.noverlap,
+            "window": self.window_name,
+            "detrend": self.detrend,
+            "compute_dtype": self.compute_dtype,
+        }
@@ -0,0 +1,154 @@
+import numpy as np
+
+from backend.organs.physics.framing import COMPUTE_DTYPES, SegmentFramer, detrend_segments, get_window
+
+
+class SpectrogramOrgan:
+    """
+    Spectrogram Organ
+    Short-time Fourier transform power over strided windows:
+    - frames are strided views of the signal, transformed in one batched
+      rfft per block of `frames_per_block` frames
+    - scaling "power" (one-sided density, as WelchSpectrum) or "db"
+    - fmin/fmax keep only a frequency band
+    - push()/iter_blocks() produce time-ordered blocks, so a long
+      recording never needs the full spectrogram in memory
+    """
+
+    SCALINGS = ("power", "db")
+    DB_FLOOR = 1e-20
+    # Whole-signal input is framed in chunks of this many samples
+    CHUNK = 1 << 20
+
+    def __init__(
+        self,
+        sample_rate=1.0,
+        nperseg=256,
+        noverlap=None,
+        window="hann",
+        detrend="constant",
+        scaling="db",
+        fmin=None,
+        fmax=None,
+        frames_per_block=256,
+        compute_dtype="float64",
+    ):
+        self.sample_rate = float(sample_rate)
+        self.nperseg = int(nperseg)
+        self.noverlap = self.nperseg // 2 if noverlap is None else int(noverlap)
+        self.window_name = window
+        self.detrend = detrend
+        self.scaling = scaling
+        self.fmin = fmin
+        self.fmax = fmax
+        self.frames_per_block = max(int(frames_per_block), 1)
+        self.compute_dtype = compute_dtype
+
+    # ---------------------------------------------------------
+    # Setup
+    # ---------------------------------------------------------
+    def validate(self):
+        """Raise ValueError for unusable parameters."""
+        if self.scaling not in self.SCALINGS:
+            raise ValueError(f"scaling must be one of {list(self.SCALINGS)}, got '{self.scaling}'")
+        if self.compute_dtype not in COMPUTE_DTYPES:
+            raise ValueError(f"compute_dtype must be one of {list(COMPUTE_DTYPES)}, got '{self.compute_dtype}'")
+        if self.fmin is not None and self.fmax is not None and self.fmin > self.fmax:
+            raise ValueError("fmin must not exceed fmax")
+        self.new_framer()
+        get_window(self.window_name, self.nperseg)
+        detrend_segments(np.zeros((0, self.nperseg)), self.detrend)
+
+    def new_framer(self) -> SegmentFramer:
+        return SegmentFramer(self.nperseg, self.noverlap, dtype=self.compute_dtype)
+
+    def frequencies(self) -> np.ndarray:
+        return np.fft.rfftfreq(self.nperseg, d=1.0 / self.sample_rate)[self._band()]
+
+    def header(self) -> dict:
+        """Metadata shared by every block of one spectrogram."""
+        return {
+            "frequencies": self.frequencies(),
+            "sample_rate": self.sample_rate,
+            "nperseg": self.nperseg,
+            "noverlap": self.noverlap,
+            "window": self.window_name,
+            "scaling": self.scaling,
+        }
+
+    def _band(self) -> slice:
+        freqs = np.fft.rfftfreq(self.nperseg, d=1.0 / self.sample_rate)
+        lo = 0 if self.fmin is None else int(np.searchsorted(freqs, self.fmin, side="left"))
+        hi = freqs.size if self.fmax is None else int(np.searchsorted(freqs, self.fmax, side="right"))
+        return slice(lo, hi)
+
+    # ---------------------------------------------------------
+    # Blocks
+    # ---------------------------------------------------------
+    def push(self, framer: SegmentFramer, chunk):
+        """
+        Feed one chunk; yield the spectrogram blocks it completes as
+        {"times": (k,), "power": (k, bins)}.
+        """
+        frames = framer.push(chunk)
+        first = framer.segments - frames.shape[0]
+
+        window = get_window(self.window_name, self.nperseg, dtype=self.compute_dtype)
+        band = self._band()
+        for start in range(0, frames.shape[0], self.frames_per_block):
+            block = frames[start:start + self.frames_per_block]
+            yield {
+                "times": self._times(first + start, block.shape[0], framer.step),
+                "power": self._power(block, window, band),
+            }
+
+    def iter_blocks(self, chunks):
+        framer = self.new_framer()
+        for chunk in chunks:
+            yield from self.push(framer, chunk)
+
+    def _times(self, first: int, count: int, step: int) -> np.ndarray:
+        # Frame centres in seconds
+        index = np.arange(first, first + count)
+        return (index * step + self.nperseg / 2.0) / self.sample_rate
+
+    def _power(self, frames: np.ndarray, window: np.ndarray, band: slice) -> np.ndarray:
+        segments = detrend_segments(frames, self.detrend)
+        segments *= window
+        spectra = np.fft.rfft(segments, axis=1)[:, band]
+        power = spectra.real ** 2 + spectra.imag ** 2
+
+        # One-sided density: doubled except at DC and Nyquist
+        scale = np.full(self.nperseg // 2 + 1, 2.0)
+        scale[0] = 1.0
+        if self.nperseg % 2 == 0:
+            scale[-1] = 1.0
+        scale /= self.sample_rate * float(np.sum(window.astype(np.float64) ** 2))
+        power = power * scale[band]
+
+        if self.scaling == "db":
+            return 10.0 * np.log10(np.maximum(power, self.DB_FLOOR))
+        return power
+
+    # ---------------------------------------------------------
+    # Whole-signal analysis
+    # ---------------------------------------------------------
+    def analyze(self, signal: np.ndarray):
+        signal = np.asarray(signal)
+        try:
+            self.validate()
+        except ValueError as exc:
+            return {"error": str(exc)}
+        if signal.ndim != 1:
+            return {"error": "Spectrogram needs a one-dimensional signal"}
+
+        chunks = (signal[i:i + self.CHUNK] for i in range(0, signal.size, self.CHUNK))
+        blocks = list(self.iter_blocks(chunks))
+        if not blocks:
+            return {"error": f"Signal of {signal.size} samples is shorter than one segment ({self.nperseg})"}
+
+        return {
+            **self.header(),
+            "times": np.concatenate([b["times"] for b in blocks]),
+            "power": np.concatenate([b["power"] for b in blocks]),
+        }
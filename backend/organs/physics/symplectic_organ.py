@@ -1,75 +1,434 @@
+from bisect import bisect_right
+
 import numpy as np
 
+from backend.organs.physics.hamiltonians import HAMILTONIANS, get_hamiltonian
+from backend.organs.physics.integrators import INTEGRATORS, get_integrator, step, step_scalar
+
 class SymplecticOrgan:
     """
     Symplectic Organ
     - Integrates Hamiltonian dynamics using a symplectic integrator.
+    - Hamiltonians come from the shared registry (harmonic, free,
+      pendulum, anharmonic, henon_heiles, coupled); vector systems take
+      x0/p0 with coordinates on the last axis.
+    - integrator: "leapfrog" (2nd order), "forest_ruth"/"yoshida4"
+      (4th) or "yoshida6" (6th), reaching a given energy error with
+      far fewer steps than leapfrog.
+    - Ensemble mode: array x0/p0 (and per-member params) integrate
+      together as vectorized steps, with energy statistics
+      accumulated on the fly and trajectories only on request.
+    - record_every / summary_only bound the output of long runs.
     """
 
-    def __init__(self, dt=0.01, steps=1000):
+    # Steps are integrated in blocks of at most BLOCK_STEPS states;
+    # energies, energy statistics and action are reduced once per block.
+    # BLOCK_VALUES caps a block's buffers (and the temporaries computed
+    # from them) at 64 KiB, under the allocator's 128 KiB mmap threshold:
+    # larger temporaries are page-faulted in on every evaluation.
+    BLOCK_STEPS = 4096
+    BLOCK_VALUES = 1 << 13
+
+    def __init__(self, dt=0.01, steps=1000, integrator="leapfrog"):
         self.dt = dt
         self.steps = steps
+        self.integrator = integrator
+
+    def _resolve(self, H_name, integrator):
+        """Registry entries for a request, or an error message."""
+        integrator = integrator or self.integrator
+        if H_name not in HAMILTONIANS:
+            return None, None, f"Unknown Hamiltonian '{H_name}'; available: {sorted(HAMILTONIANS)}"
+        if integrator not in INTEGRATORS:
+            return None, None, f"Unknown integrator '{integrator}'; available: {sorted(INTEGRATORS)}"
+        return get_hamiltonian(H_name), get_integrator(integrator), None
+
+    def _ensemble_params(self, hamiltonian, params):
+        """
+        Per-member parameters: list values become arrays broadcasting
+        against the ensemble (with a trailing axis for vector systems).
+        """
+        if not params:
+            return params
+        return {
+            key: (
+                np.asarray(value, dtype=float)[..., np.newaxis] if hamiltonian.vector
+                else np.asarray(value, dtype=float)
+            ) if np.ndim(value) else value
+            for key, value in params.items()
+        }
+
+    def _state_shape(self, hamiltonian, x0, p0, params):
+        """
+        Broadcast shape of the state; raises ValueError when the inputs
+        do not fit together or a vector system has the wrong coordinates.
+        """
+        try:
+            shape = np.broadcast_shapes(
+                np.shape(x0), np.shape(p0), *(np.shape(v) for v in (params or {}).values())
+            )
+        except ValueError:
+            raise ValueError("x0, p0 and per-member params must broadcast to one ensemble shape") from None
+
+        if hamiltonian.vector:
+            if not shape:
+                raise ValueError(f"'{hamiltonian.name}' needs x0/p0 with a coordinate axis")
+            if hamiltonian.dims is not None and shape[-1] != hamiltonian.dims:
+                raise ValueError(f"'{hamiltonian.name}' has {hamiltonian.dims} coordinates, got {shape[-1]}")
+        return shape
+
+    def recorded_steps(self, record_every: int) -> np.ndarray:
+        """Step indices kept with a stride: 0, k, 2k, ... and always the last."""
+        index = np.arange(0, self.steps + 1, int(record_every))
+        if index[-1] != self.steps:
+            index = np.append(index, self.steps)
+        return index
+
+    def prepare(self, x0, p0, H_name="harmonic", params=None, integrator=None):
+        """
+        Resolve a run up front: (hamiltonian, integrator, x0, p0, params)
+        with the state broadcast and per-member params shaped. Raises
+        ValueError for unknown names or mismatched shapes.
+        """
+        hamiltonian, scheme, error = self._resolve(H_name, integrator)
+        if error:
+            raise ValueError(error)
+        params = self._ensemble_params(hamiltonian, params)
+        shape = self._state_shape(hamiltonian, x0, p0, params)
+        x0 = np.broadcast_to(np.asarray(x0, dtype=float), shape).copy()
+        p0 = np.broadcast_to(np.asarray(p0, dtype=float), shape).copy()
+        return hamiltonian, scheme, x0, p0, params
 
-    def _hamiltonian(self, name, x, p, params=None):
-        if params is None:
-            params = {}
-        m = params.get("m", 1.0)
-        k = params.get("k", 1.0)
-
-        if name == "harmonic":
-            return 0.5 * p**2 / m + 0.5 * k * x**2
-        if name == "free":
-            return 0.5 * p**2 / m
-
-        return 0.5 * p**2 / m + 0.5 * k * x**2
-
-    def _dH_dx(self, name, x, p, params=None):
-        if params is None:
-            params = {}
-        k = params.get("k", 1.0)
-        if name == "free":
-            return np.zeros_like(x)
-        return k * x
-
-    def _dH_dp(self, name, x, p, params=None):
-        if params is None:
-            params = {}
-        m = params.get("m", 1.0)
-        return p / m
-
-    def _integrate(self, x0, p0, H_name, params):
+    def segment(self, x, p, hamiltonian, params, integrator, steps, record_every=1,
+                stats=None, action=None, include_initial=False, start=0):
+        """
+        Advance a prepared state by `steps` steps; checkpointed runs
+        integrate in segments. Returns (times, xs, ps, energies) of the
+        recorded rows, the starting state excluded unless
+        include_initial. Times count steps from `start`, the steps
+        already done, so they do not depend on where segments split.
+        """
+        organ = SymplecticOrgan(dt=self.dt, steps=steps, integrator=self.integrator)
+        return organ._integrate(
+            x, p, hamiltonian, params, integrator,
+            record_every=record_every, stats=stats, action=action, include_initial=include_initial,
+            start=start,
+        )
+
+    def _integrate(self, x0, p0, hamiltonian, params, integrator, record_every=1, stats=None, action=None,
+                   include_initial=True, start=0):
+        """
+        Step the chosen splitting integrator for one trajectory or a
+        whole ensemble. x0/p0 may be arrays; every member advances in
+        the same NumPy operations, while a single scalar trajectory
+        steps in plain floats (step_scalar). The force at the end of a
+        step is reused by the next one, so a step costs
+        integrator.force_evaluations gradient evaluations.
+
+        States are written into a preallocated block buffer (states
+        too wide to batch are observed step by step, without a copy);
+        the energies of a block are evaluated in one call and fed to
+        `stats` (an EnergyStats) and `action` (an ActionAccumulator),
+        so memory stays bounded by the block size for any run length.
+
+        Returns (times, xs, ps, energies) of every `record_every`-th
+        state; record_every=None keeps only the final state and returns
+        the final time. include_initial=False skips the starting state,
+        which a previous segment has already observed; times are
+        offset by `start` steps.
+        """
         dt = self.dt
-        steps = self.steps
+        steps = int(self.steps)
 
-        x = np.zeros(steps + 1)
-        p = np.zeros(steps + 1)
-        t = np.linspace(0, steps * dt, steps + 1)
+        x = np.array(x0, dtype=float)
+        p = np.array(p0, dtype=float)
 
-        x[0] = x0
-        p[0] = p0
+        recorded = self.recorded_steps(record_every) if record_every else np.array([steps])
+        if not include_initial:
+            recorded = recorded[recorded > 0]
+        recorded_list = recorded.tolist()
+        xs = np.empty((recorded.size,) + x.shape)
+        ps = np.empty((recorded.size,) + p.shape)
+        es = np.empty((recorded.size,) + np.shape(hamiltonian.energy(x, p, params)))
+        row = 0
 
-        for n in range(steps):
-            dH_dx_n = self._dH_dx(H_name, x[n], p[n], params)
-            p_half = p[n] - 0.5 * dt * dH_dx_n
+        def observe(block_x, block_p, first):
+            """Feed consecutive states of steps first, first + 1, ... to the observers."""
+            nonlocal row
+            energies = hamiltonian.energy(block_x, block_p, params)
+            if stats is not None:
+                stats.add_block(energies)
+            end = bisect_right(recorded_list, first + len(energies) - 1, lo=row)
+            keep = recorded[row:end] - first if end > row else ()
+            if action is not None:
+                action.add_block(block_x, block_p, energies, dt, marks=keep)
+            if end > row:
+                xs[row:end] = block_x[keep]
+                ps[row:end] = block_p[keep]
+                es[row:end] = energies[keep]
+                row = end
 
-            dH_dp_half = self._dH_dp(H_name, x[n], p_half, params)
-            x[n + 1] = x[n] + dt * dH_dp_half
+        if include_initial:
+            observe(x[np.newaxis], p[np.newaxis], 0)
 
-            dH_dx_next = self._dH_dx(H_name, x[n + 1], p_half, params)
-            p[n + 1] = p_half - 0.5 * dt * dH_dx_next
+        block = max(1, min(self.BLOCK_STEPS, self.BLOCK_VALUES // max(x.size, 1)))
+        if block > 1:
+            bx = np.empty((block,) + x.shape)
+            bp = np.empty((block,) + p.shape)
+        if x.ndim == 0:
+            xf, pf = float(x), float(p)
 
-        return t, x, p
+        force = None
+        done = 0
+        while done < steps:
+            n = min(block, steps - done)
+            if block == 1:
+                force = step(integrator, hamiltonian, x, p, dt, params, force)
+                observe(x[np.newaxis], p[np.newaxis], done + 1)
+            elif x.ndim == 0:
+                for i in range(n):
+                    xf, pf, force = step_scalar(integrator, hamiltonian, xf, pf, dt, params, force)
+                    bx[i] = xf
+                    bp[i] = pf
+                observe(bx[:n], bp[:n], done + 1)
+            else:
+                for i in range(n):
+                    force = step(integrator, hamiltonian, x, p, dt, params, force)
+                    bx[i] = x
+                    bp[i] = p
+                observe(bx[:n], bp[:n], done + 1)
+            done += n
 
-    def analyze(self, x0, p0, H_name="harmonic", params=None):
-        t, x, p = self._integrate(x0, p0, H_name, params)
-        H_vals = self._hamiltonian(H_name, x, p, params)
+        if not record_every:
+            return (start + steps) * dt, xs[-1], ps[-1], es[-1]
+        return (start + recorded) * dt, xs, ps, es
 
-        return {
-            "time": t.tolist(),
-            "x": x.tolist(),
-            "p": p.tolist(),
+    def analyze(
+        self,
+        x0,
+        p0,
+        H_name="harmonic",
+        params=None,
+        return_trajectories=None,
+        integrator=None,
+        record_every=1,
+        summary_only=False,
+        action=None,
+    ):
+        """
+        One trajectory (or an ensemble, for array inputs).
+        - record_every=k keeps every k-th state (and the last);
+          energy statistics still cover every step
+        - summary_only=True keeps no trajectory: final state plus
+          energy statistics, so output size does not grow with steps
+        - action: an ActionAccumulator fed in the same pass
+        """
+        hamiltonian, scheme, error = self._resolve(H_name, integrator)
+        if error:
+            return {"error": error}
+        if int(self.steps) < 0:
+            return {"error": "steps must be non-negative"}
+        if int(record_every) < 1:
+            return {"error": "record_every must be at least 1"}
+        record_every = int(record_every)
+
+        core = 1 if hamiltonian.vector else 0
+        if np.ndim(x0) > core or np.ndim(p0) > core or any(np.ndim(v) for v in (params or {}).values()):
+            return self.analyze_ensemble(
+                x0, p0, H_name, params,
+                bool(return_trajectories) and not summary_only, integrator, record_every, action,
+            )
+
+        try:
+            shape = self._state_shape(hamiltonian, x0, p0, params)
+        except ValueError as exc:
+            return {"error": str(exc)}
+
+        # Full-resolution runs report the recorded energies; decimated and
+        # summary runs add statistics over every step
+        stats = EnergyStats() if summary_only or record_every > 1 or action is not None else None
+        t, x, p, H_vals = self._integrate(
+            np.broadcast_to(np.asarray(x0, dtype=float), shape),
+            np.broadcast_to(np.asarray(p0, dtype=float), shape),
+            hamiltonian, params, scheme,
+            record_every=None if summary_only else record_every,
+            stats=stats,
+            action=action,
+        )
+
+        result = {
             "hamiltonian": H_name,
-            "energy_values": H_vals.tolist(),
-            "energy_mean": float(np.mean(H_vals)),
-            "energy_std": float(np.std(H_vals)),
-        }
\ No newline at end of file
+            "integrator": scheme.name,
+            "steps": self.steps,
+            "dt": self.dt,
+        }
+        if summary_only:
+            result.update({"final_time": t, "final_x": x, "final_p": p})
+        else:
+            result.update({
+                "time": t,
+                "x": x,
+                "p": p,
+                "record_every": record_every,
+                "energy_values": H_vals,
+                "energy_mean": float(np.mean(H_vals)),
+                "energy_std": float(np.std(H_vals)),
+            })
+        if stats is not None:
+            result.update({key: float(value) for key, value in stats.summary().items()})
+        return result
+
+    def analyze_ensemble(
+        self,
+        x0,
+        p0,
+        H_name="harmonic",
+        params=None,
+        return_trajectories=False,
+        integrator=None,
+        record_every=1,
+        action=None,
+    ):
+        """
+        Integrate many initial conditions (and per-member params) at once.
+        Returns per-member energy statistics; the trajectories (every
+        `record_every`-th step, members after the time axis) only with
+        return_trajectories=True.
+        """
+        hamiltonian, scheme, error = self._resolve(H_name, integrator)
+        if error:
+            return {"error": error}
+        if int(self.steps) < 0:
+            return {"error": "steps must be non-negative"}
+        if int(record_every) < 1:
+            return {"error": "record_every must be at least 1"}
+        record_every = int(record_every)
+
+        params = self._ensemble_params(hamiltonian, params)
+        try:
+            shape = self._state_shape(hamiltonian, x0, p0, params)
+        except ValueError as exc:
+            return {"error": str(exc)}
+
+        x0 = np.broadcast_to(np.asarray(x0, dtype=float), shape)
+        p0 = np.broadcast_to(np.asarray(p0, dtype=float), shape)
+        members = shape[:-1] if hamiltonian.vector else shape
+
+        stats = EnergyStats()
+        t, x, p, _ = self._integrate(
+            x0, p0, hamiltonian, params, scheme,
+            record_every=record_every if return_trajectories else None, stats=stats, action=action,
+        )
+        final_x, final_p = (x[-1], p[-1]) if return_trajectories else (x, p)
+
+        result = {
+            "hamiltonian": H_name,
+            "integrator": scheme.name,
+            "members": int(np.prod(members)),
+            "steps": self.steps,
+            "dt": self.dt,
+            "final_x": final_x,
+            "final_p": final_p,
+            **stats.summary(),
+        }
+        if return_trajectories:
+            result.update({"time": t, "x": x, "p": p, "record_every": record_every})
+        return result
+
+
+def ordered_sum(rows, total, running=False):
+    """
+    Add rows[0], rows[1], ... into `total` in place, strictly in row
+    order, so a sum does not depend on where a run was cut into blocks
+    or checkpointed segments. With running=True the partial sums are
+    returned as well. `rows` is overwritten.
+    """
+    if len(rows) == 1 and not running:
+        total += rows[0]
+        return total
+    rows[0] += total
+    if running or rows[0].size == 1:
+        # add.reduce sums a contiguous axis pairwise, not in order
+        np.cumsum(rows, axis=0, out=rows)
+        total[...] = rows[-1]
+        return rows if running else total
+    np.add.reduce(rows, axis=0, out=total)
+    return total
+
+
+class EnergyStats:
+    """
+    Running per-member energy statistics: mean and std (accumulated
+    relative to the initial energy for precision), extremes and drift.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.initial = None
+
+    def add_block(self, energies):
+        """
+        Fold in a (rows, ...) block of consecutive energies; sums are
+        taken in row order (see ordered_sum).
+        """
+        energies = np.asarray(energies, dtype=float)
+        if not len(energies):
+            return
+        if self.initial is None:
+            self.initial = np.array(energies[0])
+            self._sum = np.zeros_like(self.initial)
+            self._sumsq = np.zeros_like(self.initial)
+            self._min = self.initial.copy()
+            self._max = self.initial.copy()
+        delta = energies - self.initial
+        ordered_sum(delta * delta, self._sumsq)
+        ordered_sum(delta, self._sum)
+        if len(energies) == 1:
+            low = high = energies[0]
+        else:
+            low, high = energies.min(axis=0), energies.max(axis=0)
+        np.minimum(self._min, low, out=self._min)
+        np.maximum(self._max, high, out=self._max)
+        self.final = energies[-1]
+        self.count += len(energies)
+
+    def state(self, prefix="") -> dict:
+        """Arrays to checkpoint the statistics with (see from_state)."""
+        return {
+            f"{prefix}count": np.asarray(self.count),
+            f"{prefix}initial": self.initial,
+            f"{prefix}sum": self._sum,
+            f"{prefix}sumsq": self._sumsq,
+            f"{prefix}min": self._min,
+            f"{prefix}max": self._max,
+            f"{prefix}final": self.final,
+        }
+
+    @classmethod
+    def from_state(cls, state, prefix=""):
+        stats = cls()
+        stats.count = int(state[f"{prefix}count"])
+        stats.initial = np.array(state[f"{prefix}initial"], dtype=float)
+        stats._sum = np.array(state[f"{prefix}sum"], dtype=float)
+        stats._sumsq = np.array(state[f"{prefix}sumsq"], dtype=float)
+        stats._min = np.array(state[f"{prefix}min"], dtype=float)
+        stats._max = np.array(state[f"{prefix}max"], dtype=float)
+        stats.final = np.array(state[f"{prefix}final"], dtype=float)
+        return stats
+
+    def summary(self) -> dict:
+        mean_delta = self._sum / self.count
+        variance = np.maximum(self._sumsq / self.count - mean_delta ** 2, 0.0)
+        max_drift = np.maximum(self._max - self.initial, self.initial - self._min)
+        relative = max_drift / np.maximum(np.abs(self.initial), 1e-300)
+        return {
+            "energy_initial": self.initial,
+            "energy_final": self.final,
+            "energy_mean": self.initial + mean_delta,
+            "energy_std": np.sqrt(variance),
+            "energy_min": self._min,
+            "energy_max": self._max,
+            "energy_max_drift": max_drift,
+            "energy_relative_drift": relative,
+            "ensemble_max_relative_drift": float(np.max(relative)) if relative.size else 0.0,
+        }
@@ -1,16 +1,18 @@
 import numpy as np
 import cmath
 
+from backend.organs.signal_context import SignalContext
+
 class ZetaGammaOrgan:
     def __init__(self, sample_rate=1.0):
         self.sample_rate = sample_rate
 
-    def analyze(self, signal: np.ndarray):
-        x = np.array(signal, dtype=float)
+    def analyze(self, signal: np.ndarray, context: SignalContext = None):
+        ctx = SignalContext.wrap(signal, context, sample_rate=self.sample_rate)
 
         # Basic stats
-        mean_val = float(np.mean(x))
-        variance = float(np.var(x))
+        mean_val = ctx.mean
+        variance = ctx.var
 
         # Riemann zeta samples (Euler sum approximation)
         zeta_samples = []
@@ -3,6 +3,9 @@
 from typing import Dict, Any, List
 import numpy as np
 
+from backend.organs.physics.hamiltonians import HAMILTONIANS, get_hamiltonian
+from backend.organs.physics.observables import OBSERVABLES, get_observable
+
 class PoissonOrgan:
     """
     Poisson Organ
@@ -13,8 +16,15 @@ class PoissonOrgan:
     Core operations:
     - compute_bracket(f, g, q, p)
     - hamiltonian_flow(H, q, p)
+    - bracket_matrix(observables, q, p): {f, g} for every pair of
+      registered observables (and the Hamiltonian) at many points in
+      one vectorized call
+    - check_invariants(q, p, H): {I, H} along a whole trajectory, the
+      conserved-quantity test for SymplecticOrgan output
     """
 
+    DEFAULT_TOL = 1e-9
+
     def __init__(self):
         self.name = "PoissonOrgan"
         self.version = "1.0.0"
@@ -37,7 +47,7 @@ class PoissonOrgan:
         self,
         f_grad: Dict[str, List[float]],
         g_grad: Dict[str, List[float]]
-    ) -> float:
+    ):
         """
         Computes {f, g} = Σ_i (df/dq_i * dg/dp_i - df/dp_i * dg/dq_i)
 
@@ -45,16 +55,26 @@ class PoissonOrgan:
             f_grad: {"q": [...], "p": [...]}
             g_grad: {"q": [...], "p": [...]}
 
+        Gradients may be stacked as (..., n) arrays, e.g. (pairs, points, n);
+        leading axes broadcast and one bracket per index is returned.
+        Raises ValueError when the coordinate axes differ.
+
         Returns:
-            float: Poisson bracket value
+            float (or array): Poisson bracket value(s)
         """
 
-        dq_f = np.array(f_grad["q"])
-        dp_f = np.array(f_grad["p"])
-        dq_g = np.array(g_grad["q"])
-        dp_g = np.array(g_grad["p"])
+        dq_f = np.asarray(f_grad["q"], dtype=float)
+        dp_f = np.asarray(f_grad["p"], dtype=float)
+        dq_g = np.asarray(g_grad["q"], dtype=float)
+        dp_g = np.asarray(g_grad["p"], dtype=float)
 
-        return float(np.dot(dq_f, dp_g) - np.dot(dp_f, dq_g))
+        grads = (dq_f, dp_f, dq_g, dp_g)
+        if any(g.ndim == 0 for g in grads) or len({g.shape[-1] for g in grads}) != 1:
+            shapes = [g.shape for g in grads]
+            raise ValueError(f"Gradients need one coordinate axis of equal length, got shapes {shapes}")
+
+        value = np.sum(dq_f * dp_g - dp_f * dq_g, axis=-1)
+        return float(value) if value.ndim == 0 else value
 
     # ---------------------------------------------------------
     # Hamiltonian vector field
@@ -77,20 +97,150 @@ class PoissonOrgan:
             "dp_dt": dp_dt
         }
 
+    # ---------------------------------------------------------
+    # Observables on phase-space points
+    # ---------------------------------------------------------
+    def _vector_form(self, hamiltonian, q, p, params):
+        """
+        States (and per-member params) with a coordinate axis: scalar
+        systems get a trailing axis of length one.
+        """
+        q = np.asarray(q, dtype=float)
+        p = np.asarray(p, dtype=float)
+        if hamiltonian.vector:
+            return q, p, params
+        vparams = {
+            key: np.asarray(value, dtype=float)[..., np.newaxis] if np.ndim(value) else value
+            for key, value in (params or {}).items()
+        }
+        return q[..., np.newaxis], p[..., np.newaxis], vparams
+
+    def observable_gradients(self, name, q, p, H_name="harmonic", params=None):
+        """
+        (value, dI/dq, dI/dp) of an observable at every point; "hamiltonian"
+        is the registered Hamiltonian H_name. Raises ValueError.
+        """
+        if H_name not in HAMILTONIANS:
+            raise ValueError(f"Unknown Hamiltonian '{H_name}'; available: {sorted(HAMILTONIANS)}")
+        hamiltonian = get_hamiltonian(H_name)
+
+        if name == "hamiltonian":
+            q = np.asarray(q, dtype=float)
+            p = np.asarray(p, dtype=float)
+            value = hamiltonian.energy(q, p, params)
+            dq = np.broadcast_to(hamiltonian.grad_x(q, p, params), np.broadcast_shapes(q.shape, p.shape))
+            dp = np.broadcast_to(hamiltonian.grad_p(q, p, params), dq.shape)
+            if not hamiltonian.vector:
+                dq, dp = dq[..., np.newaxis], dp[..., np.newaxis]
+            return value, dq, dp
+
+        if name not in OBSERVABLES:
+            raise ValueError(f"Unknown observable '{name}'; available: {['hamiltonian'] + sorted(OBSERVABLES)}")
+        observable = get_observable(name)
+        vq, vp, vparams = self._vector_form(hamiltonian, q, p, params)
+        if observable.dims is not None and vq.shape[-1] != observable.dims:
+            raise ValueError(f"Observable '{name}' needs {observable.dims} coordinates, got {vq.shape[-1]}")
+        dq, dp = observable.grad(vq, vp, vparams)
+        shape = np.broadcast_shapes(vq.shape, vp.shape)
+        return observable.value(vq, vp, vparams), np.broadcast_to(dq, shape), np.broadcast_to(dp, shape)
+
+    def bracket_matrix(self, observables, q, p, H_name="harmonic", params=None):
+        """
+        {f, g} for every ordered pair of observables at every point:
+        an (F, F, points...) array from one einsum over stacked gradients.
+        """
+        grads = [self.observable_gradients(name, q, p, H_name, params)[1:] for name in observables]
+        shape = np.broadcast_shapes(*(g[0].shape for g in grads))
+        Q = np.stack([np.broadcast_to(g[0], shape) for g in grads])
+        P = np.stack([np.broadcast_to(g[1], shape) for g in grads])
+        return np.einsum("f...i,g...i->fg...", Q, P) - np.einsum("f...i,g...i->fg...", P, Q)
+
+    def check_invariants(self, q, p, H_name="harmonic", params=None, observables=None, tol=None,
+                         time_axis=True):
+        """
+        {I, H} for each observable along a trajectory (any leading
+        time/member axes). An observable is reported conserved when
+        |{I, H}| <= tol * |grad I| |grad H| at every point.
+        value_drift is max - min of I along the first (time) axis, one
+        per member for ensembles; it is None when time_axis=False
+        (points are final states only, so there is no drift to report).
+        """
+        tol = self.DEFAULT_TOL if tol is None else float(tol)
+        observables = list(observables or ["hamiltonian", *sorted(OBSERVABLES)])
+
+        try:
+            _, Hq, Hp = self.observable_gradients("hamiltonian", q, p, H_name, params)
+            H_norm = np.sqrt(np.sum(Hq ** 2 + Hp ** 2, axis=-1))
+
+            checks = {}
+            for name in observables:
+                if name != "hamiltonian":
+                    observable = OBSERVABLES.get(name)
+                    if observable is not None and observable.dims is not None and Hq.shape[-1] != observable.dims:
+                        checks[name] = {"skipped": f"needs {observable.dims} coordinates"}
+                        continue
+                value, Iq, Ip = self.observable_gradients(name, q, p, H_name, params)
+                bracket = self.compute_bracket({"q": Iq, "p": Ip}, {"q": Hq, "p": Hp})
+                scale = np.sqrt(np.sum(Iq ** 2 + Ip ** 2, axis=-1)) * H_norm
+                relative = np.abs(bracket) / np.maximum(scale, 1e-300)
+                value = np.asarray(value)
+                drift = None
+                if time_axis and value.ndim:
+                    drift = np.ptp(value, axis=0)
+                    drift = float(drift) if drift.ndim == 0 else drift
+                checks[name] = {
+                    "bracket": bracket,
+                    "max_abs": float(np.max(np.abs(bracket))),
+                    "max_relative": float(np.max(relative)),
+                    "value_drift": drift,
+                    "conserved": bool(np.all(relative <= tol)),
+                }
+        except ValueError as exc:
+            return {"error": str(exc)}
+
+        return {
+            "hamiltonian": H_name,
+            "points": int(np.prod(H_norm.shape)),
+            "tol": tol,
+            "invariants": checks,
+        }
+
     # ---------------------------------------------------------
     # Main cockpit endpoint
     # ---------------------------------------------------------
+    @staticmethod
+    def missing_gradients(payload: Dict[str, Any]) -> List[str]:
+        """
+        Gradient dicts ({"q": ..., "p": ...}) that `mode` needs but the
+        payload lacks or leaves incomplete.
+        """
+        mode = payload.get("mode", "ping")
+        if mode == "bracket" or (mode == "brackets" and "f_grad" in payload):
+            needed = ("f_grad", "g_grad")
+        elif mode == "flow":
+            needed = ("H_grad",)
+        else:
+            needed = ()
+        return [
+            name for name in needed
+            if not isinstance(payload.get(name), dict) or not {"q", "p"} <= set(payload[name])
+        ]
+
     def analyze(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Unified cockpit endpoint.
 
         Expected payload:
         {
-            "mode": "bracket" or "flow",
+            "mode": "bracket", "brackets", "invariants" or "flow",
             "f_grad": {"q": [...], "p": [...]},
             "g_grad": {"q": [...], "p": [...]},
             "H_grad": {"q": [...], "p": [...]}
         }
+        "brackets" takes stacked f_grad/g_grad arrays, or q/p points with
+        H_name, params and observable names; "invariants" takes a
+        trajectory q/p with H_name, params, observables, tol and
+        time_axis (False when q/p are not a time series).
         """
 
         mode = payload.get("mode", "ping")
@@ -98,15 +248,52 @@ class PoissonOrgan:
         if mode == "ping":
             return self.ping()
 
+        missing = self.missing_gradients(payload)
+        if missing:
+            return {"error": f"mode '{mode}' needs {missing} with q and p"}
+
         if mode == "bracket":
             f_grad = payload["f_grad"]
             g_grad = payload["g_grad"]
-            value = self.compute_bracket(f_grad, g_grad)
+            try:
+                value = self.compute_bracket(f_grad, g_grad)
+            except ValueError as exc:
+                return {"error": str(exc)}
             return {
                 "mode": "bracket",
                 "poisson_bracket": value
             }
 
+        if mode == "brackets":
+            # Batched: stacked gradients, or named observables at points
+            if "f_grad" in payload:
+                try:
+                    brackets = self.compute_bracket(payload["f_grad"], payload["g_grad"])
+                except ValueError as exc:
+                    return {"error": str(exc)}
+                return {"mode": "brackets", "poisson_brackets": brackets}
+            if "q" not in payload or "p" not in payload:
+                return {"error": "mode 'brackets' needs f_grad/g_grad or q and p"}
+            observables = payload.get("observables") or ["hamiltonian", *sorted(OBSERVABLES)]
+            try:
+                matrix = self.bracket_matrix(
+                    observables, payload["q"], payload["p"],
+                    payload.get("H_name", "harmonic"), payload.get("params"),
+                )
+            except ValueError as exc:
+                return {"error": str(exc)}
+            return {"mode": "brackets", "observables": observables, "poisson_brackets": matrix}
+
+        if mode == "invariants":
+            if "q" not in payload or "p" not in payload:
+                return {"error": "mode 'invariants' needs q and p"}
+            result = self.check_invariants(
+                payload["q"], payload["p"],
+                payload.get("H_name", "harmonic"), payload.get("params"),
+                payload.get("observables"), payload.get("tol"), payload.get("time_axis", True),
+            )
+            return result if "error" in result else {"mode": "invariants", **result}
+
         if mode == "flow":
             H_grad = payload["H_grad"]
             flow = self.hamiltonian_flow(H_grad)
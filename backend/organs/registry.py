@@ -1,24 +1,207 @@
-from .laplace_organ import LaplaceOrgan
-from organs.cybersecurity.bloodhound_red_organ import BloodHoundRedOrgan
-from organs.cybersecurity.bloodhound_blue_organ import BloodHoundBlueOrgan
-from organs.cybersecurity.cyber_origin_organ import CyberOriginOrgan
-from organs.cybersecurity.cors_organ import CORSOrgan
-from organs.cybersecurity.xss_organ import XSSOrgan
-
-
-# Optional: class registry (if you use dynamic creation)
-ORGAN_CLASSES = {
-    "laplace": LaplaceOrgan,
-    # add others here if you want dynamic instantiation
-}
-
-
-# Actual instantiated organ registry (this is what your API uses)
-registry = {}
-
-registry["laplace"] = LaplaceOrgan()
-registry["bloodhound_red"] = BloodHoundRedOrgan()
-registry["bloodhound_blue"] = BloodHoundBlueOrgan()
-registry["cyber_origin"] = CyberOriginOrgan()
-registry["cors"] = CORSOrgan()
-registry["xss"] = XSSOrgan()
\ No newline at end of file
+# backend/organs/registry.py
+
+import importlib
+import inspect
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+
+class UnknownOrganError(KeyError):
+    """Raised when no organ is registered under a name."""
+
+
+class OrganUnavailableError(ImportError):
+    """Raised when a registered organ's module or class cannot be loaded."""
+
+
+@dataclass(frozen=True)
+class OrganSpec:
+    """
+    Metadata for one organ. Nothing is imported until the organ is used.
+
+    kind:  "signal" organs expose analyze(signal),
+           "graph" organs expose process(data)
+    cost:  "cheap" or "cpu" (CPU-bound, worth running off the event loop)
+    stateless: instances hold no per-call state and may be reused
+    """
+    name: str
+    module: str
+    attr: str
+    kind: str = "signal"
+    cost: str = "cheap"
+    dtypes: Tuple[str, ...] = ("float32", "float64")
+    stateless: bool = True
+    description: str = ""
+    params: Tuple[str, ...] = field(default=())
+
+    def metadata(self) -> Dict[str, Any]:
+        meta = asdict(self)
+        meta["dtypes"] = list(self.dtypes)
+        meta["params"] = list(self.params)
+        return meta
+
+
+class OrganRegistry:
+    """
+    Organ Registry
+    - discovers organs by name and imports their module on first use
+    - caches instances of stateless organs per constructor parameters
+    - runs signal and graph organs through one calling convention
+    """
+
+    def __init__(self, max_instances: int = 64):
+        self.max_instances = max_instances
+        self._specs: Dict[str, OrganSpec] = {}
+        self._classes: Dict[str, type] = {}
+        self._accepts_context: Dict[str, bool] = {}
+        self._instances = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------------
+    # Registration / metadata
+    # ---------------------------------------------------------
+    def register(self, spec: OrganSpec):
+        self._specs[spec.name] = spec
+        return spec
+
+    def spec(self, name: str) -> OrganSpec:
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise UnknownOrganError(name) from None
+
+    def names(self):
+        return list(self._specs)
+
+    def describe(self) -> Dict[str, Dict[str, Any]]:
+        return {name: spec.metadata() for name, spec in self._specs.items()}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    # ---------------------------------------------------------
+    # Lazy loading
+    # ---------------------------------------------------------
+    def load(self, name: str) -> type:
+        cls = self._classes.get(name)
+        if cls is not None:
+            return cls
+
+        spec = self.spec(name)
+        try:
+            module = importlib.import_module(spec.module)
+            cls = getattr(module, spec.attr)
+        except (ImportError, AttributeError) as exc:
+            raise OrganUnavailableError(f"Organ '{name}' is unavailable: {exc}") from exc
+
+        self._accepts_context[name] = (
+            hasattr(cls, "analyze") and "context" in inspect.signature(cls.analyze).parameters
+        )
+        self._classes[name] = cls
+        return cls
+
+    def get(self, name: str, **params):
+        """
+        Return an organ instance. Stateless organs are cached per
+        parameter set; stateful ones are built fresh on every call.
+        """
+        spec = self.spec(name)
+        cls = self.load(name)
+
+        if not spec.stateless:
+            return cls(**params)
+
+        key = (name, tuple(sorted(params.items())))
+        with self._lock:
+            organ = self._instances.get(key)
+            if organ is not None:
+                self._instances.move_to_end(key)
+                return organ
+
+        organ = cls(**params)
+        with self._lock:
+            self._instances[key] = organ
+            while len(self._instances) > self.max_instances:
+                self._instances.popitem(last=False)
+        return organ
+
+    # ---------------------------------------------------------
+    # Uniform calling convention
+    # ---------------------------------------------------------
+    def run(self, name: str, data, context=None, **params):
+        """
+        Run an organ on its input.
+        - signal organs: `data` is an array-like signal
+        - graph organs:  `data` is the payload dict
+        `context` (a SignalContext) is forwarded to organs that accept it.
+        """
+        spec = self.spec(name)
+        organ = self.get(name, **params)
+
+        if spec.kind == "graph":
+            return organ.process(data)
+
+        if context is not None and self._accepts_context[name]:
+            return organ.analyze(data, context=context)
+        return organ.analyze(np.asarray(data))
+
+
+# ---------------------------------------------------------
+# Built-in organs
+# ---------------------------------------------------------
+
+registry = OrganRegistry()
+
+_SIGNAL_ORGANS = [
+    OrganSpec("power_spectrum", "backend.organs.physics.power_spectrum_organ", "PowerSpectrumOrgan",
+              params=("sample_rate", "method", "nperseg", "noverlap", "window", "detrend", "compute_dtype"),
+              description="rFFT periodogram or Welch power spectrum"),
+    OrganSpec("spectrogram", "backend.organs.physics.spectrogram_organ", "SpectrogramOrgan",
+              cost="cpu", params=("sample_rate", "nperseg", "noverlap", "window", "detrend", "scaling",
+                                  "fmin", "fmax", "frames_per_block", "compute_dtype"),
+              description="STFT spectrogram with dB scaling and band limiting"),
+    OrganSpec("laplace", "backend.organs.physics.laplace_organ", "LaplaceOrgan",
+              cost="cpu", params=("sample_rate", "method", "order", "pencil", "rank",
+                                    "max_order", "criterion"),
+              description="Pole, damping and stability estimation"),
+    OrganSpec("laplace_track", "backend.organs.physics.laplace_tracker", "LaplaceTrackerOrgan",
+              cost="cpu", params=("sample_rate", "method", "order", "window", "hop", "refresh"),
+              description="Sliding-window pole, damping and stability tracking"),
+    OrganSpec("koopman", "backend.organs.physics.koopman_organ", "KoopmanOrgan",
+              params=("sample_rate", "method", "delays", "rank", "return_vectors"),
+              description="Delay-embedding Koopman spectrum (SVD or Hankel DMD)"),
+    OrganSpec("zeta_gamma", "backend.organs.physics.zeta_gamma_organ", "ZetaGammaOrgan",
+              params=("sample_rate",), description="Moments with zeta/gamma samples"),
+    OrganSpec("free_energy", "backend.organs.physics.free_energy", "FreeEnergyOrgan",
+              params=("sample_rate",), description="Variational free energy"),
+    OrganSpec("hash", "backend.organs.computation.hash", "HashOrgan",
+              cost="cpu", description="Cryptographic and rolling hashes"),
+    OrganSpec("causal_set", "backend.organs.computation.causal_set", "CausalSetOrgan",
+              cost="cpu", description="Causal set and transitive reduction"),
+    OrganSpec("self_reference", "backend.organs.mind.self_reference_organ", "SelfReferenceOrgan",
+              params=("iterations",), description="Recursive self-map fixed points"),
+    OrganSpec("consciousness", "backend.organs.mind.consciousness_organ", "ConsciousnessOrgan",
+              params=("window",), description="Integration, prediction error, ignition"),
+]
+
+_GRAPH_ORGANS = [
+    OrganSpec("bloodhound_red", "backend.organs.cybersecurity.bloodhound_red_organ", "BloodHoundRedOrgan",
+              kind="graph", cost="cpu", dtypes=(), stateless=False,
+              description="Forward privilege-flow attack paths"),
+    OrganSpec("bloodhound_blue", "backend.organs.cybersecurity.bloodhound_blue_organ", "BloodHoundBlueOrgan",
+              kind="graph", cost="cpu", dtypes=(), stateless=False,
+              description="Backward privilege-flow remediation paths"),
+    OrganSpec("cyber_origin", "backend.organs.cybersecurity.cyber_origin_organ", "CyberOriginOrgan",
+              kind="graph", dtypes=(), stateless=False, description="Origin trust graph"),
+    OrganSpec("cors", "backend.organs.cybersecurity.cors_organ", "CORSOrgan",
+              kind="graph", dtypes=(), description="CORS membrane apertures"),
+    OrganSpec("xss", "backend.organs.cybersecurity.xss_organ", "XSSOrgan",
+              kind="graph", dtypes=(), description="XSS sink exposure"),
+]
+
+for _spec in _SIGNAL_ORGANS + _GRAPH_ORGANS:
+    registry.register(_spec)
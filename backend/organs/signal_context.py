@@ -0,0 +1,74 @@
+import numpy as np
+
+
+class SignalContext:
+    """
+    Signal Context
+    Holds one input signal together with the intermediates that several
+    organs derive from it (moments, z-scored signal, rFFTs).
+    Each intermediate is computed on first access and then reused, so a
+    batch of organs analyzing the same signal pays for it only once.
+    """
+
+    def __init__(self, signal: np.ndarray, sample_rate: float = 1.0):
+        self.signal = np.asarray(signal, dtype=float)
+        self.sample_rate = sample_rate
+        self._cache = {}
+
+    @classmethod
+    def wrap(cls, signal, context=None, sample_rate: float = 1.0):
+        """
+        Return `context` when an organ was handed one, otherwise a fresh
+        context around `signal`.
+        """
+        if context is not None:
+            return context
+        return cls(signal, sample_rate=sample_rate)
+
+    def _get(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    # ---------------------------------------------------------
+    # Moments
+    # ---------------------------------------------------------
+    @property
+    def mean(self) -> float:
+        return self._get("mean", lambda: float(np.mean(self.signal)))
+
+    @property
+    def std(self) -> float:
+        return self._get("std", lambda: float(np.std(self.signal)))
+
+    @property
+    def var(self) -> float:
+        return self._get("var", lambda: self.std ** 2)
+
+    # ---------------------------------------------------------
+    # Normalized signal
+    # ---------------------------------------------------------
+    @property
+    def normalized(self) -> np.ndarray:
+        """
+        z-scored signal: (x - mean) / (std + 1e-8)
+        """
+        return self._get("normalized", lambda: (self.signal - self.mean) / (self.std + 1e-8))
+
+    # ---------------------------------------------------------
+    # Spectra
+    # ---------------------------------------------------------
+    @property
+    def rfft(self) -> np.ndarray:
+        return self._get("rfft", lambda: np.fft.rfft(self.signal))
+
+    @property
+    def rfft_normalized(self) -> np.ndarray:
+        return self._get("rfft_normalized", lambda: np.fft.rfft(self.normalized))
+
+    def rfftfreq(self, sample_rate: float = None) -> np.ndarray:
+        rate = self.sample_rate if sample_rate is None else sample_rate
+        return self._get(
+            ("rfftfreq", rate),
+            lambda: np.fft.rfftfreq(self.signal.size, d=1.0 / rate),
+        )
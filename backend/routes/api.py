@@ -1,35 +1,33 @@
-from fastapi import APIRouter
-from pydantic import BaseModel
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, field_validator
 import numpy as np
 
 # ---------------------------------------------------------
-# Import organs from new folder structure
+# Organs are resolved lazily through the registry: a module is
+# imported on first use and stateless instances are reused.
 # ---------------------------------------------------------
 
-# Physics organs
-from backend.organs.physics.power_spectrum_organ import PowerSpectrumOrgan
-from backend.organs.physics.laplace_organ import LaplaceOrgan
-from backend.organs.physics.koopman_organ import KoopmanOrgan
-from backend.organs.physics.zeta_gamma_organ import ZetaGammaOrgan
-from backend.organs.physics.free_energy import FreeEnergyOrgan
-
-# Computation organs
-from backend.organs.computation.hash import HashOrgan
-from backend.organs.computation.causal_set import CausalSetOrgan
-
-# Mind organs
-from backend.organs.mind.self_reference_organ import SelfReferenceOrgan
-from backend.organs.mind.consciousness_organ import ConsciousnessOrgan
-
-# Cybersecurity organs (NEW)
-from backend.organs.cybersecurity.bloodhound_red_organ import BloodHoundRedOrgan
-from backend.organs.cybersecurity.bloodhound_blue_organ import BloodHoundBlueOrgan
-from backend.organs.cybersecurity.cyber_origin_organ import CyberOriginOrgan
-from backend.organs.cybersecurity.cors_organ import CORSOrgan
-from backend.organs.cybersecurity.xss_organ import XSSOrgan
+from backend.core.datasets import DatasetNotFoundError, welch_dataset
+from backend.core.executor import organ_executor
+from backend.core.metrics import observe_organ, record_cache
+from backend.core.profiling import current_profile, profile_call, profile_guard
+from backend.core.result_cache import result_cache, signal_digest
+from backend.core.sessions import SessionLimitError, SessionNotFoundError, session_store
+from backend.core.trajectory_store import RunNotFoundError, trajectory_store
+from backend.organs.physics.koopman_organ import OnlineDMD
+from backend.organs.physics.power_spectrum_organ import WelchSpectrum
+from backend.organs.registry import OrganUnavailableError, registry
+from backend.organs.signal_context import SignalContext
+from backend.routes.responses import dumps_json, encode_response
+from backend.routes.signal_io import DecodedSignal, StreamedSignal, signal_body, signal_stream
 
 
-router = APIRouter()
+# Every organ route honours the opt-in profiling header (see core/profiling.py)
+router = APIRouter(dependencies=[Depends(profile_guard)])
 
 # ---------------------------------------------------------
 # Shared payload model
@@ -40,14 +38,238 @@ class SignalPayload(BaseModel):
     sample_rate: float = 1.0
 
 
+# Accepts JSON, raw float32/float64 (application/octet-stream) or .npy bodies
+signal_input = signal_body(SignalPayload)
+
+
+# ---------------------------------------------------------
+# Result cache (opt-in via INFOENGINE_CACHE=1)
+# ---------------------------------------------------------
+
+def cache_bypass(request: Request) -> bool:
+    """
+    `X-Cache-Bypass: 1` or `Cache-Control: no-cache` forces a recompute.
+    """
+    if request.headers.get("x-cache-bypass", "").lower() in ("1", "true", "yes"):
+        return True
+    return "no-cache" in request.headers.get("cache-control", "").lower()
+
+
+async def run_cached(organ_name, decoded: DecodedSignal, bypass: bool, compute):
+    """
+    Serve an organ result from the result cache, keyed by the signal
+    digest, the organ name and the organ parameters taken from the
+    validated payload (see organ_params).
+    `compute` is an async callable producing the result on a miss.
+    Returns (result, cache_status) where cache_status is None when the
+    cache is disabled.
+    """
+    if not result_cache.enabled or current_profile.get() is not None:
+        return await compute(), None
+
+    params = organ_params(organ_name, decoded.payload)
+    digest = await run_in_threadpool(signal_digest, decoded.signal)
+    key = result_cache.make_key(organ_name, digest, params)
+
+    if not bypass:
+        hit, result = result_cache.get(key)
+        if hit:
+            record_cache(organ_name, "HIT")
+            return result, "HIT"
+
+    result = await compute()
+    result_cache.store(key, result)
+    status = "BYPASS" if bypass else "MISS"
+    record_cache(organ_name, status)
+    return result, status
+
+
+@router.get("/cache/stats")
+def cache_stats():
+    return result_cache.stats()
+
+
+@router.delete("/cache")
+def cache_clear():
+    result_cache.clear()
+    return result_cache.stats()
+
+
+# ---------------------------------------------------------
+# Registry helpers
+# ---------------------------------------------------------
+
+async def call_organ(name, data, context=None, **params):
+    """
+    Run an organ through the executor: CPU-bound organs go to the
+    process pool, cheap ones run on the threadpool.
+    """
+    options = current_profile.get()
+    try:
+        if options is not None:
+            # Profiled calls run inline so the profilers see the organ
+            result, report = await run_in_threadpool(
+                profile_call, options, registry.run, name, data, context=context, **params
+            )
+            return {**result, "_profile": report} if isinstance(result, dict) else result
+
+        with observe_organ(name, data):
+            return await organ_executor.run(name, data, context=context, **params)
+    except OrganUnavailableError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+
+
+def organ_params(name, payload: BaseModel) -> dict:
+    """
+    Constructor parameters for an organ, taken from the payload fields
+    the organ declares in its registry spec.
+    """
+    fields = payload.model_dump(exclude={"signal"})
+    return {key: fields[key] for key in registry.spec(name).params if key in fields}
+
+
+async def run_signal_organ(name, decoded: DecodedSignal, request: Request, bypass: bool):
+    params = organ_params(name, decoded.payload)
+    result, cache_status = await run_cached(
+        name, decoded, bypass,
+        lambda: call_organ(name, decoded.signal, **params),
+    )
+    headers = {"X-Cache": cache_status} if cache_status else None
+    return encode_response(request, result, headers=headers)
+
+
+@router.get("/registry")
+def list_organs():
+    return registry.describe()
+
+
 # ---------------------------------------------------------
 # Power Spectrum Organ
 # ---------------------------------------------------------
 
+class WelchParams(BaseModel):
+    sample_rate: float = 1.0
+    nperseg: int = 256
+    noverlap: int | None = None     # default nperseg // 2
+    window: str = "hann"            # "hann", "hamming", "blackman", "bartlett", "boxcar"
+    detrend: str = "constant"       # "constant", "linear", "none"
+    compute_dtype: str = "float64"  # or "float32"
+
+
+class PowerSpectrumPayload(WelchParams):
+    signal: list[float]
+    method: str = "periodogram"     # or "welch"
+
+power_spectrum_input = signal_body(PowerSpectrumPayload)
+welch_stream_input = signal_stream(WelchParams)
+
+
 @router.post("/power_spectrum/analyze")
-def analyze_power_spectrum(payload: SignalPayload):
-    organ = PowerSpectrumOrgan(sample_rate=payload.sample_rate)
-    return organ.analyze(np.array(payload.signal))
+async def analyze_power_spectrum(
+    request: Request,
+    decoded: DecodedSignal = Depends(power_spectrum_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("power_spectrum", decoded, request, bypass)
+
+
+@router.post("/power_spectrum/welch/stream")
+async def stream_welch(request: Request, stream: StreamedSignal = Depends(welch_stream_input)):
+    """
+    Welch spectrum of a raw float body of any length, consumed chunk by
+    chunk as it is received.
+    """
+    try:
+        welch = WelchSpectrum(**stream.payload.model_dump())
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    with observe_organ("power_spectrum_welch"):
+        async for chunk in stream.chunks:
+            await run_in_threadpool(welch.update, chunk)
+        result = await run_in_threadpool(welch.result)
+    return encode_response(request, result)
+
+
+@router.post("/power_spectrum/welch/dataset/{name}")
+async def dataset_welch(name: str, params: WelchParams, request: Request):
+    """
+    Welch spectrum of a stored dataset under INFOENGINE_DATA_DIR, read
+    through a memory map in the process pool.
+    """
+    try:
+        with observe_organ("power_spectrum_welch"):
+            result = await organ_executor.call(welch_dataset, name, **params.model_dump())
+    except DatasetNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    return encode_response(request, result)
+
+
+# ---------------------------------------------------------
+# Spectrogram Organ
+# ---------------------------------------------------------
+
+class SpectrogramParams(BaseModel):
+    sample_rate: float = 1.0
+    nperseg: int = 256
+    noverlap: int | None = None     # default nperseg // 2
+    window: str = "hann"
+    detrend: str = "constant"
+    scaling: str = "db"             # "db" or "power"
+    fmin: float | None = None
+    fmax: float | None = None
+    frames_per_block: int = 256     # frames per streamed chunk
+    compute_dtype: str = "float64"
+
+
+class SpectrogramPayload(SpectrogramParams):
+    signal: list[float]
+
+spectrogram_input = signal_body(SpectrogramPayload)
+spectrogram_stream_input = signal_stream(SpectrogramParams)
+
+
+@router.post("/spectrogram/analyze")
+async def analyze_spectrogram(
+    request: Request,
+    decoded: DecodedSignal = Depends(spectrogram_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("spectrogram", decoded, request, bypass)
+
+
+@router.post("/spectrogram/stream")
+async def stream_spectrogram(stream: StreamedSignal = Depends(spectrogram_stream_input)):
+    """
+    Spectrogram of a raw float body as newline-delimited JSON: a header
+    line with the frequency axis, then time-ordered {"times", "power"}
+    blocks computed chunk by chunk as the response is written.
+
+    The upload is read in full before the response starts. Once a
+    StreamingResponse begins it listens for disconnects on the same
+    receive channel, which would swallow the rest of the body, and a
+    malformed body must still be rejected with a 4xx.
+    """
+    organ = registry.get("spectrogram", **stream.payload.model_dump())
+    try:
+        organ.validate()
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    chunks = [chunk async for chunk in stream.chunks]
+
+    async def lines():
+        framer = organ.new_framer()
+        yield dumps_json(organ.header()) + b"\n"
+        with observe_organ("spectrogram"):
+            for chunk in chunks:
+                blocks = await run_in_threadpool(lambda: list(organ.push(framer, chunk)))
+                for block in blocks:
+                    yield dumps_json(block) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 # ---------------------------------------------------------
@@ -55,9 +277,12 @@ def analyze_power_spectrum(payload: SignalPayload):
 # ---------------------------------------------------------
 
 @router.post("/hash/analyze")
-def analyze_hash(payload: SignalPayload):
-    organ = HashOrgan()
-    return organ.analyze(np.array(payload.signal))
+async def analyze_hash(
+    request: Request,
+    decoded: DecodedSignal = Depends(signal_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("hash", decoded, request, bypass)
 
 
 # ---------------------------------------------------------
@@ -65,9 +290,12 @@ def analyze_hash(payload: SignalPayload):
 # ---------------------------------------------------------
 
 @router.post("/causal_set/analyze")
-def analyze_causal_set(payload: SignalPayload):
-    organ = CausalSetOrgan()
-    return organ.analyze(np.array(payload.signal))
+async def analyze_causal_set(
+    request: Request,
+    decoded: DecodedSignal = Depends(signal_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("causal_set", decoded, request, bypass)
 
 
 # ---------------------------------------------------------
@@ -75,29 +303,137 @@ def analyze_causal_set(payload: SignalPayload):
 # ---------------------------------------------------------
 
 @router.post("/zeta_gamma/analyze")
-def analyze_zeta_gamma(payload: SignalPayload):
-    organ = ZetaGammaOrgan()
-    return organ.analyze(np.array(payload.signal))
+async def analyze_zeta_gamma(
+    request: Request,
+    decoded: DecodedSignal = Depends(signal_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("zeta_gamma", decoded, request, bypass)
 
 
 # ---------------------------------------------------------
 # Koopman Organ
 # ---------------------------------------------------------
 
+class KoopmanPayload(BaseModel):
+    signal: list[float]
+    sample_rate: float = 1.0
+    method: str = "svd"             # "svd" or "dmd"
+    delays: int = 2                 # Hankel embedding depth
+    rank: int | None = None         # truncation rank (default: numerical rank)
+    return_vectors: bool = False    # include the singular vectors
+
+koopman_input = signal_body(KoopmanPayload)
+
 @router.post("/koopman/analyze")
-def analyze_koopman(payload: SignalPayload):
-    organ = KoopmanOrgan()
-    return organ.analyze(np.array(payload.signal))
+async def analyze_koopman(
+    request: Request,
+    decoded: DecodedSignal = Depends(koopman_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("koopman", decoded, request, bypass)
+
+
+# ---------------------------------------------------------
+# Online Koopman sessions (streaming DMD)
+# ---------------------------------------------------------
+
+class KoopmanSessionConfig(BaseModel):
+    delays: int = 8
+    sample_rate: float = 1.0
+    forgetting: float = 1.0         # < 1 discounts old snapshots
+    window: int | None = None       # or keep exactly the last `window` snapshots
+    warmup: int | None = None       # snapshots before the first fit (default 2 * delays)
+
+
+class SessionChunkPayload(BaseModel):
+    signal: list[float]
+
+session_chunk_input = signal_body(SessionChunkPayload)
+
+
+def koopman_session(session_id: str):
+    try:
+        return session_store.get(session_id, kind="koopman")
+    except SessionNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired session '{session_id}'")
+
+
+def _locked(session, method, *args):
+    with session.lock:
+        return method(*args)
+
+
+@router.post("/koopman/sessions")
+def create_koopman_session(config: KoopmanSessionConfig):
+    try:
+        session = session_store.create(OnlineDMD(**config.model_dump()), kind="koopman")
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    except SessionLimitError as exc:
+        raise HTTPException(status_code=413, detail=str(exc))
+    return {"session_id": session.id, **config.model_dump(), "nbytes": session.nbytes}
+
+
+@router.post("/koopman/sessions/{session_id}/append")
+async def append_koopman_session(
+    session_id: str,
+    request: Request,
+    decoded: DecodedSignal = Depends(session_chunk_input),
+):
+    """
+    Append samples; with ?spectrum=1 the updated spectrum is returned.
+    """
+    session = koopman_session(session_id)
+    online = session.state
+    with observe_organ("koopman_online", decoded.signal):
+        await run_in_threadpool(_locked, session, online.update, decoded.signal)
+
+    if request.query_params.get("spectrum", "").lower() in ("1", "true", "yes"):
+        result = await run_in_threadpool(_locked, session, online.spectrum)
+    else:
+        result = {"samples": online.samples, "updates": online.updates, "initialized": online.initialized}
+    return encode_response(request, {"session_id": session_id, **result})
+
+
+@router.get("/koopman/sessions/{session_id}")
+async def query_koopman_session(session_id: str, request: Request):
+    session = koopman_session(session_id)
+    result = await run_in_threadpool(_locked, session, session.state.spectrum)
+    return encode_response(request, {"session_id": session_id, **result})
+
+
+@router.delete("/koopman/sessions/{session_id}")
+def delete_koopman_session(session_id: str):
+    try:
+        session_store.delete(session_id)
+    except SessionNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired session '{session_id}'")
+    return {"deleted": session_id}
+
+
+@router.get("/sessions/stats")
+def session_stats():
+    return session_store.stats()
 
 
 # ---------------------------------------------------------
 # Self-Reference Organ
 # ---------------------------------------------------------
 
+class SelfReferencePayload(SignalPayload):
+    iterations: int = Field(32, ge=1)   # self-map iterations
+
+self_reference_input = signal_body(SelfReferencePayload)
+
+
 @router.post("/self_reference/analyze")
-def analyze_self_reference(payload: SignalPayload):
-    organ = SelfReferenceOrgan()
-    return organ.analyze(np.array(payload.signal))
+async def analyze_self_reference(
+    request: Request,
+    decoded: DecodedSignal = Depends(self_reference_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("self_reference", decoded, request, bypass)
 
 
 # ---------------------------------------------------------
@@ -105,19 +441,31 @@ def analyze_self_reference(payload: SignalPayload):
 # ---------------------------------------------------------
 
 @router.post("/free_energy/analyze")
-def analyze_free_energy(payload: SignalPayload):
-    organ = FreeEnergyOrgan()
-    return organ.analyze(np.array(payload.signal))
+async def analyze_free_energy(
+    request: Request,
+    decoded: DecodedSignal = Depends(signal_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("free_energy", decoded, request, bypass)
 
 
 # ---------------------------------------------------------
 # Consciousness Organ
 # ---------------------------------------------------------
 
+class ConsciousnessPayload(SignalPayload):
+    window: int = Field(32, ge=1)       # moving-average window for ignition
+
+consciousness_input = signal_body(ConsciousnessPayload)
+
+
 @router.post("/consciousness/analyze")
-def analyze_consciousness(payload: SignalPayload):
-    organ = ConsciousnessOrgan()
-    return organ.analyze(np.array(payload.signal))
+async def analyze_consciousness(
+    request: Request,
+    decoded: DecodedSignal = Depends(consciousness_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("consciousness", decoded, request, bypass)
 
 
 # ---------------------------------------------------------
@@ -125,19 +473,172 @@ def analyze_consciousness(payload: SignalPayload):
 # ---------------------------------------------------------
 
 class LaplacePayload(BaseModel):
-    signal: list[float]
+    signal: list[float] | list[list[float]]   # one signal or (channels, samples)
     sample_rate: float = 1.0
     method: str = "prony"   # "prony", "matrix_pencil", "burg", "continuous_time"
-    order: int = 10
+    order: int | str = 10   # or "auto" (prony, burg)
+    pencil: int | None = Field(None, ge=2)  # matrix_pencil: cap on the pencil size L
+    rank: int | None = Field(None, ge=1)    # matrix_pencil: singular values kept
+    max_order: int = 40         # order="auto": largest order tried
+    criterion: str = "aic"      # order="auto": "aic", "mdl" or "fpe"
+
+    @field_validator("order", mode="before")
+    @classmethod
+    def _parse_order(cls, value):
+        # Binary bodies pass ?order=12 as a string
+        if isinstance(value, str):
+            value = value.strip().lower()
+            if value == "auto":
+                return value
+            try:
+                return int(value)
+            except ValueError:
+                raise ValueError("order must be an integer or 'auto'")
+        return value
+
+laplace_input = signal_body(LaplacePayload, max_ndim=2)
 
 @router.post("/laplace/analyze")
-def analyze_laplace(payload: LaplacePayload):
-    organ = LaplaceOrgan(
-        sample_rate=payload.sample_rate,
-        method=payload.method,
-        order=payload.order
-    )
-    return organ.analyze(np.array(payload.signal))
+async def analyze_laplace(
+    request: Request,
+    decoded: DecodedSignal = Depends(laplace_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("laplace", decoded, request, bypass)
+
+
+class LaplaceTrackPayload(BaseModel):
+    signal: list[float]
+    sample_rate: float = 1.0
+    method: str = "burg"    # "prony" or "burg"
+    order: int = 10
+    window: int = 1024      # samples per fit
+    hop: int = 256          # samples between fits
+    refresh: int = 64       # windows between full rebuilds of the sliding sums
+
+laplace_track_input = signal_body(LaplaceTrackPayload)
+
+@router.post("/laplace/track")
+async def track_laplace(
+    request: Request,
+    decoded: DecodedSignal = Depends(laplace_track_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    return await run_signal_organ("laplace_track", decoded, request, bypass)
+
+
+# ---------------------------------------------------------
+# Batch endpoint (one signal, many organs)
+# ---------------------------------------------------------
+
+class BatchOrganRequest(BaseModel):
+    name: str
+    params: dict = {}
+
+
+class BatchPayload(BaseModel):
+    signal: list[float]
+    sample_rate: float = 1.0
+    organs: list[BatchOrganRequest]
+
+    @field_validator("organs", mode="before")
+    @classmethod
+    def _split_names(cls, value):
+        # Binary bodies pass the organ list as ?organs=power_spectrum,koopman
+        if isinstance(value, str):
+            return [{"name": name.strip()} for name in value.split(",") if name.strip()]
+        return value
+
+
+batch_input = signal_body(BatchPayload)
+
+# Payload model of each organ's single-organ route; batch items are
+# validated through it so both routes fill defaults (and build cache
+# keys) the same way
+ROUTE_PAYLOADS = {
+    "power_spectrum": PowerSpectrumPayload,
+    "spectrogram": SpectrogramPayload,
+    "koopman": KoopmanPayload,
+    "laplace": LaplacePayload,
+    "laplace_track": LaplaceTrackPayload,
+    "self_reference": SelfReferencePayload,
+    "consciousness": ConsciousnessPayload,
+}
+
+
+def batch_item_payload(name: str, base_params: dict, item_params: dict) -> BaseModel:
+    model = ROUTE_PAYLOADS.get(name, SignalPayload)
+    return model.model_validate({**base_params, **item_params, "signal": []})
+
+
+def unknown_item_params(name: str, item_params: dict) -> list:
+    """Item params that the organ's route payload model does not declare."""
+    fields = ROUTE_PAYLOADS.get(name, SignalPayload).model_fields
+    return sorted(key for key in item_params if key not in fields or key == "signal")
+
+@router.post("/batch")
+async def analyze_batch(
+    request: Request,
+    decoded: DecodedSignal = Depends(batch_input),
+    bypass: bool = Depends(cache_bypass),
+):
+    """
+    Run several organs on one signal. Normalization, moments and rFFTs
+    are computed once in a SignalContext and shared by every organ.
+    Item params are validated through the organ's single-route payload
+    model, so each result is cached under the same key (organ, signal
+    digest, organ parameters) as its single-organ route.
+    """
+    payload = decoded.payload
+
+    unknown = [
+        o.name for o in payload.organs
+        if o.name not in registry or registry.spec(o.name).kind != "signal"
+    ]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown organs: {unknown}")
+
+    unrecognised = {o.name: unknown_item_params(o.name, o.params) for o in payload.organs}
+    unrecognised = {name: keys for name, keys in unrecognised.items() if keys}
+    if unrecognised:
+        raise HTTPException(status_code=422, detail=f"Unknown params: {unrecognised}")
+
+    ctx = SignalContext(decoded.signal, sample_rate=payload.sample_rate)
+    use_cache = result_cache.enabled and current_profile.get() is None
+    digest = await run_in_threadpool(signal_digest, decoded.signal) if use_cache else None
+    base_params = payload.model_dump(exclude={"signal", "organs"})
+
+    async def compute(item):
+        try:
+            params = organ_params(item.name, batch_item_payload(item.name, base_params, item.params))
+        except ValueError as exc:
+            return {"error": str(exc)}
+
+        key = result_cache.make_key(item.name, digest, params)
+        if use_cache and not bypass:
+            hit, result = result_cache.get(key)
+            record_cache(item.name, "HIT" if hit else "MISS")
+            if hit:
+                return result
+
+        try:
+            result = await call_organ(item.name, ctx.signal, context=ctx, **params)
+        except (TypeError, ValueError, np.linalg.LinAlgError) as exc:
+            return {"error": str(exc)}
+        if use_cache:
+            result_cache.store(key, result)
+        return result
+
+    # CPU-bound organs run concurrently in the process pool while the
+    # cheap ones share the context on the threadpool.
+    outputs = await asyncio.gather(*(compute(item) for item in payload.organs))
+    results = {item.name: out for item, out in zip(payload.organs, outputs)}
+
+    return encode_response(request, {
+        "sample_rate": payload.sample_rate,
+        "length": int(ctx.signal.size),
+        "results": results,
+    })
 
 
 # ---------------------------------------------------------
@@ -145,23 +646,216 @@ def analyze_laplace(payload: LaplacePayload):
 # ---------------------------------------------------------
 
 from backend.core.physics_core import PhysicsCore
+from backend.organs.physics.hamiltonians import HAMILTONIANS
+from backend.organs.physics.integrators import INTEGRATORS
+from backend.organs.physics.symplectic_organ import SymplecticOrgan
 
 physics_core = PhysicsCore()
 
 class PhysicsEvolveRequest(BaseModel):
-    x0: float
-    p0: float
+    x0: float | list[float]         # lists are coordinates of vector systems
+    p0: float | list[float]
     H_name: str = "harmonic"
     params: dict | None = None
+    integrator: str | None = None   # leapfrog, forest_ruth, yoshida4, yoshida6
+    dt: float = Field(0.01, allow_inf_nan=False)
+    steps: int = Field(1000, ge=0)
+    record_every: int = Field(1, ge=1)
+    summary_only: bool = False
+    invariants: list[str] | bool | None = None   # {I, H} checks along the trajectory
+    invariant_tol: float | None = None
+
+@router.get("/physics/hamiltonians")
+async def physics_hamiltonians():
+    return {
+        "hamiltonians": [h.metadata() for h in HAMILTONIANS.values()],
+        "integrators": [i.metadata() for i in INTEGRATORS.values()],
+    }
 
 @router.post("/physics/evolve")
-def physics_evolve(req: PhysicsEvolveRequest):
-    return physics_core.evolve(
+async def physics_evolve(req: PhysicsEvolveRequest, request: Request):
+    core = PhysicsCore(dt=req.dt, steps=req.steps)
+    result = await organ_executor.call(
+        core.evolve,
         x0=req.x0,
         p0=req.p0,
         H_name=req.H_name,
         params=req.params,
+        integrator=req.integrator,
+        record_every=req.record_every,
+        summary_only=req.summary_only,
+        invariants=req.invariants,
+        invariant_tol=req.invariant_tol,
     )
+    return encode_response(request, result)
+
+
+class PoissonPayload(BaseModel):
+    mode: str = "ping"              # ping, bracket, brackets, invariants, flow
+    f_grad: dict | None = None      # {"q": ..., "p": ...}, (..., n) arrays for "brackets"
+    g_grad: dict | None = None
+    H_grad: dict | None = None
+    q: list | float | None = None   # phase-space points / trajectory
+    p: list | float | None = None
+    H_name: str = "harmonic"
+    params: dict | None = None
+    observables: list[str] | None = None
+    tol: float | None = None
+    time_axis: bool = True          # "invariants": q/p lead with a time axis
+
+@router.post("/physics/poisson")
+async def physics_poisson(payload: PoissonPayload, request: Request):
+    """
+    Poisson brackets for many function pairs and points in one call,
+    and {I, H} conserved-quantity checks along a trajectory.
+    """
+    data = payload.model_dump(exclude_none=True)
+    needs_points = payload.mode == "invariants" or (payload.mode == "brackets" and "f_grad" not in data)
+    if needs_points and ("q" not in data or "p" not in data):
+        raise HTTPException(status_code=422, detail=f"mode '{payload.mode}' needs q and p")
+    missing = physics_core.poisson.missing_gradients(data)
+    if missing:
+        raise HTTPException(status_code=422, detail=f"mode '{payload.mode}' needs {missing} with q and p")
+    result = await organ_executor.call(physics_core.poisson.analyze, data)
+    return encode_response(request, result)
+
+
+class PhysicsEnsembleRequest(BaseModel):
+    # Members on the leading axes; vector systems add a coordinate axis
+    x0: list[list[float]] | list[float] | float
+    p0: list[list[float]] | list[float] | float
+    H_name: str = "harmonic"
+    params: dict | None = None      # values may be per-member lists
+    dt: float = 0.01
+    steps: int = Field(1000, ge=0)
+    integrator: str = "leapfrog"
+    return_trajectories: bool = False
+    record_every: int = Field(1, ge=1)
+
+@router.post("/physics/ensemble")
+async def physics_ensemble(req: PhysicsEnsembleRequest, request: Request):
+    organ = SymplecticOrgan(dt=req.dt, steps=req.steps, integrator=req.integrator)
+    result = await organ_executor.call(
+        organ.analyze_ensemble,
+        x0=req.x0,
+        p0=req.p0,
+        H_name=req.H_name,
+        params=req.params,
+        return_trajectories=req.return_trajectories,
+        record_every=req.record_every,
+    )
+    return encode_response(request, result)
+
+
+# ---- Checkpointed runs (trajectory store) ----
+
+class PhysicsRunRequest(BaseModel):
+    x0: list[list[float]] | list[float] | float
+    p0: list[list[float]] | list[float] | float
+    H_name: str = "harmonic"
+    params: dict | None = None
+    integrator: str = "leapfrog"
+    dt: float = 0.01
+    steps: int = 1_000_000
+    record_every: int = 1
+    max_steps: int | None = None    # stop (paused) after this many steps
+
+# Runs being integrated by this process: run id -> asyncio task
+_active_runs = {}
+
+
+def _start_run(run_id: str, max_steps=None):
+    task = asyncio.create_task(organ_executor.call(physics_core.run_stored, run_id, max_steps=max_steps))
+    _active_runs[run_id] = task
+
+    def _done(task):
+        _active_runs.pop(run_id, None)
+        if not task.cancelled():
+            task.exception()    # failures are recorded in the run's metadata
+
+    task.add_done_callback(_done)
+
+
+def physics_run(run_id: str) -> dict:
+    try:
+        return trajectory_store.meta(run_id)
+    except RunNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Unknown run '{run_id}'")
+
+
+@router.post("/physics/runs", status_code=202)
+async def create_physics_run(req: PhysicsRunRequest):
+    """
+    Start a long integration that streams its trajectory to disk and
+    checkpoints as it goes; poll GET /physics/runs/{id} for progress.
+    """
+    try:
+        meta = await run_in_threadpool(physics_core.create_run, **req.model_dump(exclude={"max_steps"}))
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    _start_run(meta["id"], req.max_steps)
+    return {**meta, "active": True}
+
+
+@router.post("/physics/runs/{run_id}/resume", status_code=202)
+async def resume_physics_run(run_id: str, max_steps: int | None = None):
+    meta = physics_run(run_id)
+    if run_id in _active_runs:
+        raise HTTPException(status_code=409, detail=f"Run '{run_id}' is already running")
+    if meta["status"] == "complete":
+        return {**meta, "active": False}
+    _start_run(run_id, max_steps)
+    return {**meta, "active": True}
+
+
+@router.get("/physics/runs")
+def list_physics_runs():
+    return {"runs": [{**meta, "active": meta["id"] in _active_runs} for meta in trajectory_store.list()]}
+
+
+@router.get("/physics/runs/{run_id}")
+def get_physics_run(run_id: str):
+    return {**physics_run(run_id), "active": run_id in _active_runs}
+
+
+@router.get("/physics/runs/{run_id}/slice")
+async def slice_physics_run(
+    run_id: str,
+    request: Request,
+    field: str = "x",
+    start: int = 0,
+    stop: int | None = None,
+    step: int = 1,
+):
+    """
+    Rows start:stop:step of one stored field (t, x, p, energy, action),
+    with the matching times.
+    """
+    meta = physics_run(run_id)
+    try:
+        values = await run_in_threadpool(trajectory_store.read, run_id, field, start, stop, step)
+        times = await run_in_threadpool(trajectory_store.read, run_id, "t", start, stop, step)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    return encode_response(request, {
+        "id": run_id,
+        "field": field,
+        "rows": meta["rows"],
+        "start": start,
+        "stop": stop,
+        "step": step,
+        "time": times,
+        "values": values,
+    })
+
+
+@router.delete("/physics/runs/{run_id}")
+def delete_physics_run(run_id: str):
+    physics_run(run_id)
+    if run_id in _active_runs:
+        raise HTTPException(status_code=409, detail=f"Run '{run_id}' is still running")
+    trajectory_store.delete(run_id)
+    return {"deleted": run_id}
 
 
 # ---------------------------------------------------------
@@ -177,15 +871,15 @@ class BloodHoundInput(BaseModel):
 
 
 @router.post("/cyber/bloodhound/red")
-def cyber_bloodhound_red(payload: BloodHoundInput):
-    organ = BloodHoundRedOrgan()
-    return organ.process(payload.model_dump())
+async def cyber_bloodhound_red(payload: BloodHoundInput, request: Request):
+    result = await call_organ("bloodhound_red", payload.model_dump())
+    return encode_response(request, result)
 
 
 @router.post("/cyber/bloodhound/blue")
-def cyber_bloodhound_blue(payload: BloodHoundInput):
-    organ = BloodHoundBlueOrgan()
-    return organ.process(payload.model_dump())
+async def cyber_bloodhound_blue(payload: BloodHoundInput, request: Request):
+    result = await call_organ("bloodhound_blue", payload.model_dump())
+    return encode_response(request, result)
 
 
 # ---- Cyber Origin Organ ----
@@ -196,9 +890,9 @@ class CyberOriginInput(BaseModel):
     xss_sinks: list = []
 
 @router.post("/cyber/origin")
-def cyber_origin(payload: CyberOriginInput):
-    organ = CyberOriginOrgan()
-    return organ.process(payload.model_dump())
+async def cyber_origin(payload: CyberOriginInput, request: Request):
+    result = await call_organ("cyber_origin", payload.model_dump())
+    return encode_response(request, result)
 
 
 # ---- CORS Organ ----
@@ -207,9 +901,9 @@ class CORSInput(BaseModel):
     rules: list
 
 @router.post("/cyber/cors")
-def cyber_cors(payload: CORSInput):
-    organ = CORSOrgan()
-    return organ.process(payload.model_dump())
+async def cyber_cors(payload: CORSInput, request: Request):
+    result = await call_organ("cors", payload.model_dump())
+    return encode_response(request, result)
 
 
 # ---- XSS Organ ----
@@ -218,6 +912,6 @@ class XSSInput(BaseModel):
     sinks: list
 
 @router.post("/cyber/xss")
-def cyber_xss(payload: XSSInput):
-    organ = XSSOrgan()
-    return organ.process(payload.model_dump())
\ No newline at end of file
+async def cyber_xss(payload: XSSInput, request: Request):
+    result = await call_organ("xss", payload.model_dump())
+    return encode_response(request, result)
\ No newline at end of file
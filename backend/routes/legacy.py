@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+import numpy as np
+
+from backend.core.executor import organ_executor
+from backend.core.metrics import observe_organ
+from backend.organs.computation.nand import nand
+from backend.routes.responses import encode_response
+
+
+# ---------------------------------------------------------
+# Native ASGI versions of the legacy Flask routes.
+# Same paths and request/response contract as the blueprints in
+# flask_routes/ and organs/*; the Flask mount in hybrid.py stays as a
+# fallback for anything not served here.
+# ---------------------------------------------------------
+
+router = APIRouter()
+
+
+# ---------------------------------------------------------
+# Power Spectrum (flask_routes/power_spectrum.py)
+# ---------------------------------------------------------
+
+class PowerSpectrumRequest(BaseModel):
+    potentials: list[float]
+    dt: float = 1.0
+    # Optional Welch averaging (default: the original single periodogram)
+    method: str = "periodogram"
+    nperseg: int = 256
+    noverlap: int | None = None
+    window: str = "hann"
+    detrend: str = "constant"
+
+
+@router.post("/power-spectrum")
+async def compute_power_spectrum(req: PowerSpectrumRequest, request: Request):
+    potentials = np.asarray(req.potentials, dtype=float)
+
+    params = {"sample_rate": 1.0 / req.dt}
+    if req.method != "periodogram":
+        params.update(req.model_dump(include={"method", "nperseg", "noverlap", "window", "detrend"}))
+
+    # Same computation as the blueprint, via PowerSpectrumOrgan
+    with observe_organ("power_spectrum", potentials):
+        result = await organ_executor.run("power_spectrum", potentials, **params)
+    if "error" in result:
+        # Same status as the Flask blueprint
+        return JSONResponse(result, status_code=400)
+    return encode_response(request, {
+        "frequencies": result["frequencies"],
+        "power": result["power"],
+    })
+
+
+# ---------------------------------------------------------
+# Eigen (organs/physics/eigen.py)
+# ---------------------------------------------------------
+
+class EigenRequest(BaseModel):
+    matrix: list[list[float]]
+
+
+# Plain def: FastAPI runs it on the threadpool, so a large eig does
+# not block the event loop
+@router.post("/eigen")
+def compute_eigen(req: EigenRequest, request: Request):
+    matrix = np.asarray(req.matrix, dtype=float)
+    vals, vecs = np.linalg.eig(matrix)
+
+    return encode_response(request, {
+        "eigenvalues": vals,
+        "eigenvectors": vecs,
+    })
+
+
+# ---------------------------------------------------------
+# NAND (organs/computation/nand.py)
+# ---------------------------------------------------------
+
+class NandRequest(BaseModel):
+    a: int
+    b: int
+
+
+@router.post("/nand")
+async def compute_nand(req: NandRequest):
+    return {"result": nand(req.a, req.b)}
@@ -0,0 +1,229 @@
+import numpy as np
+from fastapi import HTTPException
+
+
+# ---------------------------------------------------------
+# Server-side result shaping for plotted series
+#
+#   ?fields=frequencies,power,summary.count
+#       keep only the listed (dotted) keys
+#   ?max_points=800[&downsample=lttb|minmax]
+#       reduce every 1-D numeric series longer than max_points.
+#       Series of equal length in the same dict are reduced with one
+#       shared index set so x/y pairs stay aligned; multi-dimensional
+#       arrays in that dict take the same indices along the axis of
+#       that length (spectrogram power follows its times/frequencies).
+#       Scalars are returned exactly.
+#
+# Results are never modified in place (they may be cached).
+# ---------------------------------------------------------
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+# ---------------------------------------------------------
+# Field projection
+# ---------------------------------------------------------
+
+def project(result, fields):
+    """
+    Keep only the dotted `fields` of a (nested) dict result.
+    """
+    if not isinstance(result, dict):
+        return result
+
+    tree = {}
+    for field in fields:
+        node = tree
+        for part in field.split("."):
+            node = node.setdefault(part, {})
+
+    def select(value, node):
+        if not node or not isinstance(value, dict):
+            return value
+        return {key: select(value[key], sub) for key, sub in node.items() if key in value}
+
+    return select(result, tree)
+
+
+# ---------------------------------------------------------
+# Downsampling
+# ---------------------------------------------------------
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: pick n_out indices that preserve the
+    visual shape of y(x). First and last points are always kept.
+    """
+    n = y.size
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1][:max(n_out, 1)])
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < edges.size else n
+
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        xs = x[start:end]
+        ys = y[start:end]
+        area = np.abs((x[a] - avg_x) * (ys - y[a]) - (x[a] - xs) * (avg_y - y[a]))
+
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return idx
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Keep the minimum and maximum of each of n_out // 2 buckets.
+    """
+    n = y.size
+    if n_out >= n:
+        return np.arange(n)
+
+    buckets = max(n_out // 2, 1)
+    edges = np.linspace(0, n, buckets + 1).astype(np.intp)
+    picks = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        segment = y[start:end]
+        picks.append(start + int(np.argmin(segment)))
+        picks.append(start + int(np.argmax(segment)))
+    return np.unique(picks)
+
+
+def _as_series(value):
+    """
+    Return a 1-D real view of a numeric series, or None.
+    """
+    if isinstance(value, list):
+        if not value or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value):
+            return None
+        value = np.asarray(value, dtype=float)
+    if not isinstance(value, np.ndarray) or value.ndim != 1 or value.dtype.kind not in "fiuc":
+        return None
+    return value
+
+
+def _as_grid(value):
+    """
+    Return a numeric array of two or more dimensions, or None.
+    """
+    if isinstance(value, list) and value and isinstance(value[0], list):
+        try:
+            value = np.asarray(value, dtype=float)
+        except (TypeError, ValueError):
+            return None
+    if not isinstance(value, np.ndarray) or value.ndim < 2 or value.dtype.kind not in "fiuc":
+        return None
+    return value
+
+
+def _pick(value, idx):
+    if isinstance(value, list):
+        return [value[i] for i in idx]
+    return value[idx]
+
+
+def downsample(result, max_points: int, method: str = "lttb"):
+    """
+    Reduce long 1-D series in a (nested) dict result to about max_points.
+    """
+    if isinstance(result, list):
+        return [downsample(v, max_points, method) for v in result]
+    if not isinstance(result, dict):
+        return result
+
+    out = {}
+    groups = {}
+    grids = {}
+    for key, value in result.items():
+        series = _as_series(value)
+        grid = _as_grid(value)
+        if series is not None and series.size > max_points:
+            groups.setdefault(series.size, []).append((key, series))
+        elif grid is not None:
+            grids[key], out[key] = grid, value
+        else:
+            out[key] = downsample(value, max_points, method)
+
+    for size, members in groups.items():
+        # Arrays indexed by these series follow them along the matching
+        # axis; with several axes of that length the match is ambiguous,
+        # so the group is returned exactly
+        axes = {key: [axis for axis, n in enumerate(grid.shape) if n == size] for key, grid in grids.items()}
+        if any(len(found) > 1 for found in axes.values()):
+            for key, _ in members:
+                out[key] = result[key]
+            continue
+
+        # x axis: the first monotonic real series (time, frequencies, ...)
+        x_key, x = None, None
+        for key, series in members:
+            if series.dtype.kind != "c" and np.all(np.diff(series) >= 0):
+                x_key, x = key, series
+                break
+        ys = [(key, series) for key, series in members if key != x_key]
+        y = ys[0][1] if ys else x
+        if y.dtype.kind == "c":
+            y = np.abs(y)
+        if x is None:
+            x = np.arange(y.size, dtype=float)
+
+        if method == "minmax":
+            idx = minmax_indices(y.astype(float), max_points)
+        else:
+            idx = lttb_indices(x.astype(float), y.astype(float), max_points)
+
+        for key, _ in members:
+            out[key] = _pick(result[key], idx)
+        for key, found in axes.items():
+            if found:
+                out[key] = np.take(out[key], idx, axis=found[0])
+
+    # keep the original key order
+    return {key: out[key] for key in result}
+
+
+# ---------------------------------------------------------
+# Query parameter entry point
+# ---------------------------------------------------------
+
+def shape_result(result, query_params):
+    """
+    Apply ?fields= and ?max_points= / ?downsample= to an organ result.
+    """
+    fields = query_params.get("fields")
+    if fields:
+        result = project(result, [f.strip() for f in fields.split(",") if f.strip()])
+
+    max_points = query_params.get("max_points")
+    if max_points:
+        try:
+            max_points = int(max_points)
+        except ValueError:
+            raise HTTPException(status_code=422, detail="max_points must be an integer")
+        if max_points < 2:
+            raise HTTPException(status_code=422, detail="max_points must be at least 2")
+
+        method = query_params.get("downsample", "lttb")
+        if method not in DOWNSAMPLE_METHODS:
+            raise HTTPException(
+                status_code=422,
+                detail=f"downsample must be one of {list(DOWNSAMPLE_METHODS)}",
+            )
+        result = downsample(result, max_points, method)
+
+    return result
@@ -0,0 +1,206 @@
+import io
+import json
+
+import numpy as np
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+from backend.routes.projection import shape_result
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional encoding
+    msgpack = None
+
+
+# ---------------------------------------------------------
+# Response encoding for organ results
+#
+# Organs may return NumPy arrays and scalars directly. They are
+# serialized in one pass:
+#   - application/json     (default) orjson when installed, else stdlib json;
+#                          non-finite floats are written as null either way
+#   - application/x-npz    NumPy .npz archive, nested keys joined with "."
+#   - application/msgpack  when msgpack is installed; arrays become
+#                          {"__ndarray__": true, "dtype", "shape", "data"}
+#
+# Complex values are encoded in JSON as {"real": ..., "imag": ...},
+# where real/imag are numbers for scalars and lists for arrays.
+# ---------------------------------------------------------
+
+JSON_TYPE = "application/json"
+NPZ_TYPE = "application/x-npz"
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+def _complex_parts(value):
+    return {"real": np.real(value), "imag": np.imag(value)}
+
+
+def _json_default(obj):
+    """
+    Fallback hook for values the JSON encoder can't handle natively.
+    """
+    if isinstance(obj, np.ndarray):
+        if np.iscomplexobj(obj):
+            return _complex_parts(obj)
+        if orjson is not None and obj.dtype.kind in "fiub" and not obj.flags.c_contiguous:
+            return np.ascontiguousarray(obj)
+        return obj.tolist()
+    if isinstance(obj, (complex, np.complexfloating)):
+        return {"real": float(obj.real), "imag": float(obj.imag)}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite(obj):
+    """
+    Stdlib-json pre-pass: NaN and ±Infinity become None, as orjson
+    writes them (null), so the output is valid JSON either way.
+    """
+    if isinstance(obj, float):
+        return obj if np.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_finite(value) for value in obj]
+    if isinstance(obj, (np.ndarray, np.generic, complex)):
+        return _finite(_json_default(obj))
+    return obj
+
+
+def dumps_json(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        _finite(content), default=_json_default, separators=(",", ":"), allow_nan=False,
+    ).encode("utf-8")
+
+
+class NumpyJSONResponse(JSONResponse):
+    """
+    JSON response that serializes NumPy arrays without .tolist() round trips
+    through jsonable_encoder.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps_json(content)
+
+
+# ---------------------------------------------------------
+# Binary encodings
+# ---------------------------------------------------------
+
+def _flatten(content, prefix=""):
+    """
+    Flatten nested dicts into {"a.b": array}. Values that have no array
+    form (lists of dicts, None, ...) are stored as JSON strings.
+    """
+    flat = {}
+    items = content.items() if isinstance(content, dict) else [("value", content)]
+    for key, value in items:
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, prefix=f"{name}."))
+            continue
+        try:
+            array = np.asarray(value)
+        except (ValueError, TypeError):
+            array = None
+        if array is None or array.dtype == object:
+            array = np.asarray(dumps_json(value).decode("utf-8"))
+        flat[name] = array
+    return flat
+
+
+class NpzResponse(Response):
+    media_type = NPZ_TYPE
+
+    def render(self, content) -> bytes:
+        buffer = io.BytesIO()
+        np.savez(buffer, **_flatten(content))
+        return buffer.getvalue()
+
+
+def _msgpack_default(obj):
+    if isinstance(obj, np.ndarray):
+        array = np.ascontiguousarray(obj)
+        return {
+            "__ndarray__": True,
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "data": array.tobytes(),
+        }
+    if isinstance(obj, (complex, np.complexfloating)):
+        return {"real": float(obj.real), "imag": float(obj.imag)}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+class MsgpackResponse(Response):
+    media_type = MSGPACK_TYPES[0]
+
+    def render(self, content) -> bytes:
+        return msgpack.packb(content, default=_msgpack_default, use_bin_type=True)
+
+
+# ---------------------------------------------------------
+# Content negotiation
+# ---------------------------------------------------------
+
+def _accepted(request: Request):
+    """
+    Media types from the Accept header, highest quality first.
+    """
+    ranked = []
+    for position, part in enumerate(request.headers.get("accept", "").split(",")):
+        fields = part.strip().split(";")
+        media = fields[0].strip().lower()
+        if not media:
+            continue
+        quality = 1.0
+        for param in fields[1:]:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        ranked.append((-quality, position, media))
+    return [media for _, _, media in sorted(ranked)]
+
+
+def response_class_for(request: Request):
+    for media in _accepted(request):
+        if media == NPZ_TYPE:
+            return NpzResponse
+        if media in MSGPACK_TYPES and msgpack is not None:
+            return MsgpackResponse
+        if media in (JSON_TYPE, "application/*", "*/*"):
+            return NumpyJSONResponse
+    return NumpyJSONResponse
+
+
+def encode_response(request: Request, content, status_code: int = 200, headers: dict = None) -> Response:
+    """
+    Serialize an organ result in the encoding the client asked for,
+    after applying any ?fields= / ?max_points= shaping.
+    """
+    content = shape_result(content, request.query_params)
+    cls = response_class_for(request)
+    return cls(content=content, status_code=status_code, headers=headers)
@@ -0,0 +1,257 @@
+import io
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Type
+
+import numpy as np
+from fastapi import HTTPException, Request
+from pydantic import BaseModel, ValidationError
+
+
+# ---------------------------------------------------------
+# Signal ingestion for organ routes
+#
+# Organ routes accept three body encodings:
+#   - application/json          {"signal": [...], "sample_rate": ..., ...}
+#   - application/octet-stream  raw little-endian float32/float64 samples
+#   - application/x-npy         a .npy file (any numeric dtype, C order)
+#
+# For the binary encodings the remaining payload fields (sample_rate,
+# method, order, ...) come from query parameters or X-Signal-* headers,
+# and the samples are wrapped with np.frombuffer, so no copy is made.
+#
+# Routes built with max_ndim=2 also take (channels, samples) input: a
+# nested JSON list, a 2-D .npy, or a raw buffer with a `channels` field.
+#
+# Streaming routes (signal_stream) take raw bodies only and hand the
+# samples to the organ chunk by chunk as they arrive. Routes that also
+# stream their response must drain the chunks before returning it: a
+# StreamingResponse competes with the body for the receive channel.
+# ---------------------------------------------------------
+
+JSON_TYPES = ("application/json", "")
+RAW_TYPES = ("application/octet-stream",)
+NPY_TYPES = ("application/x-npy", "application/npy")
+
+STREAM_CHUNK_BYTES = 1 << 20
+
+RAW_DTYPES = {
+    "float32": np.dtype("<f4"),
+    "f4": np.dtype("<f4"),
+    "float64": np.dtype("<f8"),
+    "f8": np.dtype("<f8"),
+}
+
+
+@dataclass
+class DecodedSignal:
+    """
+    A decoded organ request: the samples as a NumPy array plus the
+    validated payload model (whose `signal` field is left empty for
+    binary bodies).
+    """
+    signal: np.ndarray
+    payload: BaseModel
+
+
+@dataclass
+class StreamedSignal:
+    """
+    A streaming organ request: an async iterator of sample chunks read
+    from the body as it arrives, plus the validated payload model.
+    """
+    chunks: AsyncIterator[np.ndarray]
+    payload: BaseModel
+
+
+def _content_type(request: Request) -> str:
+    return request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+
+def _binary_params(request: Request) -> dict:
+    """
+    Collect payload fields for binary bodies.
+    Query parameters win over X-Signal-* headers.
+    """
+    params = {}
+    for key, value in request.headers.items():
+        if key.startswith("x-signal-"):
+            params[key[len("x-signal-"):].replace("-", "_")] = value
+    params.update(request.query_params)
+    return params
+
+
+def _raw_dtype(dtype: str) -> np.dtype:
+    if dtype not in RAW_DTYPES:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported dtype '{dtype}', expected one of {sorted(RAW_DTYPES)}",
+        )
+    return RAW_DTYPES[dtype]
+
+
+def decode_raw(body: bytes, dtype: str = "float64") -> np.ndarray:
+    """
+    Wrap a raw little-endian float buffer without copying.
+    """
+    dt = _raw_dtype(dtype)
+    if len(body) % dt.itemsize:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Body length {len(body)} is not a multiple of {dt.itemsize} bytes ({dtype})",
+        )
+    return np.frombuffer(body, dtype=dt)
+
+
+def decode_npy(body: bytes) -> np.ndarray:
+    """
+    Parse a .npy header and wrap the data section without copying.
+    """
+    fmt = np.lib.format
+    stream = io.BytesIO(body)
+    try:
+        version = fmt.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = fmt.read_array_header_1_0(stream)
+        else:
+            shape, fortran_order, dtype = fmt.read_array_header_2_0(stream)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid .npy body: {exc}")
+
+    if dtype.hasobject or dtype.kind not in "fiu":
+        raise HTTPException(status_code=415, detail=f"Unsupported .npy dtype '{dtype}'")
+
+    count = int(np.prod(shape)) if shape else 1
+    offset = stream.tell()
+    if len(body) - offset < count * dtype.itemsize:
+        raise HTTPException(status_code=400, detail="Truncated .npy body")
+
+    data = np.frombuffer(body, dtype=dtype, count=count, offset=offset)
+    return data.reshape(shape, order="F" if fortran_order else "C")
+
+
+def _validate(model: Type[BaseModel], data: Any, json: bool = False) -> BaseModel:
+    try:
+        if json:
+            return model.model_validate_json(data)
+        return model.model_validate(data)
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.errors())
+
+
+def _check_ndim(signal: np.ndarray, max_ndim: int):
+    if not 1 <= signal.ndim <= max_ndim:
+        if max_ndim == 1:
+            raise HTTPException(status_code=422, detail="Signal must be one-dimensional")
+        raise HTTPException(status_code=422, detail=f"Signal must have 1 to {max_ndim} dimensions")
+
+
+def _reshape_channels(signal: np.ndarray, channels) -> np.ndarray:
+    try:
+        channels = int(channels)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Invalid channels '{channels}'")
+    if channels < 1 or signal.size % channels:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{signal.size} samples do not split into {channels} channels",
+        )
+    return signal.reshape(channels, -1)
+
+
+def signal_body(model: Type[BaseModel], max_ndim: int = 1) -> Callable:
+    """
+    Build a FastAPI dependency that decodes a request body into a
+    DecodedSignal, validating the non-signal fields against `model`.
+    With max_ndim=2 the signal may be (channels, samples).
+    """
+
+    async def dependency(request: Request) -> DecodedSignal:
+        content_type = _content_type(request)
+        body = await request.body()
+
+        if content_type in JSON_TYPES:
+            payload = _validate(model, body, json=True)
+            try:
+                signal = np.asarray(payload.signal, dtype=float)
+            except ValueError:
+                raise HTTPException(status_code=422, detail="All channels must have the same length")
+            _check_ndim(signal, max_ndim)
+            return DecodedSignal(signal=signal, payload=payload)
+
+        params = _binary_params(request)
+        if content_type in RAW_TYPES:
+            signal = decode_raw(body, params.pop("dtype", "float64"))
+            channels = params.pop("channels", None)
+            if channels is not None and max_ndim > 1:
+                signal = _reshape_channels(signal, channels)
+        elif content_type in NPY_TYPES:
+            params.pop("dtype", None)
+            signal = decode_npy(body)
+        else:
+            raise HTTPException(status_code=415, detail=f"Unsupported content type '{content_type}'")
+
+        _check_ndim(signal, max_ndim)
+
+        payload = _validate(model, {**params, "signal": []})
+        return DecodedSignal(signal=signal, payload=payload)
+
+    return dependency
+
+
+async def iter_raw_chunks(request: Request, dtype: str = "float64", min_bytes: int = STREAM_CHUNK_BYTES):
+    """
+    Decode a raw float body as it streams in. Network reads are
+    coalesced to at least `min_bytes` per chunk, and a sample split
+    across reads is carried over to the next one.
+    """
+    dt = _raw_dtype(dtype)
+    pending = []
+    pending_bytes = 0
+
+    async for block in request.stream():
+        if not block:
+            continue
+        pending.append(block)
+        pending_bytes += len(block)
+        if pending_bytes < min_bytes:
+            continue
+
+        data = b"".join(pending)
+        usable = len(data) - len(data) % dt.itemsize
+        yield np.frombuffer(data, dtype=dt, count=usable // dt.itemsize)
+        pending = [data[usable:]] if usable < len(data) else []
+        pending_bytes = len(data) - usable
+
+    data = b"".join(pending)
+    if len(data) % dt.itemsize:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Body length is not a multiple of {dt.itemsize} bytes ({dtype})",
+        )
+    if data:
+        yield np.frombuffer(data, dtype=dt)
+
+
+def signal_stream(model: Type[BaseModel]) -> Callable:
+    """
+    Build a FastAPI dependency for streaming routes: the body must be a
+    raw float buffer, and `model` (without a signal field) is validated
+    from query parameters and X-Signal-* headers.
+    """
+
+    async def dependency(request: Request) -> StreamedSignal:
+        content_type = _content_type(request)
+        if content_type not in RAW_TYPES:
+            raise HTTPException(
+                status_code=415,
+                detail="Streaming routes take application/octet-stream bodies",
+            )
+
+        params = _binary_params(request)
+        dtype = params.pop("dtype", "float64")
+        _raw_dtype(dtype)
+
+        payload = _validate(model, params)
+        return StreamedSignal(chunks=iter_raw_chunks(request, dtype), payload=payload)
+
+    return dependency